@@ -0,0 +1,181 @@
+"""Synthetic payloads and a recorded fixture store for the benchmarks. Nothing here touches the network."""
+
+import json
+import pathlib
+import sys
+from datetime import date, timedelta
+from typing import Dict, List
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from pyventim import Eventim
+from pyventim.replay import FixtureStore, install_replay
+
+# The seatmap factory is shared with the tests
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+from tests.conftest import create_seatmap_data  # noqa: E402,F401
+
+# Seats per seatmap size: blocks * rows * seats
+SEATMAP_SIZES: Dict[str, Dict[str, int]] = {
+    # 1.000 seats, a theater
+    "small": dict(blocks=4, rows=10, seats=25, price_categories=4, empty_rows=0),
+    # 10.000 seats, an arena
+    "medium": dict(blocks=20, rows=20, seats=25, price_categories=4, empty_rows=0),
+    # 60.000 seats
+    "stadium": dict(blocks=80, rows=30, seats=25, price_categories=4, empty_rows=0),
+}
+
+EXPLORATION_PAGES = 20
+EXPLORATION_PAGE_SIZE = 50
+COMPONENT_PAGE_SIZE = 9
+COMPONENT_EVENTS = 90
+FIRST_DAY = date(2024, 1, 1)
+PRODUCT_GROUP_ID = 473431
+
+
+def create_events(count: int) -> List[Dict]:
+    """Builds ld+json events like the ones embedded in component pages."""
+    return [
+        {
+            "@context": "http://schema.org",
+            "@type": "MusicEvent",
+            "name": "Disneys DER KÖNIG DER LÖWEN",
+            "startDate": f"{(FIRST_DAY + timedelta(days=x)).isoformat()}T19:30:00+02:00",
+            "url": f"https://www.eventim.de/event/musical-{20000000 + x}/",
+            "location": {"@type": "Place", "name": "Stage Theater im Hafen Hamburg"},
+            "offers": {
+                "@type": "AggregateOffer",
+                "lowPrice": 59.9,
+                "priceCurrency": "EUR",
+            },
+        }
+        for x in range(count)
+    ]
+
+
+def create_component_html(events: List[Dict], page: int, total_pages: int) -> str:
+    """Builds a component page with a listing, the calendar widget and the pagination."""
+    scripts = "".join(
+        f'<script type="application/ld+json">{json.dumps(x)}</script>\n' for x in events
+    )
+    calendar = json.dumps(
+        {
+            "calendar_content": {
+                "result": [
+                    {"id": index, "date": x["startDate"], "title": x["name"]}
+                    for index, x in enumerate(events)
+                ]
+            }
+        }
+    )
+    return (
+        "<!DOCTYPE html><html><head>"
+        '<script type="text/javascript">window.dataLayer = [];</script>'
+        f"</head><body><div class='event-listing'>{scripts}</div>"
+        f'<script type="application/configuration">{calendar}</script>'
+        f'<ul><li class="pagination-pages-small">{page} von {total_pages}</li></ul>'
+        "</body></html>"
+    )
+
+
+def create_event_html() -> str:
+    """Builds an event page with seatmap options."""
+    configuration = json.dumps(
+        {
+            "seatmapOptions": {
+                "cType": "web",
+                "cId": 1,
+                "evId": 18500464,
+                "additionalRequestParams": "&a_systemId=1&a_promotionId=0&a_sessionId=EVE_NO_SESSION"
+                "&timestamp=28611964&expiryTime=28611974&chash=L_itK5sj-4&signature=abc",
+            }
+        }
+    )
+    return (
+        "<!DOCTYPE html><html><head>"
+        '<script type="text/javascript">window.dataLayer = [];</script>'
+        f'</head><body><script type="application/configuration">{configuration}</script>'
+        "</body></html>"
+    )
+
+
+class SyntheticTransport(requests.adapters.BaseAdapter):
+    """Answers exploration and component requests with synthetic pages while recording the store."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.events = create_events(COMPONENT_EVENTS)
+
+    def send(self, request, **kwargs):  # pylint: disable=arguments-differ
+        url = urlparse(request.url)
+        query = parse_qs(url.query)
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = request.url
+        response.request = request
+
+        if url.path.endswith("component"):
+            page = int(query["pnum"][0])
+            total_pages = -(-len(self.events) // COMPONENT_PAGE_SIZE)
+            start, end = (page - 1) * COMPONENT_PAGE_SIZE, page * COMPONENT_PAGE_SIZE
+            events = self.events[start:end]
+            response.headers["content-type"] = "text/html; charset=utf-8"
+            response._content = create_component_html(  # pylint: disable=W0212
+                events, page, total_pages
+            ).encode("utf-8")
+            return response
+
+        page = int(query["page"][0])
+        links = {"self": {"href": ""}}
+        if page < EXPLORATION_PAGES:
+            links["next"] = {"href": ""}
+
+        response.headers["content-type"] = "application/json"
+        response._content = json.dumps(  # pylint: disable=W0212
+            {
+                "productGroups": [
+                    {
+                        "productGroupId": f"{page}-{x}",
+                        "name": f"Product group {page}-{x}",
+                        "startDate": "2024-06-01T19:30:00+02:00",
+                        "products": [
+                            {"productId": f"{page}-{x}-{y}"} for y in range(5)
+                        ],
+                    }
+                    for x in range(EXPLORATION_PAGE_SIZE)
+                ],
+                "totalPages": EXPLORATION_PAGES,
+                "totalResults": EXPLORATION_PAGES * EXPLORATION_PAGE_SIZE,
+                "_links": links,
+            }
+        ).encode("utf-8")
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def build_store(path: str) -> FixtureStore:
+    """Records the synthetic exploration and component pages into a fixture store.
+
+    Args:
+        path (str): Directory of the store.
+
+    Returns:
+        FixtureStore: Store serving every request of the pagination benchmarks.
+    """
+    store = FixtureStore(path)
+    eventim = Eventim()
+    install_replay(eventim, store, mode="record")
+    eventim.rest_adapter.session.get_adapter("https://").inner = SyntheticTransport()
+
+    for _ in eventim.explore_product_groups(city_ids=[7]):
+        pass
+    for _ in eventim.get_product_group_events(PRODUCT_GROUP_ID):
+        pass
+    for _ in eventim.get_product_group_events_from_calendar(PRODUCT_GROUP_ID):
+        pass
+
+    return store
@@ -0,0 +1,465 @@
+"""Runs the pyventim benchmarks against synthetic payloads and a local stand-in server.
+
+Every benchmark runs in its own process so the peak RSS belongs to it alone.
+
+Usage:
+    python benchmarks/run.py                          # Run all benchmarks
+    python benchmarks/run.py -k seatmap               # Run benchmarks whose name contains "seatmap"
+    python benchmarks/run.py --save baseline.json     # Store the results as baseline
+    python benchmarks/run.py --compare baseline.json  # Compare against a baseline, exit 1 on regressions
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import argparse
+import contextlib
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from functools import partial
+from datetime import date, time as dt_time
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Callable, Dict, List
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on windows
+    resource = None
+
+import fixtures
+
+from pyventim import Eventim, jsonlib, utils
+from pyventim.models import ComponentParameters, ExplorationParameters
+from pyventim.replay import StandInServer
+
+MIN_ROUNDS = 5
+MIN_TIME = 0.5  # Seconds per benchmark
+
+Setup = Callable[[contextlib.ExitStack], Callable[[], Any]]
+BENCHMARKS: Dict[str, Setup] = {}
+
+
+def benchmark(name: str) -> Callable[[Setup], Setup]:
+    """Registers a setup function. It returns the function to measure and registers its cleanup on the stack."""
+
+    def register(setup: Setup) -> Setup:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+@benchmark("parse_list_from_component_html")
+def _parse_list(_stack):
+    html = fixtures.create_component_html(fixtures.create_events(90), 1, 1)
+    return lambda: utils.parse_list_from_component_html(html)
+
+
+@benchmark("parse_list_from_component_html[bytes]")
+def _parse_list_bytes(_stack):
+    html = fixtures.create_component_html(fixtures.create_events(90), 1, 1).encode()
+    return lambda: utils.parse_list_from_component_html(html)
+
+
+@benchmark("parse_calendar_from_component_html")
+def _parse_calendar(_stack):
+    html = fixtures.create_component_html(fixtures.create_events(90), 1, 1)
+    return lambda: utils.parse_calendar_from_component_html(html)
+
+
+@benchmark("parse_seatmap_configuration_from_event_html")
+def _parse_seatmap_configuration(_stack):
+    html = fixtures.create_event_html()
+    return lambda: utils.parse_seatmap_configuration_from_event_html(html)
+
+
+def _register_seatmap_benchmarks() -> None:
+    for size, shape in fixtures.SEATMAP_SIZES.items():
+
+        def parse_dict(_stack, shape=shape):
+            data = fixtures.create_seatmap_data(**shape)
+            return lambda: utils.parse_seathamp_data_from_api(data)
+
+        def parse_columnar(_stack, shape=shape):
+            from pyventim.seatmap import parse_columnar_seatmap_from_api
+
+            data = fixtures.create_seatmap_data(**shape)
+            return lambda: parse_columnar_seatmap_from_api(data)
+
+        def decode(_stack, shape=shape):
+            data = json.dumps(fixtures.create_seatmap_data(**shape)).encode()
+            return lambda: jsonlib.loads(data)
+
+        def decode_columnar(_stack, shape=shape):
+            from pyventim.seatmap import decode_seatmap, parse_columnar_seatmap_from_api
+
+            data = json.dumps(fixtures.create_seatmap_data(**shape)).encode()
+            return lambda: parse_columnar_seatmap_from_api(decode_seatmap(data))
+
+        def index_queries(_stack, shape=shape):
+            from pyventim.seatmap import SeatmapIndex, parse_columnar_seatmap_from_api
+
+            seatmap = parse_columnar_seatmap_from_api(
+                fixtures.create_seatmap_data(**shape)
+            )
+
+            def run():
+                # Build the index and answer the alerting queries of one seatmap
+                index = SeatmapIndex(seatmap)
+                index.find_adjacent_seats(4, price_category=1)
+                index.find_best_seats(0, count=2, focus=(0, 0))
+                index.find_seats_in_box(0, 0, 1600, 600)
+
+            return run
+
+        BENCHMARKS[f"parse_seathamp_data_from_api[{size}]"] = parse_dict
+        BENCHMARKS[f"parse_columnar_seatmap_from_api[{size}]"] = parse_columnar
+        BENCHMARKS[f"jsonlib.loads[{size}]"] = decode
+        BENCHMARKS[f"decode_seatmap+columnar[{size}]"] = decode_columnar
+        BENCHMARKS[f"SeatmapIndex+queries[{size}]"] = index_queries
+
+
+_register_seatmap_benchmarks()
+
+
+def _create_exploration_parameters() -> ExplorationParameters:
+    return ExplorationParameters(
+        search_term="Stage Theater im Hafen Hamburg",
+        categories=["Musical & Show|Musical"],
+        city_ids=[7],
+        date_from=date(2024, 1, 1),
+        date_to=date(2024, 12, 31),
+        time_from=dt_time(18, 0),
+        time_to=dt_time(23, 0),
+    )
+
+
+def _create_component_parameters() -> ComponentParameters:
+    return ComponentParameters(
+        esid=fixtures.PRODUCT_GROUP_ID,
+        startdate=date(2024, 1, 1),
+        enddate=date(2024, 12, 31),
+        ptype="tickets",
+    )
+
+
+@benchmark("ExplorationParameters.model_dump")
+def _dump_exploration_parameters(_stack):
+    params = _create_exploration_parameters()
+    return lambda: params.model_dump(exclude_none=True)
+
+
+@benchmark("ExplorationParameters.compile_query().page")
+def _page_exploration_parameters(_stack):
+    query = _create_exploration_parameters().compile_query()
+    return lambda: query.page(2)
+
+
+@benchmark("ComponentParameters.model_dump")
+def _dump_component_parameters(_stack):
+    params = _create_component_parameters()
+    return lambda: params.model_dump(exclude_none=True)
+
+
+@benchmark("ComponentParameters.compile_query().page")
+def _page_component_parameters(_stack):
+    query = _create_component_parameters().compile_query()
+    return lambda: query.page(2)
+
+
+@benchmark("EntityStore.add_product_group_events[10000]")
+def _store_events(stack):
+    from pyventim.store import EntityStore
+
+    path = stack.enter_context(tempfile.TemporaryDirectory())
+    store = stack.enter_context(EntityStore(f"{path}/entities.db"))
+    events = fixtures.create_events(10000)
+    return lambda: store.add_product_group_events(events, fixtures.PRODUCT_GROUP_ID)
+
+
+# Measured in a fresh interpreter, so the timings include its startup
+IMPORT_BENCHMARKS: Dict[str, str] = {
+    "import[pyventim]": "import pyventim",
+    "import[pyventim.Eventim]": "from pyventim import Eventim",
+    "import[pyventim.seatmap]": "import pyventim.seatmap",
+}
+
+# Runs an import statement and prints the memory of the interpreter as json
+IMPORT_PROBE = """\
+import json, sys, tracemalloc
+if {trace}:
+    tracemalloc.start()
+{statement}
+alloc_peak = tracemalloc.get_traced_memory()[1]
+peak_rss = None
+try:
+    # ru_maxrss survives exec on linux and would include the parent, VmHWM starts fresh
+    with open("/proc/self/status", encoding="ascii") as file:
+        peak_rss = next(int(x.split()[1]) for x in file if x.startswith("VmHWM:"))
+except (OSError, StopIteration):
+    try:
+        import resource
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        peak_rss = peak_rss // 1024 if sys.platform == "darwin" else peak_rss
+    except ImportError:
+        pass
+print(json.dumps(dict(alloc_peak=alloc_peak, peak_rss=peak_rss)))
+"""
+
+
+def _start_server(stack: contextlib.ExitStack) -> Eventim:
+    path = stack.enter_context(tempfile.TemporaryDirectory())
+    server = stack.enter_context(StandInServer(fixtures.build_store(path)))
+    return Eventim(**server.hostnames)
+
+
+@benchmark("explore_product_groups[stand-in]")
+def _explore_product_groups(stack):
+    eventim = _start_server(stack)
+    return lambda: list(eventim.explore_product_groups(city_ids=[7]))
+
+
+@benchmark("explore_product_groups[stand-in,prefetch=4]")
+def _explore_product_groups_prefetch(stack):
+    eventim = _start_server(stack)
+    return lambda: list(eventim.explore_product_groups(city_ids=[7], prefetch=4))
+
+
+@benchmark("get_product_group_events[stand-in]")
+def _get_product_group_events(stack):
+    eventim = _start_server(stack)
+    return lambda: list(eventim.get_product_group_events(fixtures.PRODUCT_GROUP_ID))
+
+
+@benchmark("get_product_group_events_from_calendar[stand-in]")
+def _get_product_group_events_from_calendar(stack):
+    eventim = _start_server(stack)
+    return lambda: list(
+        eventim.get_product_group_events_from_calendar(fixtures.PRODUCT_GROUP_ID)
+    )
+
+
+def get_peak_rss() -> int | None:
+    """Returns the peak resident set size of the process in KiB."""
+    try:
+        # ru_maxrss survives exec on linux and would include the parent, VmHWM starts fresh
+        with open("/proc/self/status", encoding="ascii") as file:
+            return next(int(x.split()[1]) for x in file if x.startswith("VmHWM:"))
+    except (OSError, StopIteration):
+        pass
+
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, linux KiB
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def get_timings(function: Callable[[], Any]) -> List[float]:
+    """Calls the function at least MIN_ROUNDS times and for MIN_TIME seconds and returns the timings."""
+    timings = []
+    started = time.perf_counter()
+    while len(timings) < MIN_ROUNDS or time.perf_counter() - started < MIN_TIME:
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+
+    return timings
+
+
+def measure_import(statement: str) -> Dict[str, Any]:
+    """Runs an import statement in fresh interpreters. The memory is measured by the interpreter itself.
+
+    Args:
+        statement (str): Import statement
+
+    Returns:
+        Dict[str, Any]: Timings in seconds, allocated bytes and peak RSS in KiB of the interpreter.
+    """
+
+    def run(trace: bool) -> Dict[str, Any]:
+        process = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                IMPORT_PROBE.format(trace=trace, statement=statement),
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return json.loads(process.stdout)
+
+    # Allocations are traced in a separate run, tracing slows the import down and grows the RSS
+    alloc_peak = run(trace=True)["alloc_peak"]
+    memory = run(trace=False)
+    timings = get_timings(partial(run, trace=False))
+
+    return dict(
+        rounds=len(timings),
+        min=min(timings),
+        median=statistics.median(timings),
+        alloc_peak=alloc_peak,
+        peak_rss=memory["peak_rss"],
+    )
+
+
+def measure(name: str) -> Dict[str, Any]:
+    """Runs one benchmark in the current process. Import benchmarks start their own interpreters.
+
+    Args:
+        name (str): Name of the benchmark
+
+    Returns:
+        Dict[str, Any]: Timings in seconds, allocated bytes and peak RSS in KiB.
+    """
+    if name in IMPORT_BENCHMARKS:
+        return measure_import(IMPORT_BENCHMARKS[name])
+
+    with contextlib.ExitStack() as stack:
+        function = BENCHMARKS[name](stack)
+        function()  # Warm up
+
+        tracemalloc.start()
+        function()
+        _, alloc_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        timings = get_timings(function)
+
+    return dict(
+        rounds=len(timings),
+        min=min(timings),
+        median=statistics.median(timings),
+        alloc_peak=alloc_peak,
+        peak_rss=get_peak_rss(),
+    )
+
+
+def run_isolated(name: str) -> Dict[str, Any]:
+    """Runs one benchmark in a child process."""
+    process = subprocess.run(
+        [sys.executable, __file__, "--child", name],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if process.returncode != 0:
+        return dict(error=process.stderr.strip().splitlines()[-1])
+
+    return json.loads(process.stdout)
+
+
+def get_environment() -> Dict[str, str]:
+    """Describes the environment the results were measured in."""
+    try:
+        pyventim_version = version("pyventim")
+    except PackageNotFoundError:
+        pyventim_version = "unknown"
+
+    return dict(
+        pyventim=pyventim_version,
+        python=platform.python_version(),
+        json_backend=jsonlib.get_backend(),
+        platform=platform.platform(),
+    )
+
+
+def compare(
+    results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float
+) -> List[str]:
+    """Returns the benchmarks that are slower or allocate more than the baseline plus threshold."""
+    regressions = []
+    for name, result in results.items():
+        old = baseline.get(name)
+        if old is None or "error" in result or "error" in old:
+            continue
+
+        for metric in ("median", "alloc_peak"):
+            if old[metric] and result[metric] > old[metric] * (1 + threshold):
+                regressions.append(
+                    f"{name}: {metric} {old[metric]:.6g} -> {result[metric]:.6g}"
+                )
+
+    return regressions
+
+
+def format_row(name: str, result: Dict, old: Dict | None) -> str:
+    """Formats one line of the result table."""
+    if "error" in result:
+        return f"{name:<52} error: {result['error']}"
+
+    line = (
+        f"{name:<52} {result['median'] * 1000:>10.3f} ms {result['alloc_peak'] / 1024:>10.1f} KiB"
+        f" {result['peak_rss'] or 0:>10} KiB"
+    )
+    if old is not None and "error" not in old:
+        line += f" {result['median'] / old['median']:>7.2f}x"
+
+    return line
+
+
+def main() -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-k", "--filter", help="Only run benchmarks containing this text"
+    )
+    parser.add_argument("--save", help="Write the results to a baseline file")
+    parser.add_argument("--compare", help="Compare the results to a baseline file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Allowed relative slowdown before a regression is reported",
+    )
+    parser.add_argument(
+        "--no-isolate", action="store_true", help="Run all benchmarks in this process"
+    )
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.child)))
+        return 0
+
+    names = [
+        x
+        for x in [*BENCHMARKS, *IMPORT_BENCHMARKS]
+        if not args.filter or args.filter in x
+    ]
+    baseline = {}
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+
+    print(f"{'benchmark':<52} {'median':>13} {'alloc peak':>14} {'peak rss':>14}")
+    results = {}
+    for name in names:
+        results[name] = measure(name) if args.no_isolate else run_isolated(name)
+        print(format_row(name, results[name], baseline.get(name)), flush=True)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump(
+                dict(environment=get_environment(), results=results), file, indent=2
+            )
+
+    if args.compare:
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,10 +4,78 @@
 .. include:: ../../docs/exploration_endpoint.md
 .. include:: ../../docs/component_endpoint.md
 .. include:: ../../docs/seatmap_endpoint.md
+.. include:: ../../docs/polling.md
+.. include:: ../../docs/async_client.md
+.. include:: ../../docs/caching.md
+.. include:: ../../docs/retries.md
+.. include:: ../../docs/transport.md
+.. include:: ../../docs/json_backend.md
+.. include:: ../../docs/replay.md
+.. include:: ../../docs/metrics.md
+.. include:: ../../docs/sync.md
+.. include:: ../../docs/export.md
+.. include:: ../../docs/store.md
 """
 
-from .eventim import Eventim
+# Submodules and the clients are imported on first access (PEP 562) to keep `import pyventim` fast.
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
-from . import models
-from . import exceptions
-from . import utils
+if TYPE_CHECKING:  # pragma: no cover
+    from .eventim import Eventim, AsyncEventim  # noqa: F401
+    from . import (  # noqa: F401
+        eventim,
+        adapters,
+        models,
+        cache,
+        retry,
+        jsonlib,
+        metrics,
+        seatmap,
+        polling,
+        records,
+        replay,
+        sync,
+        store,
+        export,
+        exceptions,
+        utils,
+    )
+
+_CLIENTS = ("Eventim", "AsyncEventim")
+_SUBMODULES = (
+    "eventim",
+    "adapters",
+    "models",
+    "cache",
+    "retry",
+    "jsonlib",
+    "metrics",
+    "seatmap",
+    "polling",
+    "records",
+    "replay",
+    "sync",
+    "store",
+    "export",
+    "exceptions",
+    "utils",
+)
+
+__all__ = [*_CLIENTS, *_SUBMODULES]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _CLIENTS:
+        value = getattr(importlib.import_module(".eventim", __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
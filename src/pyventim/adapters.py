@@ -1,12 +1,302 @@
 """Custom adapters to handle traffic from Eventim"""
 
-from json import JSONDecodeError
-from typing import Dict, Any
+from functools import partial
+from typing import Dict, Any, Tuple, Callable
+import asyncio
 import logging
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 
+from . import jsonlib
+from . import metrics
+from .cache import ResponseCache
 from .exceptions import RestException, HtmlException
-from .models import RestResult, HtmlResult
+from .models import RestResult, HtmlResult, TransportConfig
+from .retry import RetryPolicy, RateLimiter
+
+# httpx is imported by the async adapters on first use to keep `import pyventim` fast
+httpx = None  # pylint: disable=invalid-name
+
+
+def _get_cache_key(
+    cache: ResponseCache | None,
+    method: str,
+    hostname: str,
+    endpoint: str,
+    params: Dict | None,
+) -> Tuple[str | None, float]:
+    """Returns the cache key and ttl of a request or None if the request is not cached."""
+    if cache is None or method != "GET":
+        return None, 0
+
+    ttl = cache.get_ttl(endpoint)
+    if ttl <= 0:
+        return None, 0
+
+    return cache.make_key(method, hostname, endpoint, params), ttl
+
+
+def _load_html_result(cached: bytes, raw: bool) -> HtmlResult:
+    """Restores a cached HtmlResult. JSON has no bytes, so raw bodies are encoded again."""
+    result = HtmlResult.model_validate_json(cached)
+    if raw and isinstance(result.html_data, str):
+        result.html_data = result.html_data.encode("utf-8")
+
+    return result
+
+
+def _emit_request(
+    adapter: str,
+    method: str,
+    hostname: str,
+    endpoint: str,
+    params: Dict | None,
+    started: float,
+    **fields,
+) -> None:
+    """Emits a RequestEvent measured since started."""
+    metrics.emit(
+        metrics.RequestEvent(
+            adapter=adapter,
+            method=method,
+            hostname=hostname,
+            endpoint=endpoint,
+            params_fingerprint=metrics.get_params_fingerprint(params),
+            total=time.perf_counter() - started,
+            **fields,
+        )
+    )
+
+
+def _get_response_fields(response: requests.Response) -> Dict[str, Any]:
+    """Returns the RequestEvent fields of a requests response."""
+    return dict(
+        status_code=response.status_code,
+        size=len(response.content),
+        ttfb=response.elapsed.total_seconds(),
+    )
+
+
+class _Call:
+    """Cache lookup, instrumentation and result mapping of one adapter request.
+    The sync and async adapters share it and only differ in the transport I/O.
+    """
+
+    def __init__(
+        self,
+        adapter: Any,
+        method: str,
+        endpoint: str,
+        params: Dict | None,
+        cache: ResponseCache | None,
+    ) -> None:
+        self.adapter: str = type(adapter).__name__
+        self.hostname: str = adapter.hostname
+        self.method: str = method
+        self.endpoint: str = endpoint
+        self.params: Dict | None = params
+        self.instrumented: bool = metrics.has_listeners()
+        self.started: float = time.perf_counter()
+        self.cache: ResponseCache | None = cache
+        self.cache_key, self.ttl = _get_cache_key(
+            cache, method, self.hostname, endpoint, params
+        )
+        # RequestEvent fields of the response, set once it is received
+        self.fields: Dict[str, Any] = {}
+
+    def emit(self, **fields) -> None:
+        """Emits a RequestEvent with the response fields if anyone listens."""
+        if self.instrumented:
+            _emit_request(
+                self.adapter,
+                self.method,
+                self.hostname,
+                self.endpoint,
+                self.params,
+                self.started,
+                **self.fields,
+                **fields,
+            )
+
+    def load(self) -> bytes | None:
+        """Returns the cached result of the request or None."""
+        if self.cache_key is None:
+            return None
+
+        cached = self.cache.get(self.cache_key)
+        if cached is not None:
+            self.emit(cached=True)
+
+        return cached
+
+    def store(self, result: RestResult | HtmlResult) -> None:
+        if self.cache_key is not None:
+            self.cache.set(
+                self.cache_key, result.model_dump_json().encode("utf-8"), self.ttl
+            )
+
+    def fail(self, error: Exception, logger: logging.Logger) -> None:
+        """Records a request that failed in the transport."""
+        self.emit(error=type(error).__name__)
+        logger.critical(f"Request failed at {self.hostname}/{self.endpoint}")
+
+    def receive(
+        self, retries: int, get_fields: Callable[..., Dict[str, Any]], *args
+    ) -> None:
+        """Records the response. get_fields(*args) is only called if events are emitted."""
+        if self.instrumented:
+            self.fields = dict(retries=retries, **get_fields(*args))
+
+    def get_rest_result(
+        self,
+        status_code: int,
+        reason: str,
+        content: bytes,
+        decoder: Callable[[bytes], Any] | None,
+    ) -> RestResult:
+        """Decodes a rest response or raises a RestException with its status."""
+        if not 299 >= status_code >= 200:
+            # Error pages are often not JSON, the status decides
+            self.emit()
+            raise RestException(f"{status_code}: {reason}", status_code=status_code)
+
+        decode_started = time.perf_counter()
+        try:
+            data_out: Any = (decoder or jsonlib.loads)(content)
+        except jsonlib.DECODE_ERRORS as e:
+            self.emit(error=type(e).__name__)
+            raise RestException("Bad JSON in response", status_code=status_code) from e
+
+        self.emit(decode=time.perf_counter() - decode_started)
+        result = (RestResult if decoder is None else RestResult.model_construct)(
+            status_code=status_code,
+            message=reason,
+            json_data=data_out,
+        )
+        self.store(result)
+        return result
+
+    def get_html_result(
+        self, status_code: int, reason: str, content: bytes, raw: bool
+    ) -> HtmlResult:
+        """Decodes a html response or raises a HtmlException with its status."""
+        decode_started = time.perf_counter()
+        try:
+            data_out: str | bytes = content if raw else content.decode("utf-8")
+        except ValueError as e:
+            self.emit(error=type(e).__name__)
+            raise HtmlException("Bad HTML in response") from e
+
+        self.emit(decode=time.perf_counter() - decode_started)
+        if not 299 >= status_code >= 200:
+            raise HtmlException(f"{status_code}: {reason}")
+
+        result = HtmlResult(
+            status_code=status_code,
+            message=reason,
+            html_data=data_out,
+        )
+        self.store(result)
+        return result
+
+
+def create_session(transport: TransportConfig | None = None) -> requests.Session:
+    """Creates a requests.Session configured by the transport config.
+
+    Args:
+        transport (TransportConfig | None, optional): Transport config. Defaults to None.
+
+    Returns:
+        requests.Session: Session with tuned connection pools.
+    """
+    transport = transport or TransportConfig()
+    session = requests.Session()
+
+    http_adapter = HTTPAdapter(
+        pool_connections=transport.pool_connections,
+        pool_maxsize=transport.pool_maxsize,
+        pool_block=transport.pool_block,
+    )
+    session.mount("https://", http_adapter)
+    session.mount("http://", http_adapter)
+
+    session.headers.update(
+        {
+            "accept-encoding": ACCEPT_ENCODING if transport.compression else "identity",
+            "connection": "keep-alive" if transport.keep_alive else "close",
+        }
+    )
+    return session
+
+
+def _send(
+    send: Callable[[], Any],
+    retry_policy: RetryPolicy | None,
+    rate_limiter: RateLimiter | None,
+    logger: logging.Logger,
+) -> Any:
+    """Sends a request and retries it according to the retry policy. Returns the response and the number of retries."""
+    attempt = 0
+    while True:
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+
+        try:
+            response = send()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            if retry_policy is None or not retry_policy.should_retry_exception(
+                e, attempt
+            ):
+                raise
+            delay = retry_policy.get_delay(attempt)
+        else:
+            if retry_policy is None or not retry_policy.should_retry_status(
+                response.status_code, attempt
+            ):
+                return response, attempt
+            delay = retry_policy.get_delay(attempt, response.headers.get("Retry-After"))
+            if response.status_code == 429 and rate_limiter is not None:
+                rate_limiter.pause(delay)
+
+        logger.warning(f"Retrying request in {delay:.2f}s (attempt {attempt + 1})")
+        time.sleep(delay)
+        attempt = attempt + 1
+
+
+async def _send_async(
+    send: Callable[[], Any],
+    retry_policy: RetryPolicy | None,
+    rate_limiter: RateLimiter | None,
+    logger: logging.Logger,
+) -> Any:
+    """Async version of _send(). Returns the response and the number of retries."""
+    attempt = 0
+    while True:
+        if rate_limiter is not None:
+            await rate_limiter.acquire_async()
+
+        try:
+            response = await send()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            if retry_policy is None or not retry_policy.should_retry_exception(
+                e, attempt
+            ):
+                raise
+            delay = retry_policy.get_delay(attempt)
+        else:
+            if retry_policy is None or not retry_policy.should_retry_status(
+                response.status_code, attempt
+            ):
+                return response, attempt
+            delay = retry_policy.get_delay(attempt, response.headers.get("Retry-After"))
+            if response.status_code == 429 and rate_limiter is not None:
+                rate_limiter.pause(delay)
+
+        logger.warning(f"Retrying request in {delay:.2f}s (attempt {attempt + 1})")
+        await asyncio.sleep(delay)
+        attempt = attempt + 1
 
 
 class RestAdapter:
@@ -17,6 +307,10 @@ class RestAdapter:
         hostname: str,
         session: requests.Session | None = None,
         logger: logging.Logger | None = None,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        timeout: float | Tuple[float | None, float | None] | None = None,
     ) -> None:
         self.session: requests.Session = session or requests.Session()
         self.session.headers.update(
@@ -26,6 +320,10 @@ class RestAdapter:
         )
         self._logger = logger or logging.getLogger(__name__)
         self.hostname = hostname
+        self.cache: ResponseCache | None = cache
+        self.retry_policy: RetryPolicy | None = retry_policy
+        self.rate_limiter: RateLimiter | None = rate_limiter
+        self.timeout: float | Tuple[float | None, float | None] | None = timeout
 
     def _do(
         self,
@@ -33,17 +331,33 @@ class RestAdapter:
         endpoint: str,
         params: Dict | None = None,
         json_data: Dict | None = None,
+        decoder: Callable[[bytes], Any] | None = None,
     ) -> RestResult:
+        # Results of custom decoders are not cached
+        call = _Call(
+            self, method, endpoint, params, None if decoder is not None else self.cache
+        )
+        cached = call.load()
+        if cached is not None:
+            return RestResult.model_validate_json(cached)
+
         try:
-            response: requests.Response = self.session.request(
-                method=method,
-                url=f"{self.hostname}/{endpoint}",
-                params=params,
-                json=json_data,
+            response, retries = _send(
+                partial(
+                    self.session.request,
+                    method=method,
+                    url=f"{self.hostname}/{endpoint}",
+                    params=params,
+                    json=json_data,
+                    timeout=self.timeout,
+                ),
+                self.retry_policy,
+                self.rate_limiter,
+                self._logger,
             )
 
         except requests.exceptions.RequestException as e:
-            self._logger.critical(f"Request failed at {self.hostname}/{endpoint}")
+            call.fail(e, self._logger)
             preview = self.session.prepare_request(
                 requests.Request(
                     method=method,
@@ -56,31 +370,30 @@ class RestAdapter:
 
             raise RestException("Request failed") from e
 
-        try:
-            data_out: Dict[str, Any] = response.json()
-        except (ValueError, JSONDecodeError) as e:
-            raise RestException("Bad JSON in response") from e
-
-        if 299 >= response.status_code >= 200:
-            return RestResult(
-                status_code=response.status_code,
-                message=response.reason,
-                json_data=data_out,
-            )
-
-        raise RestException(f"{response.status_code}: {response.reason}")
+        call.receive(retries, _get_response_fields, response)
+        return call.get_rest_result(
+            response.status_code, response.reason, response.content, decoder
+        )
 
-    def get(self, endpoint: str, params: Dict | None = None) -> RestResult:
+    def get(
+        self,
+        endpoint: str,
+        params: Dict | None = None,
+        decoder: Callable[[bytes], Any] | None = None,
+    ) -> RestResult:
         """Get a choosen endpoint on a restful API.
 
         Args:
             endpoint (str): Endpoint to query.
             params (Dict | None, optional): Parameters to query. Defaults to None.
+            decoder (Callable[[bytes], Any] | None, optional): Decodes the body instead of the json backend,
+                e.g. into typed structs. Its results are stored as json_data without validation and are not cached.
+                Defaults to None.
 
         Returns:
             RestResult: RestResult with status_code, message and json_data
         """
-        return self._do(method="GET", endpoint=endpoint, params=params)
+        return self._do(method="GET", endpoint=endpoint, params=params, decoder=decoder)
 
 
 class HtmlAdapter:
@@ -91,6 +404,11 @@ class HtmlAdapter:
         hostname: str = "https://www.eventim.de/",
         session: requests.Session | None = None,
         logger: logging.Logger | None = None,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        timeout: float | Tuple[float | None, float | None] | None = None,
+        raw: bool = False,
     ) -> None:
         self.session: requests.Session = session or requests.Session()
         self.session.headers.update(
@@ -100,6 +418,12 @@ class HtmlAdapter:
         )
         self._logger = logger or logging.getLogger(__name__)
         self.hostname = hostname
+        self.cache: ResponseCache | None = cache
+        self.retry_policy: RetryPolicy | None = retry_policy
+        self.rate_limiter: RateLimiter | None = rate_limiter
+        self.timeout: float | Tuple[float | None, float | None] | None = timeout
+        # Keep html_data as the undecoded utf-8 body
+        self.raw: bool = raw
 
     def _do(
         self,
@@ -107,17 +431,30 @@ class HtmlAdapter:
         endpoint: str,
         params: Dict | None = None,
         json_data: Dict | None = None,
+        refresh: bool = False,
     ) -> HtmlResult:
+        call = _Call(self, method, endpoint, params, self.cache)
+        cached = None if refresh else call.load()
+        if cached is not None:
+            return _load_html_result(cached, self.raw)
+
         try:
-            response = self.session.request(
-                method=method,
-                url=f"{self.hostname}/{endpoint}",
-                params=params,
-                json=json_data,
+            response, retries = _send(
+                partial(
+                    self.session.request,
+                    method=method,
+                    url=f"{self.hostname}/{endpoint}",
+                    params=params,
+                    json=json_data,
+                    timeout=self.timeout,
+                ),
+                self.retry_policy,
+                self.rate_limiter,
+                self._logger,
             )
 
         except requests.exceptions.RequestException as e:
-            self._logger.critical(f"Request failed at {self.hostname}/{endpoint}")
+            call.fail(e, self._logger)
             preview = self.session.prepare_request(
                 requests.Request(
                     method=method,
@@ -131,28 +468,258 @@ class HtmlAdapter:
 
         self._logger.debug(response.request.url)
 
+        call.receive(retries, _get_response_fields, response)
+        return call.get_html_result(
+            response.status_code, response.reason, response.content, self.raw
+        )
+
+    def get(
+        self, endpoint: str, params: Dict | None = None, refresh: bool = False
+    ) -> HtmlResult:
+        """Get a choosen endpoint on the html page.
+
+        Args:
+            endpoint (str): Endpoint to query.
+            params (Dict | None, optional): Parameters to query. Defaults to None.
+            refresh (bool, optional): Skip a cached response and cache the fresh one. Defaults to False.
+
+        Returns:
+            RestResult: RestResult with status_code, message and json_data
+        """
+        return self._do(method="GET", endpoint=endpoint, params=params, refresh=refresh)
+
+
+def _require_httpx() -> None:
+    global httpx  # pylint: disable=global-statement,invalid-name
+    if httpx is None:
         try:
-            data_out: str = response.content.decode("utf-8")
-        except (ValueError, JSONDecodeError) as e:
-            raise HtmlException("Bad HTML in response") from e
+            import httpx as _httpx  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ImportError(
+                "The async adapters require httpx. Install it with `pip install pyventim[async]`."
+            ) from e
+        httpx = _httpx
+
+
+def create_async_client(
+    transport: TransportConfig | None = None, **kwargs
+) -> "httpx.AsyncClient":
+    """Creates a httpx.AsyncClient that can be shared between async adapters.
+
+    Args:
+        transport (TransportConfig | None, optional): Transport config. Defaults to None.
+        **kwargs: Keyword arguments passed to httpx.AsyncClient.
+
+    Returns:
+        httpx.AsyncClient: Client with a shared connection pool.
+    """
+    _require_httpx()
+    transport = transport or TransportConfig()
+
+    kwargs.setdefault(
+        "limits",
+        httpx.Limits(
+            max_connections=transport.pool_connections * transport.pool_maxsize,
+            max_keepalive_connections=(
+                transport.pool_maxsize if transport.keep_alive else 0
+            ),
+        ),
+    )
+    kwargs.setdefault(
+        "timeout",
+        httpx.Timeout(
+            None, connect=transport.connect_timeout, read=transport.read_timeout
+        ),
+    )
+    if not transport.compression:
+        kwargs.setdefault("headers", {"accept-encoding": "identity"})
+
+    return httpx.AsyncClient(**kwargs)
+
+
+def _get_async_response_fields(
+    response: "httpx.Response", trace: metrics.HttpxTrace
+) -> Dict[str, Any]:
+    """Returns the RequestEvent fields of a httpx response."""
+    return dict(
+        status_code=response.status_code,
+        size=len(response.content),
+        connect=trace.connect,
+        tls=trace.tls,
+        ttfb=trace.ttfb,
+    )
+
 
-        if 299 >= response.status_code >= 200:
-            return HtmlResult(
-                status_code=response.status_code,
-                message=response.reason,
-                html_data=data_out,
+class AsyncRestAdapter:
+    """Async adapter for all rest based requests"""
+
+    def __init__(
+        self,
+        hostname: str,
+        client: "httpx.AsyncClient | None" = None,
+        logger: logging.Logger | None = None,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
+        _require_httpx()
+        self.client: httpx.AsyncClient = client or create_async_client()
+        self.client.headers.update(
+            {
+                "user-agent": "Mozilla/5.0 (X11; Linux x86_64; rv:125.0) Gecko/20100101 Firefox/125.0"  # pylint: disable=C0301
+            }
+        )
+        self._logger = logger or logging.getLogger(__name__)
+        self.hostname = hostname
+        self.cache: ResponseCache | None = cache
+        self.retry_policy: RetryPolicy | None = retry_policy
+        self.rate_limiter: RateLimiter | None = rate_limiter
+
+    async def _do(
+        self,
+        method: str,
+        endpoint: str,
+        params: Dict | None = None,
+        json_data: Dict | None = None,
+        decoder: Callable[[bytes], Any] | None = None,
+    ) -> RestResult:
+        # Results of custom decoders are not cached
+        call = _Call(
+            self, method, endpoint, params, None if decoder is not None else self.cache
+        )
+        cached = call.load()
+        if cached is not None:
+            return RestResult.model_validate_json(cached)
+
+        trace = metrics.HttpxTrace() if call.instrumented else None
+        try:
+            response, retries = await _send_async(
+                partial(
+                    self.client.request,
+                    method=method,
+                    url=f"{self.hostname}/{endpoint}",
+                    params=params,
+                    json=json_data,
+                    extensions={"trace": trace} if trace is not None else None,
+                ),
+                self.retry_policy,
+                self.rate_limiter,
+                self._logger,
             )
 
-        raise HtmlException(f"{response.status_code}: {response.reason}")
+        except httpx.HTTPError as e:
+            call.fail(e, self._logger)
+            raise RestException("Request failed") from e
+
+        call.receive(retries, _get_async_response_fields, response, trace)
+        return call.get_rest_result(
+            response.status_code, response.reason_phrase, response.content, decoder
+        )
 
-    def get(self, endpoint: str, params: Dict | None = None) -> HtmlResult:
-        """Get a choosen endpoint on the html page.
+    async def get(
+        self,
+        endpoint: str,
+        params: Dict | None = None,
+        decoder: Callable[[bytes], Any] | None = None,
+    ) -> RestResult:
+        """Get a choosen endpoint on a restful API.
 
         Args:
             endpoint (str): Endpoint to query.
             params (Dict | None, optional): Parameters to query. Defaults to None.
+            decoder (Callable[[bytes], Any] | None, optional): Decodes the body instead of the json backend,
+                e.g. into typed structs. Its results are stored as json_data without validation and are not cached.
+                Defaults to None.
 
         Returns:
             RestResult: RestResult with status_code, message and json_data
         """
-        return self._do(method="GET", endpoint=endpoint, params=params)
+        return await self._do(
+            method="GET", endpoint=endpoint, params=params, decoder=decoder
+        )
+
+
+class AsyncHtmlAdapter:
+    """Async adapter for all html based requests."""
+
+    def __init__(
+        self,
+        hostname: str = "https://www.eventim.de/",
+        client: "httpx.AsyncClient | None" = None,
+        logger: logging.Logger | None = None,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        raw: bool = False,
+    ) -> None:
+        _require_httpx()
+        self.client: httpx.AsyncClient = client or create_async_client()
+        self.client.headers.update(
+            {
+                "user-agent": "Mozilla/5.0 (X11; Linux x86_64; rv:125.0) Gecko/20100101 Firefox/125.0"  # pylint: disable=C0301
+            }
+        )
+        self._logger = logger or logging.getLogger(__name__)
+        self.hostname = hostname
+        self.cache: ResponseCache | None = cache
+        self.retry_policy: RetryPolicy | None = retry_policy
+        self.rate_limiter: RateLimiter | None = rate_limiter
+        # Keep html_data as the undecoded utf-8 body
+        self.raw: bool = raw
+
+    async def _do(
+        self,
+        method: str,
+        endpoint: str,
+        params: Dict | None = None,
+        json_data: Dict | None = None,
+        refresh: bool = False,
+    ) -> HtmlResult:
+        call = _Call(self, method, endpoint, params, self.cache)
+        cached = None if refresh else call.load()
+        if cached is not None:
+            return _load_html_result(cached, self.raw)
+
+        trace = metrics.HttpxTrace() if call.instrumented else None
+        try:
+            response, retries = await _send_async(
+                partial(
+                    self.client.request,
+                    method=method,
+                    url=f"{self.hostname}/{endpoint}",
+                    params=params,
+                    json=json_data,
+                    extensions={"trace": trace} if trace is not None else None,
+                ),
+                self.retry_policy,
+                self.rate_limiter,
+                self._logger,
+            )
+
+        except httpx.HTTPError as e:
+            call.fail(e, self._logger)
+            raise HtmlException("Request failed") from e
+
+        self._logger.debug(response.request.url)
+
+        call.receive(retries, _get_async_response_fields, response, trace)
+        return call.get_html_result(
+            response.status_code, response.reason_phrase, response.content, self.raw
+        )
+
+    async def get(
+        self, endpoint: str, params: Dict | None = None, refresh: bool = False
+    ) -> HtmlResult:
+        """Get a choosen endpoint on the html page.
+
+        Args:
+            endpoint (str): Endpoint to query.
+            params (Dict | None, optional): Parameters to query. Defaults to None.
+            refresh (bool, optional): Skip a cached response and cache the fresh one. Defaults to False.
+
+        Returns:
+            HtmlResult: HtmlResult with status_code, message and html_data
+        """
+        return await self._do(
+            method="GET", endpoint=endpoint, params=params, refresh=refresh
+        )
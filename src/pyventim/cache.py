@@ -0,0 +1,311 @@
+"""Response caches for the adapters."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Tuple
+
+# Time to live in seconds per endpoint prefix. Signed seatmap calls are never cached.
+DEFAULT_ENDPOINT_TTLS: Dict[str, float] = {
+    "v1/": 3600,
+    "v2/": 3600,
+    "component": 3600,
+    "event/": 6 * 3600,
+    "seatmap/": 0,
+}
+
+
+class ResponseCache:
+    """Base class for response caches. Subclasses implement the storage backend.
+
+    A ttl of 0 disables caching. Endpoint ttls are matched by the longest endpoint prefix.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 3600,
+        endpoint_ttls: Dict[str, float] | None = None,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        self.ttl: float = ttl
+        self.endpoint_ttls: Dict[str, float] = (
+            DEFAULT_ENDPOINT_TTLS if endpoint_ttls is None else endpoint_ttls
+        )
+        self.max_entries: int | None = max_entries
+        self.max_bytes: int | None = max_bytes
+        self.hits: int = 0
+        self.misses: int = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        method: str, hostname: str, endpoint: str, params: Dict | None = None
+    ) -> str:
+        """Builds a cache key of the request. Parameters are canonicalized so order does not matter.
+
+        Args:
+            method (str): HTTP method
+            hostname (str): Hostname of the adapter
+            endpoint (str): Endpoint of the request
+            params (Dict | None, optional): Query parameters. Defaults to None.
+
+        Returns:
+            str: Hex digest of the request.
+        """
+        # pylint: disable=line-too-long
+        canonical_params = sorted(
+            (
+                str(key),
+                (
+                    [str(x) for x in value]
+                    if isinstance(value, (list, tuple))
+                    else str(value)
+                ),
+            )
+            for key, value in (params or {}).items()
+            if value is not None
+        )
+        raw = json.dumps(
+            [method.upper(), hostname.rstrip("/"), endpoint.lstrip("/"), canonical_params]
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get_ttl(self, endpoint: str) -> float:
+        """Returns the time to live of an endpoint.
+
+        Args:
+            endpoint (str): Endpoint of the request
+
+        Returns:
+            float: Time to live in seconds. 0 means the endpoint is not cached.
+        """
+        endpoint = endpoint.lstrip("/")
+        matches = [x for x in self.endpoint_ttls if endpoint.startswith(x)]
+        if not matches:
+            return self.ttl
+
+        return self.endpoint_ttls[max(matches, key=len)]
+
+    def get(self, key: str) -> bytes | None:
+        """Returns a cached value and counts the hit or miss.
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            bytes | None: The cached value or None if missing or expired.
+        """
+        with self._lock:
+            value = self._get(key, time.time())
+            if value is None:
+                self.misses = self.misses + 1
+            else:
+                self.hits = self.hits + 1
+
+        return value
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Stores a value and evicts entries if the cache exceeds its bounds.
+
+        Args:
+            key (str): Cache key
+            value (bytes): Value to store
+            ttl (float): Time to live in seconds.
+        """
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._set(key, value, time.time() + ttl)
+            self._evict()
+
+    def clear(self) -> None:
+        """Removes all entries and resets the counters."""
+        with self._lock:
+            self._clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns the counters of the cache.
+
+        Returns:
+            Dict[str, Any]: Hits, misses, hit ratio, entries and bytes.
+        """
+        with self._lock:
+            entries, size = self._size()
+
+        requests = self.hits + self.misses
+        return dict(
+            hits=self.hits,
+            misses=self.misses,
+            hit_ratio=self.hits / requests if requests else 0.0,
+            entries=entries,
+            bytes=size,
+        )
+
+    def _get(self, key: str, now: float) -> bytes | None:
+        raise NotImplementedError
+
+    def _set(self, key: str, value: bytes, expires_at: float) -> None:
+        raise NotImplementedError
+
+    def _evict(self) -> None:
+        raise NotImplementedError
+
+    def _clear(self) -> None:
+        raise NotImplementedError
+
+    def _size(self) -> Tuple[int, int]:
+        raise NotImplementedError
+
+
+class MemoryCache(ResponseCache):
+    """In memory LRU cache."""
+
+    def __init__(
+        self,
+        ttl: float = 3600,
+        endpoint_ttls: Dict[str, float] | None = None,
+        max_entries: int | None = 1024,
+        max_bytes: int | None = None,
+    ) -> None:
+        super().__init__(
+            ttl=ttl,
+            endpoint_ttls=endpoint_ttls,
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+        )
+        self._entries: OrderedDict[str, Tuple[bytes, float]] = OrderedDict()
+        self._bytes: int = 0
+
+    def _get(self, key: str, now: float) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at <= now:
+            self._delete(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def _set(self, key: str, value: bytes, expires_at: float) -> None:
+        if key in self._entries:
+            self._delete(key)
+
+        self._entries[key] = (value, expires_at)
+        self._bytes = self._bytes + len(value)
+
+    def _delete(self, key: str) -> None:
+        value, _ = self._entries.pop(key)
+        self._bytes = self._bytes - len(value)
+
+    def _evict(self) -> None:
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            self._delete(next(iter(self._entries)))
+
+    def _clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def _size(self) -> Tuple[int, int]:
+        return len(self._entries), self._bytes
+
+
+class SqliteCache(ResponseCache):
+    """Persistent cache in a SQLite database. Least recently used entries are evicted first."""
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = 3600,
+        endpoint_ttls: Dict[str, float] | None = None,
+        max_entries: int | None = None,
+        max_bytes: int | None = 512 * 1024 * 1024,
+    ) -> None:
+        super().__init__(
+            ttl=ttl,
+            endpoint_ttls=endpoint_ttls,
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+        )
+        self.path: str = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+            "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)"
+        )
+        self._connection.commit()
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self._connection.close()
+
+    def _get(self, key: str, now: float) -> bytes | None:
+        row = self._connection.execute(
+            "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        value, expires_at = row
+        if expires_at <= now:
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._connection.commit()
+            return None
+
+        self._connection.execute(
+            "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+        )
+        self._connection.commit()
+        return bytes(value)
+
+    def _set(self, key: str, value: bytes, expires_at: float) -> None:
+        self._connection.execute(
+            "INSERT OR REPLACE INTO responses (key, value, size, expires_at, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (key, value, len(value), expires_at, time.time()),
+        )
+        self._connection.commit()
+
+    def _evict(self) -> None:
+        self._connection.execute(
+            "DELETE FROM responses WHERE expires_at <= ?", (time.time(),)
+        )
+
+        entries, size = self._size()
+        while entries and (
+            (self.max_entries is not None and entries > self.max_entries)
+            or (self.max_bytes is not None and size > self.max_bytes)
+        ):
+            key, entry_size = self._connection.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at LIMIT 1"
+            ).fetchone()
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            entries, size = entries - 1, size - entry_size
+
+        self._connection.commit()
+
+    def _clear(self) -> None:
+        self._connection.execute("DELETE FROM responses")
+        self._connection.commit()
+
+    def _size(self) -> Tuple[int, int]:
+        entries, size = self._connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        return entries, size
@@ -1,12 +1,56 @@
 """Highlevel wrapper functions for the Eventim API."""
 
-from datetime import date, time
-from typing import Literal, Iterator, Dict, List
+import asyncio
+import json
+import logging
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, time, timedelta
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Literal,
+    Iterator,
+    AsyncIterator,
+    Dict,
+    List,
+    Tuple,
+)
 
-from .models import ExplorationParameters, ComponentParameters
-from .adapters import RestAdapter, HtmlAdapter  # pylint: disable=E0401
+from .cache import ResponseCache
+from .retry import RetryPolicy, RateLimiter
+from .exceptions import RestException
+from .seatmap import (
+    ColumnarSeatmap,
+    SeatmapParamsCache,
+    decode_seatmap,
+    parse_columnar_seatmap_from_api,
+)
+from .models import (
+    CompiledQuery,
+    ExplorationParameters,
+    ExplorationBatchItem,
+    ComponentParameters,
+    RestResult,
+    TransportConfig,
+)
+from .records import Attraction, Location, ProductGroup
+from .adapters import (  # pylint: disable=E0401
+    RestAdapter,
+    HtmlAdapter,
+    AsyncRestAdapter,
+    AsyncHtmlAdapter,
+    create_async_client,
+    create_session,
+)
 from .utils import (
+    HtmlDocument,
     parse_has_next_page_from_component_html,
+    parse_pagination_from_component_html,
+    parse_event_id_from_event_url,
+    parse_event_key_from_event_url,
     parse_list_from_component_html,
     parse_calendar_from_component_html,
     parse_has_seatmap_from_event_html,
@@ -15,20 +59,260 @@ from .utils import (
     parse_seathamp_data_from_api,
 )
 
+if TYPE_CHECKING:  # pragma: no cover
+    import httpx
+
+EXPLORATION_HOSTNAME = "https://public-api.eventim.com/websearch/search/api/exploration"
+PRIVATE_API_HOSTNAME = "https://api.eventim.com"
+HTML_HOSTNAME = "https://www.eventim.de/"
+
+# The component endpoint does not return more than 10 pages (~90 events) per query.
+COMPONENT_MAX_PAGES = 10
+
+# Endpoint, result key and id field of the exploration endpoints
+EXPLORATION_KINDS: Dict[str, Tuple[str, str, str]] = {
+    "product_groups": ("v2/productGroups", "productGroups", "productGroupId"),
+    "attractions": ("v1/attractions", "attractions", "attractionId"),
+    "locations": ("v1/locations", "locations", "locationId"),
+}
+
+# Status codes of the private api for expired or invalid seatmap signatures
+SEATMAP_PARAMS_REJECTED_STATUSES: frozenset = frozenset({401, 403})
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of a query in the batch result queues
+_BATCH_DONE = object()
+
+
+def _get_event_identity(event: Dict) -> str:
+    if "url" in event:
+        return f"{parse_event_id_from_event_url(event['url'])}|{event.get('startDate')}"
+
+    return json.dumps(event, sort_keys=True)
+
+
+def _split_date_window(start: date, end: date) -> List[Tuple[date, date]]:
+    middle = start + (end - start) // 2
+    return [(start, middle), (middle + timedelta(days=1), end)]
+
+
+def _cache_seatmap_params(
+    cache: SeatmapParamsCache, event_key: str, information: Dict
+) -> None:
+    if "seatmapOptions" in information:
+        cache.set(
+            event_key,
+            parse_seatmap_url_params_from_seatmap_information(
+                information["seatmapOptions"]
+            ),
+        )
+
+
+def _get_exploration_kind(kind: str) -> Tuple[str, str, str]:
+    if kind not in EXPLORATION_KINDS:
+        raise ValueError(
+            f"kind must be one of {tuple(EXPLORATION_KINDS)}, got {kind!r}"
+        )
+
+    return EXPLORATION_KINDS[kind]
+
+
+def _check_batch_args(kind: str, max_workers: int) -> Tuple[str, str, str]:
+    exploration_kind = _get_exploration_kind(kind)
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    return exploration_kind
+
+
+class _BatchDeduplicator:
+    """Tags batch items with the queries that returned them and drops repeated ids."""
+
+    def __init__(self, id_field: str, dedupe: bool, queries: int) -> None:
+        self.id_field: str = id_field
+        self.dedupe: bool = dedupe
+        # Queries that did not finish yet
+        self.remaining: int = queries
+        self._items: Dict[str, ExplorationBatchItem] = {}
+
+    def receive(
+        self, index: int, item: Any, error: Exception | None
+    ) -> ExplorationBatchItem | None:
+        """Handles a result of a query worker. Returns the batch item to yield or None.
+        Raises the error of a failed query.
+        """
+        if error is not None:
+            raise error
+
+        if item is _BATCH_DONE:
+            self.remaining = self.remaining - 1
+            return None
+
+        return self.add(index, item)
+
+    def add(self, index: int, item: Dict) -> ExplorationBatchItem | None:
+        """Returns the new batch item or None if the id was seen before."""
+        item_id = item.get(self.id_field)
+        item_id = None if item_id is None else str(item_id)
+
+        if self.dedupe and item_id is not None:
+            seen = self._items.get(item_id)
+            if seen is not None:
+                if index not in seen.query_indices:
+                    seen.query_indices.append(index)
+                return None
+
+        batch_item = ExplorationBatchItem.model_construct(
+            item_id=item_id, item=item, query_indices=[index]
+        )
+        if self.dedupe and item_id is not None:
+            self._items[item_id] = batch_item
+
+        return batch_item
+
+
+def _put_until_stopped(
+    results: queue.Queue,
+    value: Tuple[int, Any, Exception | None],
+    stopped: threading.Event,
+) -> bool:
+    """Puts a value into a bounded queue. Returns False if the consumer stopped first."""
+    while not stopped.is_set():
+        try:
+            results.put(value, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+
+    return False
+
+
+def _check_shard_params(params: ComponentParameters) -> None:
+    if params.startdate is None or params.enddate is None:
+        raise ValueError("date_from and date_to are required when shard is True")
+
 
 class Eventim:
     """Class for high level functions"""
 
     def __init__(
         self,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        transport: TransportConfig | None = None,
+        exploration_hostname: str = EXPLORATION_HOSTNAME,
+        private_api_hostname: str = PRIVATE_API_HOSTNAME,
+        html_hostname: str = HTML_HOSTNAME,
+        seatmap_params_cache: SeatmapParamsCache | None = None,
+        raw_html: bool = False,
     ) -> None:
+        """
+        Args:
+            cache (ResponseCache | None, optional): Response cache shared by all adapters like a MemoryCache or
+                SqliteCache. Defaults to None.
+            retry_policy (RetryPolicy | None, optional): Retry policy of all adapters. Defaults to None (no retries).
+            rate_limiter (RateLimiter | None, optional): Rate limiter shared by all adapters. Defaults to None.
+            transport (TransportConfig | None, optional): Connection pool, timeout and session settings. Defaults to
+                TransportConfig().
+            exploration_hostname (str, optional): Base url of the exploration API. Defaults to EXPLORATION_HOSTNAME.
+            private_api_hostname (str, optional): Base url of the private API. Defaults to PRIVATE_API_HOSTNAME.
+            html_hostname (str, optional): Base url of the website. Defaults to HTML_HOSTNAME.
+            seatmap_params_cache (SeatmapParamsCache | None, optional): Cache of the signed seatmap params per event.
+                Defaults to SeatmapParamsCache().
+            raw_html (bool, optional): Keep html_data of the html adapter as the undecoded bytes. Pages are then parsed
+                without decoding them first. Defaults to False.
+        """
+        # pylint: disable=line-too-long
+        transport = transport or TransportConfig()
+        shared_session = create_session(transport) if transport.share_session else None
+
+        def adapter_options() -> Dict:
+            return dict(
+                session=shared_session or create_session(transport),
+                cache=cache,
+                retry_policy=retry_policy,
+                rate_limiter=rate_limiter,
+                timeout=transport.timeout,
+            )
+
         self.rest_adapter: RestAdapter = RestAdapter(
-            hostname="https://public-api.eventim.com/websearch/search/api/exploration"
+            hostname=exploration_hostname, **adapter_options()
         )
         self.private_rest_adapter: RestAdapter = RestAdapter(
-            hostname="https://api.eventim.com"
+            hostname=private_api_hostname, **adapter_options()
         )
-        self.html_adapter: HtmlAdapter = HtmlAdapter()
+        self.html_adapter: HtmlAdapter = HtmlAdapter(
+            hostname=html_hostname, raw=raw_html, **adapter_options()
+        )
+        self.seatmap_params_cache: SeatmapParamsCache = (
+            SeatmapParamsCache()
+            if seatmap_params_cache is None
+            else seatmap_params_cache
+        )
+
+    def _get_exploration_page(
+        self, endpoint: str, query: CompiledQuery, page: int
+    ) -> RestResult:
+        return self.rest_adapter.get(endpoint=endpoint, params=query.page(page))
+
+    def _explore(
+        self,
+        endpoint: str,
+        result_key: str,
+        params: ExplorationParameters,
+        prefetch: int = 0,
+    ) -> Iterator[Dict]:
+        """Handles the pagination of the exploration endpoints.
+        With prefetch > 0 the remaining pages are fetched by a bounded thread pool once totalPages is known.
+        """
+        # pylint: disable=line-too-long
+        # Serialized once, the pages only swap the page number
+        query = params.compile_query()
+        page = params.page
+        while True:
+            rest_result = self.rest_adapter.get(
+                endpoint=endpoint, params=query.page(page)
+            )
+
+            for item in rest_result.json_data[result_key]:
+                yield item
+
+            if (
+                page >= rest_result.json_data["totalPages"]
+                or "next" not in rest_result.json_data["_links"].keys()
+            ):
+                return
+
+            if prefetch > 0:
+                break
+
+            page = page + 1
+
+        total_pages = rest_result.json_data["totalPages"]
+        next_page = page + 1
+        pending = deque()
+        executor = ThreadPoolExecutor(max_workers=prefetch)
+        try:
+            while pending or next_page <= total_pages:
+                # Keep the window filled; results are consumed in page order
+                while next_page <= total_pages and len(pending) < prefetch:
+                    pending.append(
+                        executor.submit(
+                            self._get_exploration_page, endpoint, query, next_page
+                        )
+                    )
+                    next_page = next_page + 1
+
+                rest_result = pending.popleft().result()
+                for item in rest_result.json_data[result_key]:
+                    yield item
+
+                if "next" not in rest_result.json_data["_links"].keys():
+                    break
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def explore_attractions(
         self,
@@ -36,13 +320,19 @@ class Eventim:
         sort: Literal[
             "DateAsc", "DateDesc", "NameAsc", "NameDesc", "Rating", "Recommendation"
         ] = "DateAsc",
-    ) -> Iterator[Dict]:
+        prefetch: int = 0,
+        typed: bool = False,
+    ) -> Iterator[Dict | Attraction]:
         # pylint: disable=line-too-long
         """This function returns attractions from the exploration API.
 
         Args:
             search_term (str): Search term to query the API.
-            sort (Literal[ &quot;DateAsc&quot;, &quot;DateDesc&quot;, &quot;NameAsc&quot;, &quot;NameDesc&quot;, &quot;Rating&quot;, &quot;Recommendation&quot; ], optional): Sorted by. Defaults to "DateAsc".
+            sort (Literal["DateAsc", "DateDesc", "NameAsc", "NameDesc", "Rating", "Recommendation"], optional):
+                Sorted by. Defaults to "DateAsc".
+            prefetch (int, optional): Number of pages fetched concurrently once the first page reported totalPages.
+                Items are still yielded in page order. Defaults to 0 (sequential).
+            typed (bool, optional): Yield Attraction records with typed fields instead of dicts. Defaults to False.
 
         Yields:
             Iterator[Dict]: Iterator that returns one item at the time and handles the pagination of eventim.
@@ -53,22 +343,13 @@ class Eventim:
             page=1,
         )
 
-        while True:
-
-            rest_result = self.rest_adapter.get(
-                endpoint="v1/attractions", params=params.model_dump(exclude_none=True)
-            )
-
-            for attraction in rest_result.json_data["attractions"]:
-                yield attraction
-
-            if (
-                params.page >= rest_result.json_data["totalPages"]
-                or "next" not in rest_result.json_data["_links"].keys()
-            ):
-                break
-
-            params.page = params.page + 1
+        items = self._explore(
+            endpoint="v1/attractions",
+            result_key="attractions",
+            params=params,
+            prefetch=prefetch,
+        )
+        yield from map(Attraction, items) if typed else items
 
     def explore_locations(
         self,
@@ -76,13 +357,19 @@ class Eventim:
         sort: Literal[
             "DateAsc", "DateDesc", "NameAsc", "NameDesc", "Rating", "Recommendation"
         ] = "DateAsc",
-    ) -> Iterator[Dict]:
+        prefetch: int = 0,
+        typed: bool = False,
+    ) -> Iterator[Dict | Location]:
         # pylint: disable=line-too-long
         """This function returns locations from the exploration API.
 
         Args:
             search_term (str): Search term to query the API.
-            sort (Literal[ &quot;DateAsc&quot;, &quot;DateDesc&quot;, &quot;NameAsc&quot;, &quot;NameDesc&quot;, &quot;Rating&quot;, &quot;Recommendation&quot; ], optional): Sorted by. Defaults to "DateAsc".
+            sort (Literal["DateAsc", "DateDesc", "NameAsc", "NameDesc", "Rating", "Recommendation"], optional):
+                Sorted by. Defaults to "DateAsc".
+            prefetch (int, optional): Number of pages fetched concurrently once the first page reported totalPages.
+                Items are still yielded in page order. Defaults to 0 (sequential).
+            typed (bool, optional): Yield Location records with typed fields instead of dicts. Defaults to False.
 
         Yields:
             Iterator[Dict]: Iterator that returns one item at the time and handles the pagination of eventim.
@@ -93,21 +380,13 @@ class Eventim:
             page=1,
         )
 
-        while True:
-            rest_result = self.rest_adapter.get(
-                endpoint="v1/locations", params=params.model_dump(exclude_none=True)
-            )
-
-            for location in rest_result.json_data["locations"]:
-                yield location
-
-            if (
-                params.page >= rest_result.json_data["totalPages"]
-                or "next" not in rest_result.json_data["_links"].keys()
-            ):
-                break
-
-            params.page = params.page + 1
+        items = self._explore(
+            endpoint="v1/locations",
+            result_key="locations",
+            params=params,
+            prefetch=prefetch,
+        )
+        yield from map(Location, items) if typed else items
 
     def explore_product_groups(
         self,
@@ -121,7 +400,9 @@ class Eventim:
         sort: Literal[
             "DateAsc", "DateDesc", "NameAsc", "NameDesc", "Rating", "Recommendation"
         ] = "DateAsc",
-    ) -> Iterator[Dict]:
+        prefetch: int = 0,
+        typed: bool = False,
+    ) -> Iterator[Dict | ProductGroup]:
         # pylint: disable=line-too-long
         """Function to return product groups and top 5 matching products from the API.
         Combining multiple parameters act as AND operators.
@@ -134,7 +415,11 @@ class Eventim:
             date_to (date | None, optional): Product date earlier than. Defaults to None.
             time_from (time | None, optional): Start time of product later than. Defaults to None.
             time_to (time | None, optional): Start time of product earlier than. Defaults to None.
-            sort (Literal[ &quot;DateAsc&quot;, &quot;DateDesc&quot;, &quot;NameAsc&quot;, &quot;NameDesc&quot;, &quot;Rating&quot;, &quot;Recommendation&quot; ], optional): Sorted by. Defaults to "DateAsc".
+            sort (Literal["DateAsc", "DateDesc", "NameAsc", "NameDesc", "Rating", "Recommendation"], optional):
+                Sorted by. Defaults to "DateAsc".
+            prefetch (int, optional): Number of pages fetched concurrently once the first page reported totalPages.
+                Items are still yielded in page order. Defaults to 0 (sequential).
+            typed (bool, optional): Yield ProductGroup records with typed fields instead of dicts. Defaults to False.
 
         Yields:
             - Iterator[Dict]: Iterator that returns one item at the time and handles the pagination of eventim.
@@ -151,21 +436,165 @@ class Eventim:
             page=1,
         )
 
+        items = self._explore(
+            endpoint="v2/productGroups",
+            result_key="productGroups",
+            params=params,
+            prefetch=prefetch,
+        )
+        yield from map(ProductGroup, items) if typed else items
+
+    def explore(
+        self,
+        params: ExplorationParameters,
+        kind: Literal["product_groups", "attractions", "locations"] = "product_groups",
+        prefetch: int = 0,
+    ) -> Iterator[Dict]:
+        # pylint: disable=line-too-long
+        """Returns the items of an exploration query with all parameters of ExplorationParameters.
+
+        Args:
+            params (ExplorationParameters): Query to run. Pagination starts at its page. It is not modified.
+            kind (Literal["product_groups", "attractions", "locations"], optional): Exploration endpoint to query.
+                Defaults to "product_groups".
+            prefetch (int, optional): Number of pages fetched concurrently once the first page reported totalPages.
+                Items are still yielded in page order. Defaults to 0 (sequential).
+
+        Raises:
+            ValueError: Raised if kind is invalid.
+
+        Yields:
+            Iterator[Dict]: Iterator that returns one item at the time and handles the pagination of eventim.
+        """
+        endpoint, result_key, _ = _get_exploration_kind(kind)
+        yield from self._explore(endpoint, result_key, params, prefetch=prefetch)
+
+    def explore_batch(
+        self,
+        queries: List[ExplorationParameters],
+        kind: Literal["product_groups", "attractions", "locations"] = "product_groups",
+        max_workers: int = 4,
+        dedupe: bool = True,
+    ) -> Iterator[ExplorationBatchItem]:
+        # pylint: disable=line-too-long
+        """Runs many exploration queries concurrently and streams their results.
+        Entities returned by several queries are yielded once, tagged with the indices of all queries that returned them.
+
+        Args:
+            queries (List[ExplorationParameters]): Queries to run. Pagination starts at the page of each query.
+            kind (Literal["product_groups", "attractions", "locations"], optional): Exploration endpoint to query.
+                Defaults to "product_groups".
+            max_workers (int, optional): Queries running at the same time. Defaults to 4.
+            dedupe (bool, optional): Yield every entity id once. Defaults to True.
+
+        Raises:
+            ValueError: Raised if kind or max_workers is invalid.
+
+        Yields:
+            Iterator[ExplorationBatchItem]: Entities in the order they arrive. query_indices is extended when later
+                queries return the entity again and is complete once the iterator is exhausted.
+        """
+        endpoint, result_key, id_field = _check_batch_args(kind, max_workers)
+        deduplicator = _BatchDeduplicator(id_field, dedupe, len(queries))
+        results: queue.Queue = queue.Queue(maxsize=max_workers * 64)
+        stopped = threading.Event()
+
+        def run(index: int, params: ExplorationParameters) -> None:
+            try:
+                for item in self._explore(endpoint, result_key, params):
+                    if not _put_until_stopped(results, (index, item, None), stopped):
+                        return
+                _put_until_stopped(results, (index, _BATCH_DONE, None), stopped)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                _put_until_stopped(results, (index, _BATCH_DONE, e), stopped)
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            for index, params in enumerate(queries):
+                executor.submit(run, index, params)
+
+            while deduplicator.remaining:
+                batch_item = deduplicator.receive(*results.get())
+                if batch_item is not None:
+                    yield batch_item
+        finally:
+            stopped.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_component_window(
+        self, params: ComponentParameters, splittable: bool
+    ) -> Tuple[List[Dict], bool]:
+        """Fetches the events of a component date window.
+        Returns the events and whether the window hits the page limit. Splittable windows stop after the first page once
+        the limit is detected.
+        """
+        # pylint: disable=line-too-long
+        events = []
+        query = params.compile_query()
+        pnum = params.pnum
         while True:
-            rest_result = self.rest_adapter.get(
-                endpoint="v2/productGroups", params=params.model_dump(exclude_none=True)
+            comp_result = self.html_adapter.get(
+                endpoint="component", params=query.page(pnum)
             )
+            document = HtmlDocument(comp_result.html_data)
+            pagination = parse_pagination_from_component_html(document)
+            truncated = pagination is not None and pagination[1] >= COMPONENT_MAX_PAGES
+
+            if truncated and splittable:
+                return [], True
 
-            for product_group in rest_result.json_data["productGroups"]:
-                yield product_group
+            events.extend(parse_list_from_component_html(document))
 
             if (
-                params.page >= rest_result.json_data["totalPages"]
-                or "next" not in rest_result.json_data["_links"].keys()
+                pagination is None
+                or pagination[0] >= pagination[1]
+                or pnum >= COMPONENT_MAX_PAGES
             ):
-                break
+                return events, truncated
+
+            pnum = pnum + 1
 
-            params.page = params.page + 1
+    def _get_sharded_product_group_events(
+        self, params: ComponentParameters, max_workers: int
+    ) -> Iterator[Dict]:
+        seen = set()
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        def submit(start: date, end: date):
+            window_params = params.model_copy(
+                update={"startdate": start, "enddate": end, "pnum": 1}
+            )
+            return (
+                start,
+                end,
+                executor.submit(self._get_component_window, window_params, start < end),
+            )
+
+        try:
+            # Windows are kept in date order so events are yielded in date order
+            windows = deque([submit(params.startdate, params.enddate)])
+            while windows:
+                start, end, future = windows.popleft()
+                events, truncated = future.result()
+
+                if truncated and start < end:
+                    windows.extendleft(
+                        reversed([submit(*x) for x in _split_date_window(start, end)])
+                    )
+                    continue
+
+                if truncated:
+                    logger.warning(
+                        f"Events of {params.esid} on {start} exceed the page limit"
+                    )
+
+                for event in events:
+                    identity = _get_event_identity(event)
+                    if identity not in seen:
+                        seen.add(identity)
+                        yield event
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def get_product_group_events(
         self,
@@ -174,18 +603,29 @@ class Eventim:
         date_to: date | None = None,
         ticket_type: Literal["tickets", "vip_packages", "extras"] | None = None,
         city_name: str | None = None,
+        shard: bool = False,
+        max_workers: int = 4,
     ) -> Iterator[Dict]:
         # pylint: disable=line-too-long
-        """This returns the product_group_id events. The product_group_id events follow this schema: https://schema.org/MusicEvent.
-        The API only returns a maximum of 90 events. This should be plenty but some event types like continous musicals have more than 90 events
-        **If you try to fetching many events (>90) at a time then get_product_group_events_from_calendar() should be used.**
+        """This returns the product_group_id events. The product_group_id events follow this schema:
+        https://schema.org/MusicEvent.
+        The API only returns a maximum of 90 events. This should be plenty but some event types like continous musicals
+        have more than 90 events
+        **If you try to fetching many events (>90) at a time then get_product_group_events_from_calendar() should be
+        used or shard should be set.**
+        With shard the date range is split into smaller windows whenever a window hits the limit. The windows are
+        fetched concurrently and the events are deduplicated.
 
         Args:
             product_group_id (int): product_group_id to query
             date_from (date | None, optional): Event date later than. Defaults to None.
             date_to (date | None, optional): Event date earlier than. Defaults to None.
-            ticket_type (Literal[&quot;tickets&quot;, &quot;vip_packages&quot;, &quot;extras&quot;] | None, optional): Include only events with tickets avialible in type. Defaults to None.
+            ticket_type (Literal["tickets", "vip_packages", "extras"] | None, optional): Include only events with
+                tickets avialible in type. Defaults to None.
             city_name (str | None, optional): Include only events in city. Defaults to None.
+            shard (bool, optional): Split the date range to fetch more than 90 events. Requires date_from and date_to.
+                Defaults to False.
+            max_workers (int, optional): Number of windows fetched concurrently when sharding. Defaults to 4.
 
         Yields:
             Iterator[Dict]: The events in the MusicEvent schema.
@@ -199,19 +639,30 @@ class Eventim:
             cityname=city_name,
         )
 
-        while params.pnum <= 10:
+        if shard:
+            _check_shard_params(params)
+            yield from self._get_sharded_product_group_events(params, max_workers)
+            return
+
+        query = params.compile_query()
+        pnum = params.pnum
+        while pnum <= COMPONENT_MAX_PAGES:
             comp_result = self.html_adapter.get(
-                endpoint="component", params=params.model_dump(exclude_none=True)
+                endpoint="component", params=query.page(pnum)
             )
-            product_group_events = parse_list_from_component_html(comp_result.html_data)
+            document = HtmlDocument(comp_result.html_data)
+            product_group_events = parse_list_from_component_html(document)
+            has_next_page = parse_has_next_page_from_component_html(document)
+            # Drop the page while the consumer handles its events
+            del comp_result, document
 
             for product_group_event in product_group_events:
                 yield product_group_event
 
-            if parse_has_next_page_from_component_html(comp_result.html_data) is False:
+            if has_next_page is False:
                 break
 
-            params.pnum = params.pnum + 1
+            pnum = pnum + 1
 
     def get_product_group_events_from_calendar(
         self,
@@ -228,7 +679,8 @@ class Eventim:
             product_group_id (int): product_group_id to query
             date_from (date | None, optional): Event date later than. Defaults to None.
             date_to (date | None, optional): Event date earlier than. Defaults to None.
-            ticket_type (Literal[&quot;tickets&quot;, &quot;vip_packages&quot;, &quot;extras&quot;] | None, optional): Include only events with tickets avialible in type. Defaults to None.
+            ticket_type (Literal["tickets", "vip_packages", "extras"] | None, optional): Include only events with
+                tickets avialible in type. Defaults to None.
             city_name (str | None, optional): Include only events in city. Defaults to None.
 
         Yields:
@@ -249,6 +701,7 @@ class Eventim:
         calendar_configuration = parse_calendar_from_component_html(
             comp_result.html_data
         )
+        del comp_result
 
         calendar_content = calendar_configuration["calendar_content"]
 
@@ -256,7 +709,8 @@ class Eventim:
             yield product_group_event
 
     def get_event_seatmap_information(self, event_url: str) -> Dict | None:
-        """Given a event url like "/event/disneys-der-koenig-der-loewen-stage-theater-im-hafen-hamburg-18500464/" the function will return the seatmap information if present.
+        """Given a event url like "/event/disneys-der-koenig-der-loewen-stage-theater-im-hafen-hamburg-18500464/" the
+        function will return the seatmap information if present.
 
         Args:
             event_url (str): Event url to be checked
@@ -265,40 +719,751 @@ class Eventim:
             Dict | None: Returns the seatmap option or None if nothing was found in the html.s
         """
         # pylint: disable=line-too-long
-        event_key = event_url.split("/")[2]
-        html_result = self.html_adapter.get(endpoint=f"event/{event_key}", params=None)
+        return self._get_seatmap_information(parse_event_key_from_event_url(event_url))
+
+    def _get_seatmap_information(
+        self, event_key: str, refresh: bool = False
+    ) -> Dict | None:
+        html_result = self.html_adapter.get(
+            endpoint=f"event/{event_key}", params=None, refresh=refresh
+        )
 
-        if not parse_has_seatmap_from_event_html(html_result.html_data):
+        document = HtmlDocument(html_result.html_data)
+        if not parse_has_seatmap_from_event_html(document):
             return None
 
-        return parse_seatmap_configuration_from_event_html(html_result.html_data)
+        information = parse_seatmap_configuration_from_event_html(document)
+        _cache_seatmap_params(self.seatmap_params_cache, event_key, information)
+        return information
+
+    def get_seatmap_params(self, event_url: str, refresh: bool = False) -> Dict | None:
+        """Returns the signed params of the seatmap of an event. They are cached until their signature expires.
+
+        Args:
+            event_url (str): Event url like
+                "/event/disneys-der-koenig-der-loewen-stage-theater-im-hafen-hamburg-18500464/" or the event key.
+            refresh (bool, optional): Fetch new params even if valid ones are cached. Defaults to False.
 
-    def get_event_seatmap(self, seatmap_options: dict, parse: bool = True) -> Dict:
+        Returns:
+            Dict | None: The params or None if the event has no seatmap.
+        """
+        # pylint: disable=line-too-long
+        event_key = parse_event_key_from_event_url(event_url)
+        params = None if refresh else self.seatmap_params_cache.get(event_key)
+        if params is not None:
+            return params
+
+        information = self._get_seatmap_information(event_key, refresh=refresh)
+        if information is not None and not refresh:
+            if self.seatmap_params_cache.get(event_key) is None:
+                # The event page came from the response cache with an expired signature
+                information = self._get_seatmap_information(event_key, refresh=True)
+
+        if information is None:
+            return None
+
+        return parse_seatmap_url_params_from_seatmap_information(
+            information["seatmapOptions"]
+        )
+
+    def get_event_seatmap(
+        self,
+        seatmap_options: dict | str,
+        parse: bool = True,
+        columnar: bool = False,
+    ) -> Dict | ColumnarSeatmap | None:
         """This function gets a seatmap from the private eventim api using embeded signed links.
 
         Args:
-            seatmap_options (dict): Seatmap options taken from the get_event_seatmap_information function.
+            seatmap_options (dict | str): Seatmap options taken from the get_event_seatmap_information function or an
+                event url or key.
+                For urls and keys the signed params are cached and refreshed once if the private api rejects them with
+                401 or 403. Other errors are raised.
             parse (bool, optional): Whether to return a parsed or raw result. Defaults to True.
+            columnar (bool, optional): Return the parsed result as a ColumnarSeatmap (requires numpy). Defaults to False.
 
         Returns:
-            Dict: Result of the seatmap call. Only returns avialible seats in event. Note: Standing seats are also not included!
+            Dict | ColumnarSeatmap | None: Result of the seatmap call or None if the event has no seatmap. Only returns
+                avialible seats in event. Note: Standing seats are also not included!
         """
         # pylint: disable=line-too-long
+        if not isinstance(seatmap_options, str):
+            # Get the url via seatmap options
+            params = parse_seatmap_url_params_from_seatmap_information(
+                options=seatmap_options
+            )
+            return self._get_seatmap(params, parse=parse, columnar=columnar)
 
-        # Get the url via seatmap options
-        params = parse_seatmap_url_params_from_seatmap_information(
-            options=seatmap_options
-        )
+        params = self.get_seatmap_params(seatmap_options)
+        if params is None:
+            return None
 
+        try:
+            return self._get_seatmap(params, parse=parse, columnar=columnar)
+        except RestException as e:
+            if e.status_code not in SEATMAP_PARAMS_REJECTED_STATUSES:
+                raise
+            logger.debug("Seatmap params of %s rejected, refreshing", seatmap_options)
+
+        params = self.get_seatmap_params(seatmap_options, refresh=True)
+        if params is None:
+            return None
+
+        return self._get_seatmap(params, parse=parse, columnar=columnar)
+
+    def _get_seatmap(
+        self, params: Dict, parse: bool = True, columnar: bool = False
+    ) -> Dict | ColumnarSeatmap:
         # Fetch data
         seatmap = self.private_rest_adapter.get(
             endpoint="seatmap/api/SeatMapHandler",
             params=params,
+            # Columnar seatmaps are built from typed structs instead of dicts
+            decoder=decode_seatmap if parse and columnar else None,
         )
 
         # Export raw if desired
         if not parse:
             return seatmap.json_data
 
+        if columnar:
+            return parse_columnar_seatmap_from_api(seatmap.json_data)
+
         # Return the parsed
         return parse_seathamp_data_from_api(seatmap.json_data)
+
+
+class AsyncEventim:
+    """Class for high level functions using asyncio.
+    All adapters share a single connection pool. Use it as an async context manager or call aclose() when done.
+    """
+
+    # pylint: disable=line-too-long
+
+    def __init__(
+        self,
+        client: "httpx.AsyncClient | None" = None,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        transport: TransportConfig | None = None,
+        exploration_hostname: str = EXPLORATION_HOSTNAME,
+        private_api_hostname: str = PRIVATE_API_HOSTNAME,
+        html_hostname: str = HTML_HOSTNAME,
+        seatmap_params_cache: SeatmapParamsCache | None = None,
+        raw_html: bool = False,
+    ) -> None:
+        """
+        Args:
+            client (httpx.AsyncClient | None, optional): Client shared by all adapters. Defaults to None.
+            cache (ResponseCache | None, optional): Response cache shared by all adapters. Defaults to None.
+            retry_policy (RetryPolicy | None, optional): Retry policy of all adapters. Defaults to None (no retries).
+            rate_limiter (RateLimiter | None, optional): Rate limiter shared by all adapters. Defaults to None.
+            transport (TransportConfig | None, optional): Connection pool and timeout settings of the client if no
+                client is given. Defaults to TransportConfig().
+            exploration_hostname (str, optional): Base url of the exploration API. Defaults to EXPLORATION_HOSTNAME.
+            private_api_hostname (str, optional): Base url of the private API. Defaults to PRIVATE_API_HOSTNAME.
+            html_hostname (str, optional): Base url of the website. Defaults to HTML_HOSTNAME.
+            seatmap_params_cache (SeatmapParamsCache | None, optional): Cache of the signed seatmap params per event.
+                Defaults to SeatmapParamsCache().
+            raw_html (bool, optional): Keep html_data of the html adapter as the undecoded bytes. Pages are then parsed
+                without decoding them first. Defaults to False.
+        """
+        # pylint: disable=line-too-long
+        # A client passed in by the caller is closed by the caller
+        self._owns_client: bool = client is None
+        self.client = client or create_async_client(transport)
+        adapter_options = dict(
+            client=self.client,
+            cache=cache,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+        )
+        self.rest_adapter: AsyncRestAdapter = AsyncRestAdapter(
+            hostname=exploration_hostname, **adapter_options
+        )
+        self.private_rest_adapter: AsyncRestAdapter = AsyncRestAdapter(
+            hostname=private_api_hostname, **adapter_options
+        )
+        self.html_adapter: AsyncHtmlAdapter = AsyncHtmlAdapter(
+            hostname=html_hostname, raw=raw_html, **adapter_options
+        )
+        self.seatmap_params_cache: SeatmapParamsCache = (
+            SeatmapParamsCache()
+            if seatmap_params_cache is None
+            else seatmap_params_cache
+        )
+
+    async def __aenter__(self) -> "AsyncEventim":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Closes the shared connection pool if it was created by this instance."""
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def _get_exploration_page(
+        self, endpoint: str, query: CompiledQuery, page: int
+    ) -> RestResult:
+        return await self.rest_adapter.get(endpoint=endpoint, params=query.page(page))
+
+    async def _explore(
+        self,
+        endpoint: str,
+        result_key: str,
+        params: ExplorationParameters,
+        prefetch: int = 0,
+    ) -> AsyncIterator[Dict]:
+        """Handles the pagination of the exploration endpoints.
+        With prefetch > 0 the remaining pages are fetched as concurrent tasks once totalPages is known.
+        """
+        # pylint: disable=line-too-long
+        # Serialized once, the pages only swap the page number
+        query = params.compile_query()
+        page = params.page
+        while True:
+            rest_result = await self.rest_adapter.get(
+                endpoint=endpoint, params=query.page(page)
+            )
+
+            for item in rest_result.json_data[result_key]:
+                yield item
+
+            if (
+                page >= rest_result.json_data["totalPages"]
+                or "next" not in rest_result.json_data["_links"].keys()
+            ):
+                return
+
+            if prefetch > 0:
+                break
+
+            page = page + 1
+
+        total_pages = rest_result.json_data["totalPages"]
+        next_page = page + 1
+        pending = deque()
+        try:
+            while pending or next_page <= total_pages:
+                # Keep the window filled; results are consumed in page order
+                while next_page <= total_pages and len(pending) < prefetch:
+                    pending.append(
+                        asyncio.ensure_future(
+                            self._get_exploration_page(endpoint, query, next_page)
+                        )
+                    )
+                    next_page = next_page + 1
+
+                rest_result = await pending.popleft()
+                for item in rest_result.json_data[result_key]:
+                    yield item
+
+                if "next" not in rest_result.json_data["_links"].keys():
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def explore_attractions(
+        self,
+        search_term: str,
+        sort: Literal[
+            "DateAsc", "DateDesc", "NameAsc", "NameDesc", "Rating", "Recommendation"
+        ] = "DateAsc",
+        prefetch: int = 0,
+        typed: bool = False,
+    ) -> AsyncIterator[Dict | Attraction]:
+        """Async version of Eventim.explore_attractions().
+
+        Args:
+            search_term (str): Search term to query the API.
+            sort (Literal["DateAsc", "DateDesc", "NameAsc", "NameDesc", "Rating", "Recommendation"], optional):
+                Sorted by. Defaults to "DateAsc".
+            prefetch (int, optional): Number of pages fetched concurrently once the first page reported totalPages.
+                Items are still yielded in page order. Defaults to 0 (sequential).
+            typed (bool, optional): Yield Attraction records with typed fields instead of dicts. Defaults to False.
+
+        Yields:
+            AsyncIterator[Dict]: Async iterator that returns one item at the time and handles the pagination of eventim.
+        """
+        params = ExplorationParameters(
+            search_term=search_term,
+            sort=sort,
+            page=1,
+        )
+
+        async for attraction in self._explore(
+            endpoint="v1/attractions",
+            result_key="attractions",
+            params=params,
+            prefetch=prefetch,
+        ):
+            yield Attraction(attraction) if typed else attraction
+
+    async def explore_locations(
+        self,
+        search_term: str,
+        sort: Literal[
+            "DateAsc", "DateDesc", "NameAsc", "NameDesc", "Rating", "Recommendation"
+        ] = "DateAsc",
+        prefetch: int = 0,
+        typed: bool = False,
+    ) -> AsyncIterator[Dict | Location]:
+        """Async version of Eventim.explore_locations().
+
+        Args:
+            search_term (str): Search term to query the API.
+            sort (Literal["DateAsc", "DateDesc", "NameAsc", "NameDesc", "Rating", "Recommendation"], optional):
+                Sorted by. Defaults to "DateAsc".
+            prefetch (int, optional): Number of pages fetched concurrently once the first page reported totalPages.
+                Items are still yielded in page order. Defaults to 0 (sequential).
+            typed (bool, optional): Yield Location records with typed fields instead of dicts. Defaults to False.
+
+        Yields:
+            AsyncIterator[Dict]: Async iterator that returns one item at the time and handles the pagination of eventim.
+        """
+        params = ExplorationParameters(
+            search_term=search_term,
+            sort=sort,
+            page=1,
+        )
+
+        async for location in self._explore(
+            endpoint="v1/locations",
+            result_key="locations",
+            params=params,
+            prefetch=prefetch,
+        ):
+            yield Location(location) if typed else location
+
+    async def explore_product_groups(
+        self,
+        search_term: str | None = None,
+        categories: List[str] | None = None,
+        city_ids: List[int] | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        time_from: time | None = None,
+        time_to: time | None = None,
+        sort: Literal[
+            "DateAsc", "DateDesc", "NameAsc", "NameDesc", "Rating", "Recommendation"
+        ] = "DateAsc",
+        prefetch: int = 0,
+        typed: bool = False,
+    ) -> AsyncIterator[Dict | ProductGroup]:
+        """Async version of Eventim.explore_product_groups().
+
+        Args:
+            search_term (str | None, optional): Search term to query the API.. Defaults to None.
+            categories (List[str] | None, optional): Categories to limit the search. Defaults to None.
+            city_ids (List[int] | None, optional): Cities to limit the search. Defaults to None.
+            date_from (date | None, optional): Product date later than. Defaults to None.
+            date_to (date | None, optional): Product date earlier than. Defaults to None.
+            time_from (time | None, optional): Start time of product later than. Defaults to None.
+            time_to (time | None, optional): Start time of product earlier than. Defaults to None.
+            sort (Literal["DateAsc", "DateDesc", "NameAsc", "NameDesc", "Rating", "Recommendation"], optional):
+                Sorted by. Defaults to "DateAsc".
+            prefetch (int, optional): Number of pages fetched concurrently once the first page reported totalPages.
+                Items are still yielded in page order. Defaults to 0 (sequential).
+            typed (bool, optional): Yield ProductGroup records with typed fields instead of dicts. Defaults to False.
+
+        Yields:
+            AsyncIterator[Dict]: Async iterator that returns one item at the time and handles the pagination of eventim.
+        """
+        params = ExplorationParameters(
+            search_term=search_term,
+            categories=categories,
+            city_ids=city_ids,
+            date_from=date_from,
+            date_to=date_to,
+            time_from=time_from,
+            time_to=time_to,
+            sort=sort,
+            page=1,
+        )
+
+        async for product_group in self._explore(
+            endpoint="v2/productGroups",
+            result_key="productGroups",
+            params=params,
+            prefetch=prefetch,
+        ):
+            yield ProductGroup(product_group) if typed else product_group
+
+    async def explore(
+        self,
+        params: ExplorationParameters,
+        kind: Literal["product_groups", "attractions", "locations"] = "product_groups",
+        prefetch: int = 0,
+    ) -> AsyncIterator[Dict]:
+        """Async version of Eventim.explore().
+
+        Args:
+            params (ExplorationParameters): Query to run. Pagination starts at its page. It is not modified.
+            kind (Literal["product_groups", "attractions", "locations"], optional): Exploration endpoint to query.
+                Defaults to "product_groups".
+            prefetch (int, optional): Number of pages fetched concurrently once the first page reported totalPages.
+                Defaults to 0 (sequential).
+
+        Raises:
+            ValueError: Raised if kind is invalid.
+
+        Yields:
+            AsyncIterator[Dict]: Items of all pages.
+        """
+        endpoint, result_key, _ = _get_exploration_kind(kind)
+        async for item in self._explore(
+            endpoint, result_key, params, prefetch=prefetch
+        ):
+            yield item
+
+    async def explore_batch(
+        self,
+        queries: List[ExplorationParameters],
+        kind: Literal["product_groups", "attractions", "locations"] = "product_groups",
+        max_workers: int = 4,
+        dedupe: bool = True,
+    ) -> AsyncIterator[ExplorationBatchItem]:
+        # pylint: disable=line-too-long
+        """Async version of Eventim.explore_batch(). At most max_workers queries run as concurrent tasks.
+
+        Args:
+            queries (List[ExplorationParameters]): Queries to run. Pagination starts at the page of each query.
+            kind (Literal["product_groups", "attractions", "locations"], optional): Exploration endpoint to query.
+                Defaults to "product_groups".
+            max_workers (int, optional): Queries running at the same time. Defaults to 4.
+            dedupe (bool, optional): Yield every entity id once. Defaults to True.
+
+        Raises:
+            ValueError: Raised if kind or max_workers is invalid.
+
+        Yields:
+            AsyncIterator[ExplorationBatchItem]: Entities in the order they arrive. query_indices is extended when later
+                queries return the entity again and is complete once the iterator is exhausted.
+        """
+        endpoint, result_key, id_field = _check_batch_args(kind, max_workers)
+        deduplicator = _BatchDeduplicator(id_field, dedupe, len(queries))
+        results: asyncio.Queue = asyncio.Queue(maxsize=max_workers * 64)
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def run(index: int, params: ExplorationParameters) -> None:
+            async with semaphore:
+                try:
+                    async for item in self._explore(endpoint, result_key, params):
+                        await results.put((index, item, None))
+                    await results.put((index, _BATCH_DONE, None))
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    await results.put((index, _BATCH_DONE, e))
+
+        tasks = [
+            asyncio.ensure_future(run(index, params))
+            for index, params in enumerate(queries)
+        ]
+        try:
+            while deduplicator.remaining:
+                batch_item = deduplicator.receive(*await results.get())
+                if batch_item is not None:
+                    yield batch_item
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _get_component_window(
+        self, params: ComponentParameters, splittable: bool
+    ) -> Tuple[List[Dict], bool]:
+        """Async version of Eventim._get_component_window()."""
+        events = []
+        query = params.compile_query()
+        pnum = params.pnum
+        while True:
+            comp_result = await self.html_adapter.get(
+                endpoint="component", params=query.page(pnum)
+            )
+            document = HtmlDocument(comp_result.html_data)
+            pagination = parse_pagination_from_component_html(document)
+            truncated = pagination is not None and pagination[1] >= COMPONENT_MAX_PAGES
+
+            if truncated and splittable:
+                return [], True
+
+            events.extend(parse_list_from_component_html(document))
+
+            if (
+                pagination is None
+                or pagination[0] >= pagination[1]
+                or pnum >= COMPONENT_MAX_PAGES
+            ):
+                return events, truncated
+
+            pnum = pnum + 1
+
+    async def _get_sharded_product_group_events(
+        self, params: ComponentParameters, max_workers: int
+    ) -> AsyncIterator[Dict]:
+        seen = set()
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def fetch(window_params: ComponentParameters, splittable: bool):
+            async with semaphore:
+                return await self._get_component_window(window_params, splittable)
+
+        def submit(start: date, end: date):
+            window_params = params.model_copy(
+                update={"startdate": start, "enddate": end, "pnum": 1}
+            )
+            return (
+                start,
+                end,
+                asyncio.ensure_future(fetch(window_params, start < end)),
+            )
+
+        windows = deque([submit(params.startdate, params.enddate)])
+        try:
+            while windows:
+                start, end, task = windows.popleft()
+                events, truncated = await task
+
+                if truncated and start < end:
+                    windows.extendleft(
+                        reversed([submit(*x) for x in _split_date_window(start, end)])
+                    )
+                    continue
+
+                if truncated:
+                    logger.warning(
+                        f"Events of {params.esid} on {start} exceed the page limit"
+                    )
+
+                for event in events:
+                    identity = _get_event_identity(event)
+                    if identity not in seen:
+                        seen.add(identity)
+                        yield event
+        finally:
+            for _, _, task in windows:
+                task.cancel()
+
+    async def get_product_group_events(
+        self,
+        product_group_id: int,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        ticket_type: Literal["tickets", "vip_packages", "extras"] | None = None,
+        city_name: str | None = None,
+        shard: bool = False,
+        max_workers: int = 4,
+    ) -> AsyncIterator[Dict]:
+        """Async version of Eventim.get_product_group_events().
+
+        Args:
+            product_group_id (int): product_group_id to query
+            date_from (date | None, optional): Event date later than. Defaults to None.
+            date_to (date | None, optional): Event date earlier than. Defaults to None.
+            ticket_type (Literal["tickets", "vip_packages", "extras"] | None, optional): Include only events with
+                tickets avialible in type. Defaults to None.
+            city_name (str | None, optional): Include only events in city. Defaults to None.
+            shard (bool, optional): Split the date range to fetch more than 90 events. Requires date_from and date_to.
+                Defaults to False.
+            max_workers (int, optional): Number of windows fetched concurrently when sharding. Defaults to 4.
+
+        Yields:
+            AsyncIterator[Dict]: The events in the MusicEvent schema.
+        """
+        params = ComponentParameters(
+            esid=product_group_id,
+            startdate=date_from,
+            enddate=date_to,
+            ptype=ticket_type,
+            cityname=city_name,
+        )
+
+        if shard:
+            _check_shard_params(params)
+            async for product_group_event in self._get_sharded_product_group_events(
+                params, max_workers
+            ):
+                yield product_group_event
+            return
+
+        query = params.compile_query()
+        pnum = params.pnum
+        while pnum <= COMPONENT_MAX_PAGES:
+            comp_result = await self.html_adapter.get(
+                endpoint="component", params=query.page(pnum)
+            )
+            document = HtmlDocument(comp_result.html_data)
+            product_group_events = parse_list_from_component_html(document)
+            has_next_page = parse_has_next_page_from_component_html(document)
+            # Drop the page while the consumer handles its events
+            del comp_result, document
+
+            for product_group_event in product_group_events:
+                yield product_group_event
+
+            if has_next_page is False:
+                break
+
+            pnum = pnum + 1
+
+    async def get_product_group_events_from_calendar(
+        self,
+        product_group_id: int,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        ticket_type: Literal["tickets", "vip_packages", "extras"] | None = None,
+        city_name: str | None = None,
+    ) -> AsyncIterator[Dict]:
+        """Async version of Eventim.get_product_group_events_from_calendar().
+
+        Args:
+            product_group_id (int): product_group_id to query
+            date_from (date | None, optional): Event date later than. Defaults to None.
+            date_to (date | None, optional): Event date earlier than. Defaults to None.
+            ticket_type (Literal["tickets", "vip_packages", "extras"] | None, optional): Include only events with
+                tickets avialible in type. Defaults to None.
+            city_name (str | None, optional): Include only events in city. Defaults to None.
+
+        Yields:
+            AsyncIterator[Dict]: The events in a calendar schema.
+        """
+        params = ComponentParameters(
+            esid=product_group_id,
+            startdate=date_from,
+            enddate=date_to,
+            ptype=ticket_type,
+            cityname=city_name,
+        )
+
+        comp_result = await self.html_adapter.get(
+            endpoint="component", params=params.model_dump(exclude_none=True)
+        )
+
+        calendar_configuration = parse_calendar_from_component_html(
+            comp_result.html_data
+        )
+        del comp_result
+
+        for product_group_event in calendar_configuration["calendar_content"]["result"]:
+            yield product_group_event
+
+    async def get_event_seatmap_information(self, event_url: str) -> Dict | None:
+        """Async version of Eventim.get_event_seatmap_information().
+
+        Args:
+            event_url (str): Event url to be checked
+
+        Returns:
+            Dict | None: Returns the seatmap option or None if nothing was found in the html.
+        """
+        return await self._get_seatmap_information(
+            parse_event_key_from_event_url(event_url)
+        )
+
+    async def _get_seatmap_information(
+        self, event_key: str, refresh: bool = False
+    ) -> Dict | None:
+        html_result = await self.html_adapter.get(
+            endpoint=f"event/{event_key}", params=None, refresh=refresh
+        )
+
+        document = HtmlDocument(html_result.html_data)
+        if not parse_has_seatmap_from_event_html(document):
+            return None
+
+        information = parse_seatmap_configuration_from_event_html(document)
+        _cache_seatmap_params(self.seatmap_params_cache, event_key, information)
+        return information
+
+    async def get_seatmap_params(
+        self, event_url: str, refresh: bool = False
+    ) -> Dict | None:
+        """Async version of Eventim.get_seatmap_params().
+
+        Args:
+            event_url (str): Event url or event key.
+            refresh (bool, optional): Fetch new params even if valid ones are cached. Defaults to False.
+
+        Returns:
+            Dict | None: The params or None if the event has no seatmap.
+        """
+        event_key = parse_event_key_from_event_url(event_url)
+        params = None if refresh else self.seatmap_params_cache.get(event_key)
+        if params is not None:
+            return params
+
+        information = await self._get_seatmap_information(event_key, refresh=refresh)
+        if information is not None and not refresh:
+            if self.seatmap_params_cache.get(event_key) is None:
+                # The event page came from the response cache with an expired signature
+                information = await self._get_seatmap_information(
+                    event_key, refresh=True
+                )
+
+        if information is None:
+            return None
+
+        return parse_seatmap_url_params_from_seatmap_information(
+            information["seatmapOptions"]
+        )
+
+    async def get_event_seatmap(
+        self,
+        seatmap_options: dict | str,
+        parse: bool = True,
+        columnar: bool = False,
+    ) -> Dict | ColumnarSeatmap | None:
+        """Async version of Eventim.get_event_seatmap().
+
+        Args:
+            seatmap_options (dict | str): Seatmap options taken from the get_event_seatmap_information function or an
+                event url or key.
+            parse (bool, optional): Whether to return a parsed or raw result. Defaults to True.
+            columnar (bool, optional): Return the parsed result as a ColumnarSeatmap (requires numpy). Defaults to False.
+
+        Returns:
+            Dict | ColumnarSeatmap | None: Result of the seatmap call or None if the event has no seatmap. Only returns
+                avialible seats in event. Note: Standing seats are also not included!
+        """
+        if not isinstance(seatmap_options, str):
+            params = parse_seatmap_url_params_from_seatmap_information(
+                options=seatmap_options
+            )
+            return await self._get_seatmap(params, parse=parse, columnar=columnar)
+
+        params = await self.get_seatmap_params(seatmap_options)
+        if params is None:
+            return None
+
+        try:
+            return await self._get_seatmap(params, parse=parse, columnar=columnar)
+        except RestException as e:
+            if e.status_code not in SEATMAP_PARAMS_REJECTED_STATUSES:
+                raise
+            logger.debug("Seatmap params of %s rejected, refreshing", seatmap_options)
+
+        params = await self.get_seatmap_params(seatmap_options, refresh=True)
+        if params is None:
+            return None
+
+        return await self._get_seatmap(params, parse=parse, columnar=columnar)
+
+    async def _get_seatmap(
+        self, params: Dict, parse: bool = True, columnar: bool = False
+    ) -> Dict | ColumnarSeatmap:
+        seatmap = await self.private_rest_adapter.get(
+            endpoint="seatmap/api/SeatMapHandler",
+            params=params,
+            # Columnar seatmaps are built from typed structs instead of dicts
+            decoder=decode_seatmap if parse and columnar else None,
+        )
+
+        if not parse:
+            return seatmap.json_data
+
+        if columnar:
+            return parse_columnar_seatmap_from_api(seatmap.json_data)
+
+        return parse_seathamp_data_from_api(seatmap.json_data)
@@ -4,6 +4,19 @@
 class RestException(Exception):
     """Raised if the Rest Adatper returns an error."""
 
+    def __init__(self, message: str, status_code: int | None = None) -> None:
+        """
+        Args:
+            message (str): Error message.
+            status_code (int | None, optional): Status code of the response. Defaults to None (no response).
+        """
+        super().__init__(message)
+        self.status_code: int | None = status_code
+
 
 class HtmlException(Exception):
     """Raised if the Component Adatper returns an error."""
+
+
+class ReplayException(Exception):
+    """Raised if no recorded response matches a request in replay mode."""
@@ -0,0 +1,463 @@
+"""Streaming export of pyventim iterators to NDJSON, CSV and Parquet files with bounded memory."""
+
+import csv
+import itertools
+import json
+import logging
+import pathlib
+from typing import IO, Any, Dict, Iterable, Iterator, List, Literal, Tuple
+
+from .seatmap import ColumnarSeatmap
+
+# pyarrow is imported by the parquet writer on first use to keep `import pyventim` fast
+pa = None  # pylint: disable=invalid-name
+pq = None  # pylint: disable=invalid-name
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 10000
+
+# Records the parquet writer holds back at most while columns are still empty
+DEFAULT_INFER_ROWS = 100000
+
+# Column -> dotted path into the record, e.g. {"city": "location.city"}
+Schema = Dict[str, str]
+
+
+def _require_pyarrow() -> None:
+    global pa, pq  # pylint: disable=global-statement,invalid-name
+    if pa is None:
+        try:
+            import pyarrow as _pa  # pylint: disable=import-outside-toplevel
+            import pyarrow.parquet as _pq  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ImportError(
+                "The parquet export requires pyarrow. Install it with `pip install pyventim[parquet]`."
+            ) from e
+        pa, pq = _pa, _pq
+
+
+def _to_record(value: Any) -> Dict[str, Any]:
+    """Converts the items of pyventim iterators into dicts."""
+    if isinstance(value, dict):
+        return value
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+
+    raise TypeError(f"Cannot export {type(value).__name__}")
+
+
+def _to_scalar(value: Any) -> Any:
+    """Lists and dicts are stored as JSON text in flat formats."""
+    if isinstance(value, (list, tuple, dict)):
+        return json.dumps(value, ensure_ascii=False, default=str)
+
+    return value
+
+
+def flatten_record(
+    record: Dict[str, Any], separator: str = ".", prefix: str = ""
+) -> Dict[str, Any]:
+    """Flattens nested dicts into one level. Lists are kept as JSON text.
+
+    Args:
+        record (Dict[str, Any]): Record to flatten
+        separator (str, optional): Separator of the nested keys. Defaults to ".".
+        prefix (str, optional): Prefix of all keys. Defaults to "".
+
+    Returns:
+        Dict[str, Any]: The flat record, e.g. {"location": {"city": "Hamburg"}} -> {"location.city": "Hamburg"}.
+    """
+    flat = {}
+    for key, value in record.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict) and value:
+            flat.update(flatten_record(value, separator, name + separator))
+        else:
+            flat[name] = _to_scalar(value)
+
+    return flat
+
+
+def _compile_schema(schema: Schema) -> List[Tuple[str, Tuple[str, ...]]]:
+    return [(column, tuple(path.split("."))) for column, path in schema.items()]
+
+
+def _get_path(record: Any, path: Tuple[str, ...]) -> Any:
+    for key in path:
+        if isinstance(record, dict):
+            record = record.get(key)
+        elif isinstance(record, list) and key.isdigit() and int(key) < len(record):
+            record = record[int(key)]
+        else:
+            return None
+
+    return record
+
+
+def iter_flat_records(
+    records: Iterable[Any], schema: Schema | None = None, separator: str = "."
+) -> Iterator[Dict[str, Any]]:
+    """Lazily flattens records. With a schema only its columns are extracted.
+
+    Args:
+        records (Iterable[Any]): Dicts, pydantic models or objects with to_dict().
+        schema (Schema | None, optional): Column -> dotted source path. List items are addressed by index,
+            e.g. "products.0.name". Defaults to None (flatten everything).
+        separator (str, optional): Separator of nested keys without a schema. Defaults to ".".
+
+    Yields:
+        Iterator[Dict[str, Any]]: Flat records.
+    """
+    # pylint: disable=line-too-long
+    if schema is None:
+        for record in records:
+            yield flatten_record(_to_record(record), separator)
+        return
+
+    compiled = _compile_schema(schema)
+    for record in records:
+        record = _to_record(record)
+        yield {column: _to_scalar(_get_path(record, path)) for column, path in compiled}
+
+
+def iter_chunks(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Splits an iterable into lists of at most size items.
+
+    Args:
+        iterable (Iterable[Any]): Items to split
+        size (int): Maximum items per chunk
+
+    Yields:
+        Iterator[List[Any]]: The chunks.
+    """
+    if size < 1:
+        raise ValueError("size must be at least 1")
+
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_seat_rows(
+    seatmap: Dict[str, Any] | ColumnarSeatmap,
+) -> Iterator[Dict[str, Any]]:
+    """Yields one flat row per seat of a parsed seatmap.
+
+    Args:
+        seatmap (Dict[str, Any] | ColumnarSeatmap): Seatmap returned by get_event_seatmap() or parse_seathamp_data_from_api().
+
+    Yields:
+        Iterator[Dict[str, Any]]: Seat rows with seatmap key, block, row, seat, price category and coordinates.
+    """
+    # pylint: disable=line-too-long
+    if isinstance(seatmap, ColumnarSeatmap):
+        seatmap_key = seatmap.meta["seatmap_key"]
+        seatmap_timestamp = seatmap.meta["seatmap_timestamp"]
+        seats = zip(
+            seatmap.seat_block_index.tolist(),
+            seatmap.seat_row_index.tolist(),
+            seatmap.seat_code.tolist(),
+            seatmap.seat_price_category_index.tolist(),
+            seatmap.seat_x.tolist(),
+            seatmap.seat_y.tolist(),
+        )
+        for index, (block_index, row_index, code, category, x, y) in enumerate(seats):
+            yield dict(
+                seatmap_key=seatmap_key,
+                seatmap_timestamp=seatmap_timestamp,
+                block_id=seatmap.block_ids[block_index],
+                block_name=seatmap.block_names[block_index],
+                row_code=seatmap.row_codes[row_index],
+                seat_index=index,
+                seat_code=code,
+                price_category_id=_get_price_category(
+                    seatmap.price_category_ids, category
+                ),
+                seat_coordinate_x=x,
+                seat_coordinate_y=y,
+            )
+        return
+
+    price_category_ids = [x["price_category_id"] for x in seatmap["price_categories"]]
+    index = 0
+    for block in seatmap["blocks"]:
+        for row in block["block_rows"]:
+            for seat in row["row_seats"]:
+                yield dict(
+                    seatmap_key=seatmap["seatmap_key"],
+                    seatmap_timestamp=seatmap["seatmap_timestamp"],
+                    block_id=block["block_id"],
+                    block_name=block["block_name"],
+                    row_code=row["row_code"],
+                    seat_index=index,
+                    seat_code=seat["seat_code"],
+                    price_category_id=_get_price_category(
+                        price_category_ids, seat["seat_price_category_index"]
+                    ),
+                    seat_coordinate_x=seat["seat_coordinate_x"],
+                    seat_coordinate_y=seat["seat_coordinate_y"],
+                )
+                index = index + 1
+
+
+def _get_price_category(price_category_ids: List[str], index: int) -> str | None:
+    return price_category_ids[index] if 0 <= index < len(price_category_ids) else None
+
+
+class RecordWriter:
+    """Base class of the streaming writers. Records are written chunk by chunk, so memory is bounded by the chunk size."""
+
+    def __init__(self, path: str | pathlib.Path | IO) -> None:
+        self.path = path
+        self.rows: int = 0
+        self._file: IO | None = None
+
+    def __enter__(self) -> "RecordWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _open(self, mode: str, **kwargs) -> IO:
+        if self._file is None:
+            if isinstance(self.path, (str, pathlib.Path)):
+                self._file = open(self.path, mode, **kwargs)  # pylint: disable=R1732
+            else:
+                self._file = self.path
+
+        return self._file
+
+    def write_chunk(self, records: List[Dict[str, Any]]) -> None:
+        """Writes a list of records.
+
+        Args:
+            records (List[Dict[str, Any]]): Records of one chunk.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Flushes and closes the file if the writer opened it."""
+        if self._file is not None and isinstance(self.path, (str, pathlib.Path)):
+            self._file.close()
+        self._file = None
+
+
+class NdjsonWriter(RecordWriter):
+    """Writes one JSON document per line. Records keep their nesting unless they were flattened."""
+
+    def write_chunk(self, records: List[Dict[str, Any]]) -> None:
+        file = self._open("w", encoding="utf-8")
+        file.write(
+            "".join(
+                json.dumps(x, ensure_ascii=False, default=str) + "\n" for x in records
+            )
+        )
+        self.rows = self.rows + len(records)
+
+
+class CsvWriter(RecordWriter):
+    """Writes flat records to CSV. The columns are taken from the schema or the first chunk."""
+
+    def __init__(
+        self, path: str | pathlib.Path | IO, columns: List[str] | None = None
+    ) -> None:
+        """
+        Args:
+            path (str | pathlib.Path | IO): Path or text file.
+            columns (List[str] | None, optional): Columns of the file. Defaults to the keys of the first chunk.
+        """
+        super().__init__(path)
+        self.columns: List[str] | None = columns
+        self._writer: csv.DictWriter | None = None
+        self._warned: bool = False
+
+    def write_chunk(self, records: List[Dict[str, Any]]) -> None:
+        if self._writer is None:
+            if self.columns is None:
+                self.columns = list(dict.fromkeys(x for y in records for x in y))
+            file = self._open("w", encoding="utf-8", newline="")
+            self._writer = csv.DictWriter(
+                file, fieldnames=self.columns, extrasaction="ignore"
+            )
+            self._writer.writeheader()
+
+        if not self._warned and any(
+            x.keys() - self._writer.fieldnames for x in records
+        ):
+            logger.warning("Dropping columns that were not in the first chunk")
+            self._warned = True
+
+        self._writer.writerows(records)
+        self.rows = self.rows + len(records)
+
+
+class ParquetWriter(RecordWriter):
+    """Writes flat records to Parquet with one row group per chunk. Requires pyarrow.
+
+    Unless a schema is given it is inferred from the first chunks. Chunks are held back until every column has a
+    type or infer_rows records are waiting, and the column types of those chunks are unified. Columns that are still
+    empty then are stored as strings. Columns that first appear after the schema is fixed are dropped with a warning.
+    """
+
+    def __init__(
+        self,
+        path: str | pathlib.Path | IO,
+        schema: "pa.Schema | None" = None,
+        infer_rows: int = DEFAULT_INFER_ROWS,
+    ) -> None:
+        """
+        Args:
+            path (str | pathlib.Path | IO): Path or binary file.
+            schema (pa.Schema | None, optional): Arrow schema of the file. Defaults to the schema of the first chunks.
+            infer_rows (int, optional): Records held back at most to infer the schema. Defaults to DEFAULT_INFER_ROWS.
+        """
+        _require_pyarrow()
+        super().__init__(path)
+        self.schema: pa.Schema | None = schema
+        self.infer_rows: int = infer_rows
+        self._writer: pq.ParquetWriter | None = None
+        self._pending: List[List[Dict[str, Any]]] = []
+        self._pending_rows: int = 0
+        self._inferred: pa.Schema | None = None
+        self._warned: bool = False
+
+    def write_chunk(self, records: List[Dict[str, Any]]) -> None:
+        if self.schema is not None:
+            self._write(records)
+            return
+
+        inferred = pa.Table.from_pylist(records).schema
+        try:
+            self._inferred = (
+                inferred
+                if self._inferred is None
+                else pa.unify_schemas(
+                    [self._inferred, inferred], promote_options="permissive"
+                )
+            )
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            raise ValueError(
+                f"The column types of the chunks do not match, pass a schema: {e}"
+            ) from e
+
+        self._pending.append(records)
+        self._pending_rows = self._pending_rows + len(records)
+        if self._pending_rows >= self.infer_rows or not any(
+            pa.types.is_null(x.type) for x in self._inferred
+        ):
+            self._write_pending()
+
+    def _write_pending(self) -> None:
+        self.schema = pa.schema(
+            [
+                pa.field(x.name, pa.string()) if pa.types.is_null(x.type) else x
+                for x in self._inferred
+            ]
+        )
+        pending, self._pending = self._pending, []
+        for records in pending:
+            self._write(records)
+
+    def _write(self, records: List[Dict[str, Any]]) -> None:
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.path, self.schema)
+
+        if not self._warned:
+            columns = set(self.schema.names)
+            if any(x.keys() - columns for x in records):
+                logger.warning("Dropping columns that are not in the parquet schema")
+                self._warned = True
+
+        try:
+            table = pa.Table.from_pylist(records, schema=self.schema)
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            raise ValueError(
+                f"Records do not match the parquet schema, pass a schema with the column types: {e}"
+            ) from e
+
+        self._writer.write_table(table, row_group_size=len(records))
+        self.rows = self.rows + len(records)
+
+    def close(self) -> None:
+        if self._pending:
+            self._write_pending()
+
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+def _get_format(path: str | pathlib.Path | IO, file_format: str | None) -> str:
+    if file_format is not None:
+        return file_format
+
+    suffix = pathlib.Path(str(getattr(path, "name", path))).suffix.lower()
+    formats = {
+        ".ndjson": "ndjson",
+        ".jsonl": "ndjson",
+        ".csv": "csv",
+        ".parquet": "parquet",
+    }
+    if suffix not in formats:
+        raise ValueError(f"Cannot detect the format of {path!r}, pass file_format")
+
+    return formats[suffix]
+
+
+def export(
+    records: Iterable[Any],
+    path: str | pathlib.Path | IO,
+    file_format: Literal["ndjson", "csv", "parquet"] | None = None,
+    schema: Schema | None = None,
+    flatten: bool | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """Streams records of any pyventim iterator into a file chunk by chunk.
+
+    Args:
+        records (Iterable[Any]): Dicts, pydantic models or objects with to_dict(),
+            e.g. the iterator of explore_product_groups() or iter_seat_rows().
+        path (str | pathlib.Path | IO): Path or file object. Parquet needs a binary file.
+        file_format (Literal["ndjson", "csv", "parquet"] | None, optional): Format of the file.
+            Defaults to the file suffix.
+        schema (Schema | None, optional): Column -> dotted source path of the exported columns. Defaults to None (all fields).
+        flatten (bool | None, optional): Flatten nested records. Defaults to False for NDJSON and True otherwise.
+        chunk_size (int, optional): Records held in memory at once. Defaults to 10000.
+
+    Raises:
+        ValueError: Raised if the format is unknown.
+        ImportError: Raised if the parquet format is used without pyarrow.
+
+    Returns:
+        int: Number of written records.
+    """
+    # pylint: disable=line-too-long,too-many-arguments
+    file_format = _get_format(path, file_format)
+    if flatten is None:
+        flatten = file_format != "ndjson"
+
+    if schema is not None or flatten:
+        records = iter_flat_records(records, schema)
+    else:
+        records = (_to_record(x) for x in records)
+
+    if file_format == "ndjson":
+        writer = NdjsonWriter(path)
+    elif file_format == "csv":
+        writer = CsvWriter(path, columns=list(schema) if schema is not None else None)
+    elif file_format == "parquet":
+        writer = ParquetWriter(path)
+    else:
+        raise ValueError(f"Unknown format {file_format!r}")
+
+    with writer:
+        for chunk in iter_chunks(records, chunk_size):
+            writer.write_chunk(chunk)
+
+    return writer.rows
@@ -0,0 +1,136 @@
+"""Pluggable JSON decoding. Uses orjson or msgspec when installed and falls back to the standard library."""
+
+import importlib.util
+import json
+from typing import Any, Callable, Dict, Tuple, Type
+
+# orjson and msgspec are imported on first use to keep importing the adapters fast
+orjson = None  # pylint: disable=invalid-name
+msgspec = None  # pylint: disable=invalid-name
+
+# In order of preference
+BACKENDS: Tuple[str, ...] = ("orjson", "msgspec", "json")
+
+# Every backend raises a subclass of ValueError on invalid documents
+DECODE_ERRORS: Tuple[Type[Exception], ...] = (ValueError,)
+
+_decoders: Dict[type, Any] = {}
+
+
+def _require_orjson() -> None:
+    global orjson  # pylint: disable=global-statement,invalid-name
+    if orjson is None:
+        try:
+            import orjson as _orjson  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ImportError(
+                "The orjson backend requires `pip install orjson`."
+            ) from e
+        orjson = _orjson
+
+
+def _require_msgspec() -> None:
+    global msgspec  # pylint: disable=global-statement,invalid-name
+    if msgspec is None:
+        try:
+            import msgspec as _msgspec  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ImportError(
+                "Typed decoding requires msgspec. Install it with `pip install pyventim[json]`."
+            ) from e
+        msgspec = _msgspec
+
+
+def is_installed(backend: str) -> bool:
+    """Checks if a backend can be used without importing it.
+
+    Args:
+        backend (str): One of BACKENDS.
+
+    Returns:
+        bool: True if the backend is installed.
+    """
+    return backend == "json" or importlib.util.find_spec(backend) is not None
+
+
+def _get_loads(backend: str) -> Callable[[bytes | str], Any]:
+    if backend == "orjson":
+        _require_orjson()
+        return orjson.loads
+
+    if backend == "msgspec":
+        _require_msgspec()
+        return msgspec.json.Decoder().decode
+
+    if backend == "json":
+        return json.loads
+
+    raise ValueError(f"backend must be one of {BACKENDS}, got {backend!r}")
+
+
+def _get_default_backend() -> str:
+    return next(x for x in BACKENDS if is_installed(x))
+
+
+def _loads_default(data: bytes | str) -> Any:
+    # Selects the default backend on the first document
+    set_backend()
+    return _loads(data)
+
+
+_backend: str | None = None
+_loads: Callable[[bytes | str], Any] = _loads_default
+
+
+def get_backend() -> str:
+    """Returns the name of the active backend.
+
+    Returns:
+        str: One of BACKENDS.
+    """
+    if _backend is None:
+        set_backend()
+
+    return _backend
+
+
+def set_backend(backend: str | None = None) -> None:
+    """Selects the backend used by the adapters and html parsers.
+
+    Args:
+        backend (str | None, optional): One of BACKENDS. Defaults to None (fastest installed backend).
+    """
+    global _backend, _loads  # pylint: disable=global-statement
+    backend = backend or _get_default_backend()
+    _loads = _get_loads(backend)
+    _backend = backend
+
+
+def loads(data: bytes | str) -> Any:
+    """Decodes a JSON document with the active backend.
+
+    Args:
+        data (bytes | str): UTF-8 encoded or text JSON document.
+
+    Returns:
+        Any: The decoded document.
+    """
+    return _loads(data)
+
+
+def decode(data: bytes | str, type: type) -> Any:  # pylint: disable=redefined-builtin
+    """Decodes a JSON document straight into typed objects like msgspec structs (requires msgspec).
+
+    Args:
+        data (bytes | str): UTF-8 encoded or text JSON document.
+        type (type): Target type, e.g. a msgspec.Struct subclass.
+
+    Returns:
+        Any: The decoded objects.
+    """
+    _require_msgspec()
+    decoder = _decoders.get(type)
+    if decoder is None:
+        decoder = _decoders[type] = msgspec.json.Decoder(type)
+
+    return decoder.decode(data)
@@ -0,0 +1,438 @@
+"""Instrumentation events of the adapters and parsers, an in-process aggregator and an OpenMetrics exporter."""
+
+import functools
+import logging
+import math
+import re
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Tuple
+
+from .cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+_listeners: List[Callable[[Any], None]] = []
+_VERSION_SEGMENT = re.compile(r"^v\d+$")
+
+DEFAULT_QUANTILES: Tuple[float, ...] = (0.5, 0.9, 0.99)
+
+
+class RequestEvent:
+    """Emitted by the adapters once per request.
+
+    Timings are in seconds. total covers the whole call including rate limiter waits, retries and decoding.
+    ttfb is the time from sending the last attempt until its headers arrived. connect (including DNS) and tls
+    are only known to the async adapters; the sync adapters report None.
+    """
+
+    # pylint: disable=too-many-instance-attributes,too-many-arguments
+
+    __slots__ = (
+        "adapter",
+        "method",
+        "hostname",
+        "endpoint",
+        "params_fingerprint",
+        "status_code",
+        "size",
+        "retries",
+        "cached",
+        "error",
+        "connect",
+        "tls",
+        "ttfb",
+        "decode",
+        "total",
+    )
+
+    def __init__(
+        self,
+        adapter: str,
+        method: str,
+        hostname: str,
+        endpoint: str,
+        params_fingerprint: str,
+        status_code: int | None = None,
+        size: int | None = None,
+        retries: int | None = None,
+        cached: bool = False,
+        error: str | None = None,
+        connect: float | None = None,
+        tls: float | None = None,
+        ttfb: float | None = None,
+        decode: float | None = None,
+        total: float = 0.0,
+    ) -> None:
+        self.adapter: str = adapter
+        self.method: str = method
+        self.hostname: str = hostname
+        self.endpoint: str = endpoint
+        self.params_fingerprint: str = params_fingerprint
+        self.status_code: int | None = status_code
+        self.size: int | None = size
+        self.retries: int | None = retries
+        self.cached: bool = cached
+        self.error: str | None = error
+        self.connect: float | None = connect
+        self.tls: float | None = tls
+        self.ttfb: float | None = ttfb
+        self.decode: float | None = decode
+        self.total: float = total
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the event as dict, e.g. for structured logging."""
+        return {x: getattr(self, x) for x in self.__slots__}
+
+
+class ParseEvent:
+    """Emitted by the parsers once per call. size is the length of the input if it is text."""
+
+    __slots__ = ("parser", "seconds", "size", "items", "error")
+
+    def __init__(
+        self,
+        parser: str,
+        seconds: float,
+        size: int | None = None,
+        items: int | None = None,
+        error: str | None = None,
+    ) -> None:
+        self.parser: str = parser
+        self.seconds: float = seconds
+        self.size: int | None = size
+        self.items: int | None = items
+        self.error: str | None = error
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the event as dict, e.g. for structured logging."""
+        return {x: getattr(self, x) for x in self.__slots__}
+
+
+def add_listener(listener: Callable[[Any], None]) -> None:
+    """Registers a callable receiving every RequestEvent and ParseEvent.
+    Listeners are called in the thread that made the request and must be thread safe.
+
+    Args:
+        listener (Callable[[Any], None]): Callable taking one event.
+    """
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def remove_listener(listener: Callable[[Any], None]) -> None:
+    """Unregisters a listener. Unknown listeners are ignored.
+
+    Args:
+        listener (Callable[[Any], None]): Listener to remove.
+    """
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def has_listeners() -> bool:
+    """Returns True if events are consumed. Callers skip measuring otherwise."""
+    return bool(_listeners)
+
+
+def emit(event: Any) -> None:
+    """Passes an event to all listeners. Failing listeners are logged and never break a request."""
+    for listener in tuple(_listeners):
+        try:
+            listener(event)
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Metrics listener failed")
+
+
+def get_params_fingerprint(params: Dict | None) -> str:
+    """Returns a short stable digest of query parameters. Parameter order does not matter.
+
+    Args:
+        params (Dict | None): Query parameters
+
+    Returns:
+        str: 16 hex characters.
+    """
+    return ResponseCache.make_key("", "", "", params)[:16]
+
+
+def get_endpoint_group(endpoint: str) -> str:
+    """Replaces ids in an endpoint so it can be used as metric label, e.g. event/name-123 -> event/{id}.
+
+    Args:
+        endpoint (str): Endpoint of a request
+
+    Returns:
+        str: Endpoint with low cardinality.
+    """
+    segments = [x for x in endpoint.split("/") if x]
+    return "/".join(
+        ("{id}" if any(c.isdigit() for c in x) and not _VERSION_SEGMENT.match(x) else x)
+        for x in segments
+    )
+
+
+def instrument_parser(function: Callable) -> Callable:
+    """Decorator emitting a ParseEvent per call of a parser if listeners are registered."""
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not _listeners:
+            return function(*args, **kwargs)
+
+        source = args[0] if args else next(iter(kwargs.values()), None)
+        source = getattr(source, "html", source)
+        size = len(source) if isinstance(source, (str, bytes)) else None
+
+        started = time.perf_counter()
+        try:
+            result = function(*args, **kwargs)
+        except Exception as e:
+            emit(
+                ParseEvent(
+                    function.__name__,
+                    time.perf_counter() - started,
+                    size=size,
+                    error=type(e).__name__,
+                )
+            )
+            raise
+
+        items = len(result) if isinstance(result, (list, dict)) else None
+        emit(
+            ParseEvent(
+                function.__name__, time.perf_counter() - started, size=size, items=items
+            )
+        )
+        return result
+
+    return wrapper
+
+
+class HttpxTrace:
+    """Collects connection timings of one httpx request through the trace extension."""
+
+    def __init__(self) -> None:
+        self._times: Dict[str, float] = {}
+
+    async def __call__(self, name: str, info: Dict) -> None:
+        self._times[name] = time.perf_counter()
+
+    def _between(self, start: str, end: str) -> float | None:
+        if start not in self._times or end not in self._times:
+            return None
+
+        return self._times[end] - self._times[start]
+
+    @property
+    def connect(self) -> float | None:
+        """Seconds to resolve and connect. None if a pooled connection was reused."""
+        return self._between(
+            "connection.connect_tcp.started", "connection.connect_tcp.complete"
+        )
+
+    @property
+    def tls(self) -> float | None:
+        """Seconds of the tls handshake. None if no handshake was made."""
+        return self._between(
+            "connection.start_tls.started", "connection.start_tls.complete"
+        )
+
+    @property
+    def ttfb(self) -> float | None:
+        """Seconds from sending the request until the response headers arrived."""
+        for protocol in ("http11", "http2"):
+            value = self._between(
+                f"{protocol}.send_request_headers.started",
+                f"{protocol}.receive_response_headers.complete",
+            )
+            if value is not None:
+                return value
+
+        return None
+
+
+def _get_quantile(values: List[float], quantile: float) -> float:
+    """Nearest rank quantile of sorted values."""
+    return values[max(0, math.ceil(quantile * len(values)) - 1)]
+
+
+class _Series:
+    """Count, sum and a bounded window of recent samples."""
+
+    __slots__ = ("count", "sum", "samples")
+
+    def __init__(self, max_samples: int) -> None:
+        self.count: int = 0
+        self.sum: float = 0.0
+        self.samples: Deque[float] = deque(maxlen=max_samples)
+
+    def add(self, value: float) -> None:
+        self.count = self.count + 1
+        self.sum = self.sum + value
+        self.samples.append(value)
+
+    def summary(self, quantiles: Tuple[float, ...]) -> Dict[str, Any]:
+        values = sorted(self.samples)
+        return dict(
+            count=self.count,
+            sum=self.sum,
+            quantiles=(
+                {x: _get_quantile(values, x) for x in quantiles} if values else {}
+            ),
+        )
+
+
+class MetricsAggregator:
+    """Listener keeping per endpoint and per parser statistics in memory.
+
+    Quantiles are computed over the most recent max_samples values of every series.
+
+        aggregator = MetricsAggregator()
+        pyventim.metrics.add_listener(aggregator)
+        ...
+        print(aggregator.to_openmetrics())
+    """
+
+    def __init__(
+        self,
+        max_samples: int = 10000,
+        quantiles: Tuple[float, ...] = DEFAULT_QUANTILES,
+    ) -> None:
+        """
+        Args:
+            max_samples (int, optional): Samples kept per series for the quantiles. Defaults to 10000.
+            quantiles (Tuple[float, ...], optional): Reported quantiles. Defaults to (0.5, 0.9, 0.99).
+        """
+        self.max_samples: int = max_samples
+        self.quantiles: Tuple[float, ...] = quantiles
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Drops all collected values."""
+        with self._lock:
+            self._timings: Dict[Tuple[str, str], _Series] = {}
+            self._counters: Dict[Tuple[str, Tuple], float] = {}
+
+    def _series(self, name: str, label: str) -> _Series:
+        key = (name, label)
+        if key not in self._timings:
+            self._timings[key] = _Series(self.max_samples)
+
+        return self._timings[key]
+
+    def _count(self, name: str, labels: Tuple, value: float = 1) -> None:
+        key = (name, labels)
+        self._counters[key] = self._counters.get(key, 0) + value
+
+    def __call__(self, event: Any) -> None:
+        with self._lock:
+            if isinstance(event, RequestEvent):
+                endpoint = get_endpoint_group(event.endpoint)
+                status = (
+                    "cached" if event.cached else event.error or str(event.status_code)
+                )
+                self._count("requests", (endpoint, status))
+                if event.cached:
+                    return
+
+                self._series("request", endpoint).add(event.total)
+                for name in ("connect", "tls", "ttfb", "decode"):
+                    value = getattr(event, name)
+                    if value is not None:
+                        self._series(name, endpoint).add(value)
+
+                if event.size is not None:
+                    self._count("response_bytes", (endpoint,), event.size)
+                if event.retries:
+                    self._count("retries", (endpoint,), event.retries)
+
+            elif isinstance(event, ParseEvent):
+                self._series("parse", event.parser).add(event.seconds)
+                if event.error is not None:
+                    self._count("parse_errors", (event.parser,))
+
+    def summary(self) -> Dict[str, Any]:
+        """Returns all statistics.
+
+        Returns:
+            Dict[str, Any]: Timing summaries (count, sum and quantiles in seconds) keyed by metric and
+                endpoint or parser, request counts keyed by endpoint and status, bytes and retries keyed by endpoint.
+        """
+        with self._lock:
+            timings: Dict[str, Dict[str, Any]] = {}
+            for (name, label), series in self._timings.items():
+                timings.setdefault(name, {})[label] = series.summary(self.quantiles)
+
+            counters: Dict[str, Dict[Any, float]] = {}
+            for (name, labels), value in self._counters.items():
+                counters.setdefault(name, {})[
+                    labels if len(labels) > 1 else labels[0]
+                ] = value
+
+        return dict(timings=timings, counters=counters)
+
+    def to_openmetrics(self, prefix: str = "pyventim") -> str:
+        """Renders the statistics in the OpenMetrics text format, e.g. to be written to a file read by node_exporter.
+
+        Args:
+            prefix (str, optional): Prefix of the metric names. Defaults to "pyventim".
+
+        Returns:
+            str: OpenMetrics text exposition terminated by # EOF.
+        """
+        # pylint: disable=line-too-long
+        summary = self.summary()
+        lines = []
+
+        timing_labels = dict(
+            request="endpoint",
+            connect="endpoint",
+            tls="endpoint",
+            ttfb="endpoint",
+            decode="endpoint",
+            parse="parser",
+        )
+        for name, label_name in timing_labels.items():
+            series = summary["timings"].get(name)
+            if not series:
+                continue
+
+            metric = f"{prefix}_{name}_seconds"
+            lines.append(f"# TYPE {metric} summary")
+            lines.append(f"# UNIT {metric} seconds")
+            for label, values in sorted(series.items()):
+                labels = f'{label_name}="{_escape(label)}"'
+                for quantile, value in values["quantiles"].items():
+                    lines.append(f'{metric}{{{labels},quantile="{quantile}"}} {value}')
+                lines.append(f"{metric}_sum{{{labels}}} {values['sum']}")
+                lines.append(f"{metric}_count{{{labels}}} {values['count']}")
+
+        counter_labels = dict(
+            requests=("endpoint", "status"),
+            response_bytes=("endpoint",),
+            retries=("endpoint",),
+            parse_errors=("parser",),
+        )
+        for name, label_names in counter_labels.items():
+            values = summary["counters"].get(name)
+            if not values:
+                continue
+
+            metric = f"{prefix}_{name}"
+            lines.append(f"# TYPE {metric} counter")
+            for label, value in sorted(values.items()):
+                label = label if isinstance(label, tuple) else (label,)
+                labels = ",".join(
+                    f'{x}="{_escape(y)}"' for x, y in zip(label_names, label)
+                )
+                lines.append(f"{metric}_total{{{labels}}} {value}")
+
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
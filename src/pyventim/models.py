@@ -2,10 +2,10 @@
 """
 
 from datetime import date, time
-from typing import Dict, Any, Optional, List, Literal
+from typing import Dict, Any, Optional, List, Literal, Tuple
 from typing_extensions import Self
 
-from pydantic import BaseModel, model_validator, field_serializer
+from pydantic import BaseModel, Field, model_validator, field_serializer
 
 
 class RestResult(BaseModel):
@@ -17,11 +17,67 @@ class RestResult(BaseModel):
 
 
 class HtmlResult(BaseModel):
-    """Model for a REST result."""
+    """Model for a REST result. html_data holds the utf-8 encoded body if the adapter is raw."""
 
     status_code: int
     message: str
-    html_data: str
+    html_data: str | bytes
+
+
+class TransportConfig(BaseModel):
+    """BaseModel for the http transport of the adapters.
+    Controls connection pooling, timeouts, compression and session sharing.
+    """
+
+    pool_connections: int = Field(default=10, ge=1)  # Number of cached host pools
+    pool_maxsize: int = Field(default=10, ge=1)  # Connections kept alive per host
+    pool_block: bool = False  # Wait for a free connection instead of opening a new one
+    connect_timeout: Optional[float] = Field(default=10.0, gt=0)
+    read_timeout: Optional[float] = Field(default=30.0, gt=0)
+    compression: bool = True  # Negotiate compressed responses
+    keep_alive: bool = True
+    share_session: bool = True  # One session for all adapters of an Eventim instance
+
+    @property
+    def timeout(self) -> Tuple[Optional[float], Optional[float]]:
+        """Returns the timeout tuple as expected by requests.
+
+        Returns:
+            Tuple[Optional[float], Optional[float]]: Connect and read timeout.
+        """
+        return self.connect_timeout, self.read_timeout
+
+
+class CompiledQuery:
+    """Query parameters of a model serialized once. Pages only swap the page parameter instead of dumping the model again.
+    Values are kept as dumped so they are encoded exactly like model_dump(exclude_none=True).
+    """
+
+    __slots__ = ("page_key", "_pairs")
+
+    def __init__(self, params: BaseModel, page_key: str) -> None:
+        """
+        Args:
+            params (BaseModel): Validated parameters.
+            page_key (str): Name of the page parameter.
+        """
+        self.page_key: str = page_key
+        self._pairs: Tuple[Tuple[str, Any], ...] = tuple(
+            (key, tuple(value) if isinstance(value, list) else value)
+            for key, value in params.model_dump(exclude_none=True).items()
+        )
+
+    def page(self, page: int) -> Dict[str, Any]:
+        """Returns the query parameters of a page.
+
+        Args:
+            page (int): Page number.
+
+        Returns:
+            Dict[str, Any]: Query parameters in the order of the model fields.
+        """
+        page_key = self.page_key
+        return {key: page if key == page_key else value for key, value in self._pairs}
 
 
 class ComponentParameters(BaseModel):
@@ -58,6 +114,14 @@ class ComponentParameters(BaseModel):
 
         return self
 
+    def compile_query(self) -> CompiledQuery:
+        """Serializes the parameters once for paging over pnum.
+
+        Returns:
+            CompiledQuery: The compiled query.
+        """
+        return CompiledQuery(self, "pnum")
+
 
 class ExplorationParameters(BaseModel):
     """BaseModel for Eventim Exploration Endpoint Parameters.
@@ -118,22 +182,19 @@ class ExplorationParameters(BaseModel):
         """
         return value.strftime("%H:%M")
 
+    def compile_query(self) -> CompiledQuery:
+        """Serializes the parameters once for paging over page.
+
+        Returns:
+            CompiledQuery: The compiled query.
+        """
+        return CompiledQuery(self, "page")
+
+
+class ExplorationBatchItem(BaseModel):
+    """An entity returned by a batch exploration and the queries that returned it."""
 
-# class Attraction(BaseModel):
-#     attraction_id: int
-#     name: str
-#     description: Optional[str]
-#     link: str
-#     url: Dict[str, str]
-#     image_url: Optional[str]
-#     rating: Dict[str, Union[int, float]]
-
-
-# class ExplorationResult(BaseModel):
-#     data: list[Dict[str, Any]]
-#     search_term: str
-#     results: int
-#     total_results: int
-#     page: int
-#     total_pages: int
-#     _links: dict[str, dict[str, str]]
+    item_id: Optional[str] = None
+    item: Dict[str, Any]
+    # Grows while the batch is consumed, complete once the batch is exhausted
+    query_indices: List[int]
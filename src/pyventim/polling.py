@@ -0,0 +1,345 @@
+"""Scheduler that polls the seatmaps of many events with adaptive intervals."""
+
+import heapq
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+from .seatmap import ColumnarSeatmap, SeatmapDiff, SeatmapTracker
+
+logger = logging.getLogger(__name__)
+
+
+class SeatmapPollResult:
+    """Result of one poll. diff is None for the first seatmap of an event."""
+
+    __slots__ = ("event_url", "seatmap", "diff", "polled_at", "next_poll")
+
+    def __init__(
+        self,
+        event_url: str,
+        seatmap: "Dict | ColumnarSeatmap",
+        diff: SeatmapDiff | None,
+        polled_at: float,
+        next_poll: float | None,
+    ) -> None:
+        self.event_url: str = event_url
+        self.seatmap: Dict | ColumnarSeatmap = seatmap
+        self.diff: SeatmapDiff | None = diff
+        self.polled_at: float = polled_at
+        self.next_poll: float | None = next_poll
+
+    @property
+    def changed(self) -> bool:
+        """True if the seatmap changed since the previous poll."""
+        return self.diff is not None and not self.diff.is_empty
+
+    def __repr__(self) -> str:
+        return f"SeatmapPollResult({self.event_url!r}, changed={self.changed})"
+
+
+class _PolledEvent:
+    __slots__ = ("event_url", "interval", "event_time", "next_poll", "active")
+
+    def __init__(
+        self, event_url: str, interval: float, event_time: float | None
+    ) -> None:
+        self.event_url: str = event_url
+        self.interval: float = interval
+        self.event_time: float | None = event_time
+        self.next_poll: float = 0.0
+        self.active: bool = True
+
+
+class SeatmapPoller:
+    """Polls the seatmaps of many events on a worker pool.
+
+    Events wait in a priority queue ordered by their next poll. The interval of an event shrinks by backoff after a
+    poll with changes and grows by backoff after a poll without. It never exceeds date_factor times the time left
+    until the event, so events close to their date are polled more often. Seatmaps are fetched by event url, so the
+    signed params come from the seatmap_params_cache of the client and the event page is only downloaded once per
+    signature instead of before every seatmap.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        eventim,
+        callback: Callable[[SeatmapPollResult], Any] | None = None,
+        error_callback: Callable[[str, Exception], Any] | None = None,
+        max_workers: int = 4,
+        min_interval: float = 30.0,
+        max_interval: float = 3600.0,
+        backoff: float = 2.0,
+        date_factor: float = 0.01,
+        columnar: bool = False,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        # pylint: disable=too-many-arguments,line-too-long
+        """
+        Args:
+            eventim (Eventim): Client used to fetch the seatmaps.
+            callback (Callable[[SeatmapPollResult], Any] | None, optional): Called with the result of every poll.
+                Defaults to None.
+            error_callback (Callable[[str, Exception], Any] | None, optional): Called with the event url and the
+                exception of failed polls. Defaults to None.
+            max_workers (int, optional): Number of concurrent polls. Defaults to 4.
+            min_interval (float, optional): Shortest interval in seconds. Defaults to 30.0.
+            max_interval (float, optional): Longest interval in seconds. Defaults to 3600.0.
+            backoff (float, optional): Factor the interval shrinks by after changes and grows by without. Defaults to 2.0.
+            date_factor (float, optional): Upper bound of the interval relative to the time left until the event.
+                Defaults to 0.01.
+            columnar (bool, optional): Deliver ColumnarSeatmaps instead of dicts (requires numpy). Defaults to False.
+            clock (Callable[[], float], optional): Returns the current unix timestamp. Defaults to time.time.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("min_interval must be positive and at most max_interval.")
+
+        if backoff < 1:
+            raise ValueError("backoff must be at least 1.")
+
+        self.eventim = eventim
+        self.callback = callback
+        self.error_callback = error_callback
+        self.max_workers: int = max_workers
+        self.min_interval: float = min_interval
+        self.max_interval: float = max_interval
+        self.backoff: float = backoff
+        self.date_factor: float = date_factor
+        self.columnar: bool = columnar
+        self.clock: Callable[[], float] = clock
+        self.tracker: SeatmapTracker = SeatmapTracker()
+
+        self._events: Dict[str, _PolledEvent] = {}
+        self._queue: List[tuple] = []
+        self._counter = 0
+        self._running = 0
+        self._condition = threading.Condition()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def add_event(
+        self,
+        event_url: str,
+        interval: float | None = None,
+        event_date: datetime | None = None,
+    ) -> None:
+        """Starts polling an event. The first poll is due immediately. Adding a polled event updates its interval.
+
+        Args:
+            event_url (str): Event url like "/event/disneys-der-koenig-der-loewen-stage-theater-im-hafen-hamburg-18500464/".
+            interval (float | None, optional): Initial interval in seconds. Defaults to min_interval.
+            event_date (datetime | None, optional): Start of the event. Polling stops once it has passed. Defaults to None.
+        """
+        # pylint: disable=line-too-long
+        interval = min(
+            max(interval or self.min_interval, self.min_interval), self.max_interval
+        )
+        event_time = event_date.timestamp() if event_date is not None else None
+
+        with self._condition:
+            event = self._events.get(event_url)
+            if event is not None:
+                event.interval = interval
+                event.event_time = event_time
+                return
+
+            event = _PolledEvent(event_url, interval, event_time)
+            self._events[event_url] = event
+            self._push(event, self.clock())
+            self._condition.notify_all()
+
+    def remove_event(self, event_url: str) -> None:
+        """Stops polling an event and forgets its seatmap.
+
+        Args:
+            event_url (str): Event url passed to add_event.
+        """
+        with self._condition:
+            event = self._events.pop(event_url, None)
+            if event is not None:
+                event.active = False
+
+        self.tracker.remove(event_url)
+
+    def get_next_poll(self, event_url: str) -> float | None:
+        """Returns when an event is polled next.
+
+        Args:
+            event_url (str): Event url passed to add_event.
+
+        Returns:
+            float | None: Unix timestamp of the next poll or None if the event is not polled.
+        """
+        event = self._events.get(event_url)
+        return event.next_poll if event is not None else None
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def _push(self, event: _PolledEvent, next_poll: float) -> None:
+        event.next_poll = next_poll
+        self._counter = self._counter + 1
+        heapq.heappush(self._queue, (next_poll, self._counter, event))
+
+    def _pop_due(self, now: float) -> _PolledEvent | None:
+        # Removed events stay in the heap until they come up
+        while self._queue and self._queue[0][0] <= now:
+            _, _, event = heapq.heappop(self._queue)
+            if event.active:
+                return event
+
+        return None
+
+    def _get_wait(self, now: float) -> float | None:
+        while self._queue and not self._queue[0][2].active:
+            heapq.heappop(self._queue)
+
+        return self._queue[0][0] - now if self._queue else None
+
+    def _get_delay(
+        self, event: _PolledEvent, diff: SeatmapDiff | None, now: float
+    ) -> float | None:
+        if diff is not None:
+            if diff.is_empty:
+                event.interval = min(event.interval * self.backoff, self.max_interval)
+            else:
+                event.interval = max(event.interval / self.backoff, self.min_interval)
+
+        if event.event_time is None:
+            return event.interval
+
+        time_left = event.event_time - now
+        if time_left <= 0:
+            return None
+
+        return min(event.interval, max(time_left * self.date_factor, self.min_interval))
+
+    def _poll(self, event: _PolledEvent) -> SeatmapPollResult | None:
+        now = self.clock()
+        delay = event.interval
+        result = None
+        try:
+            seatmap = self.eventim.get_event_seatmap(
+                event.event_url, columnar=self.columnar
+            )
+            if seatmap is None:
+                logger.warning(
+                    "No seatmap found for %s, stop polling.", event.event_url
+                )
+                delay = None
+            else:
+                diff = self.tracker.update(seatmap, event_key=event.event_url)
+                if not self._is_active(event):
+                    # Removed while the poll was in flight, drop the stored snapshot again
+                    self.tracker.remove(event.event_url)
+                    self._finish(event, None, now)
+                    return None
+
+                delay = self._get_delay(event, diff, now)
+                result = SeatmapPollResult(
+                    event.event_url,
+                    seatmap,
+                    diff,
+                    now,
+                    now + delay if delay is not None else None,
+                )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning("Polling %s failed: %s", event.event_url, e)
+            if self.error_callback is not None:
+                self.error_callback(event.event_url, e)
+
+        self._finish(event, delay, now)
+        if result is not None and self.callback is not None:
+            self.callback(result)
+
+        return result
+
+    def _is_active(self, event: _PolledEvent) -> bool:
+        with self._condition:
+            return event.active
+
+    def _finish(self, event: _PolledEvent, delay: float | None, now: float) -> None:
+        # Schedules the next poll or drops the event and releases the worker
+        with self._condition:
+            if delay is None:
+                if self._events.get(event.event_url) is event:
+                    del self._events[event.event_url]
+                event.active = False
+            elif event.active:
+                self._push(event, now + delay)
+
+            self._running = self._running - 1
+            self._condition.notify_all()
+
+    def poll_due(self) -> List[SeatmapPollResult]:
+        """Polls all events that are due once and waits for the results.
+
+        Returns:
+            List[SeatmapPollResult]: Results of the successful polls.
+        """
+        now = self.clock()
+        with self._condition:
+            events = []
+            while (event := self._pop_due(now)) is not None:
+                events.append(event)
+            self._running = self._running + len(events)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(self._poll, events))
+
+        return [x for x in results if x is not None]
+
+    def run(self) -> None:
+        """Polls the events until stop() is called. At most max_workers polls run at the same time."""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while not self._stop.is_set():
+                with self._condition:
+                    event = None
+                    if self._running < self.max_workers:
+                        event = self._pop_due(self.clock())
+
+                    if event is None:
+                        wait = self._get_wait(self.clock())
+                        if self._running >= self.max_workers or wait is None:
+                            wait = self.min_interval
+                        self._condition.wait(max(wait, 0.0))
+                        continue
+
+                    self._running = self._running + 1
+
+                executor.submit(self._poll, event)
+
+    def start(self) -> "SeatmapPoller":
+        """Runs the poller in a background thread.
+
+        Returns:
+            SeatmapPoller: The poller.
+        """
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops the poller and waits for running polls to finish."""
+        with self._condition:
+            self._stop.set()
+            self._condition.notify_all()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "SeatmapPoller":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
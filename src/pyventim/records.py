@@ -0,0 +1,140 @@
+"""Typed records of the exploration results. Records wrap the decoded item and convert fields on access."""
+
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+
+class _Field:
+    """Reads a key of the wrapped item on access and converts it. Missing keys and nulls are None."""
+
+    __slots__ = ("keys", "convert")
+
+    def __init__(self, *keys: str, convert: Callable[[Any], Any] | None = None):
+        self.keys = keys
+        self.convert = convert
+
+    def __get__(self, record: "_Record | None", owner: type) -> Any:
+        if record is None:
+            return self
+
+        value = record.raw
+        for key in self.keys:
+            value = value.get(key) if isinstance(value, dict) else None
+
+        if value is None or self.convert is None:
+            return value
+
+        return self.convert(value)
+
+
+class _Record:
+    __slots__ = ("raw",)
+
+    # Name of the id field in the api response
+    id_field: str = ""
+
+    def __init__(self, raw: Dict[str, Any]) -> None:
+        """
+        Args:
+            raw (Dict[str, Any]): Item as returned by the api. It is not copied.
+        """
+        self.raw: Dict[str, Any] = raw
+
+    name: str | None = _Field("name")
+    description: str | None = _Field("description")
+    link: str | None = _Field("link")
+    url: Dict[str, str] | None = _Field("url")
+    image_url: str | None = _Field("imageUrl")
+    rating_count: int | None = _Field("rating", "count")
+    rating_average: float | None = _Field("rating", "average")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the item as returned by the api.
+
+        Returns:
+            Dict[str, Any]: The wrapped item.
+        """
+        return self.raw
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):  # pylint: disable=unidiomatic-typecheck
+            return NotImplemented
+
+        return self.raw == other.raw
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.raw.get(self.id_field)))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.raw.get(self.id_field)!r}, {self.name!r})"
+
+
+class Attraction(_Record):
+    """Attraction like an artist, band or musical."""
+
+    __slots__ = ()
+    id_field = "attractionId"
+
+    attraction_id: int = _Field("attractionId", convert=int)
+
+
+class Location(_Record):
+    """Location like an arena, bar or theater."""
+
+    __slots__ = ()
+    id_field = "locationId"
+
+    location_id: str = _Field("locationId")
+    city: str | None = _Field("city")
+
+
+class Product(_Record):
+    """Product of a product group like a concert, day pass or performance."""
+
+    __slots__ = ()
+    id_field = "productId"
+
+    product_id: int = _Field("productId", convert=int)
+    type: str | None = _Field("type")
+    status: str | None = _Field("status")
+    start_date: datetime | None = _Field(
+        "typeAttributes",
+        "liveEntertainment",
+        "startDate",
+        convert=datetime.fromisoformat,
+    )
+    location: Dict[str, Any] | None = _Field(
+        "typeAttributes", "liveEntertainment", "location"
+    )
+    tags: List[str] | None = _Field("tags")
+    has_recommendation: bool | None = _Field("hasRecommendation")
+
+
+class ProductGroup(_Record):
+    """Product group like a tour, musical or festival with its most relevant products."""
+
+    __slots__ = ("_products",)
+    id_field = "productGroupId"
+
+    def __init__(self, raw: Dict[str, Any]) -> None:
+        super().__init__(raw)
+        self._products: List[Product] | None = None
+
+    product_group_id: int = _Field("productGroupId", convert=int)
+    start_date: datetime | None = _Field("startDate", convert=datetime.fromisoformat)
+    end_date: datetime | None = _Field("endDate", convert=datetime.fromisoformat)
+    product_count: int | None = _Field("productCount")
+    currency: str | None = _Field("currency")
+    status: str | None = _Field("status")
+    tags: List[str] | None = _Field("tags")
+    categories: List[str] = _Field(
+        "categories", convert=lambda x: [category["name"] for category in x]
+    )
+
+    @property
+    def products(self) -> List[Product]:
+        """Products of the group. Wrapped on first access."""
+        if self._products is None:
+            self._products = [Product(x) for x in self.raw.get("products") or []]
+
+        return self._products
@@ -0,0 +1,526 @@
+"""Offline record and replay of Eventim responses and a local stand-in server serving them."""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from .cache import ResponseCache
+from .exceptions import ReplayException
+
+# httpx is imported by the async replay transport on first use to keep `import pyventim` fast
+httpx = None  # pylint: disable=invalid-name
+
+logger = logging.getLogger(__name__)
+
+# Signed seatmap parameters change with every page load and are ignored when matching requests.
+DEFAULT_IGNORED_PARAMS: Tuple[str, ...] = (
+    "timestamp",
+    "expiryTime",
+    "chash",
+    "signature",
+    "a_sessionId",
+)
+
+# Only these response headers are stored. The body is stored decoded.
+STORED_HEADERS: Tuple[str, ...] = ("content-type", "retry-after")
+
+REPLAY_MODES: Tuple[str, ...] = ("replay", "record", "auto")
+
+
+class FixtureResponse:
+    """A recorded response."""
+
+    __slots__ = ("status_code", "reason", "headers", "content")
+
+    def __init__(
+        self, status_code: int, reason: str, headers: Dict[str, str], content: bytes
+    ) -> None:
+        self.status_code: int = status_code
+        self.reason: str = reason
+        self.headers: Dict[str, str] = headers
+        self.content: bytes = content
+
+
+class FixtureStore:
+    """Directory of recorded responses.
+
+    Requests are indexed in an append-only index.jsonl. Bodies are stored gzip compressed and named by
+    their digest, so identical payloads are only stored once. Requests are matched by method, path and
+    query parameters. The host is ignored so the same fixtures can be served by the StandInServer.
+    """
+
+    def __init__(
+        self, path: str, ignored_params: Iterable[str] = DEFAULT_IGNORED_PARAMS
+    ) -> None:
+        """
+        Args:
+            path (str): Directory of the store. It is created if it does not exist.
+            ignored_params (Iterable[str], optional): Query parameters ignored when matching requests.
+                Defaults to DEFAULT_IGNORED_PARAMS.
+        """
+        self.path: str = path
+        self.ignored_params: frozenset = frozenset(ignored_params)
+        self._index_path: str = os.path.join(path, "index.jsonl")
+        self._entries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+        os.makedirs(path, exist_ok=True)
+        if os.path.exists(self._index_path):
+            with open(self._index_path, "r", encoding="utf-8") as file:
+                for line in file:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._entries[entry["key"]] = entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def make_key(self, method: str, url: str, body: bytes | None = None) -> str:
+        """Builds the key of a request.
+
+        Args:
+            method (str): HTTP method
+            url (str): Absolute url or path with query string
+            body (bytes | None, optional): Request body. Defaults to None.
+
+        Returns:
+            str: Hex digest of the request.
+        """
+        parts = urlsplit(url)
+        path = "/" + "/".join(x for x in parts.path.split("/") if x)
+
+        params: Dict[str, List[str]] = {}
+        for name, value in parse_qsl(parts.query, keep_blank_values=True):
+            if name not in self.ignored_params:
+                params.setdefault(name, []).append(value)
+
+        if body:
+            params["__body__"] = [hashlib.sha256(body).hexdigest()]
+
+        return ResponseCache.make_key(method, "", path, params)
+
+    def get(
+        self, method: str, url: str, body: bytes | None = None
+    ) -> FixtureResponse | None:
+        """Returns the recorded response of a request.
+
+        Args:
+            method (str): HTTP method
+            url (str): Absolute url or path with query string
+            body (bytes | None, optional): Request body. Defaults to None.
+
+        Returns:
+            FixtureResponse | None: The recorded response or None if the request was not recorded.
+        """
+        entry = self._entries.get(self.make_key(method, url, body))
+        if entry is None:
+            return None
+
+        with gzip.open(os.path.join(self.path, f"{entry['body']}.gz"), "rb") as file:
+            content = file.read()
+
+        return FixtureResponse(
+            entry["status_code"], entry["reason"], entry["headers"], content
+        )
+
+    def add(
+        self,
+        method: str,
+        url: str,
+        status_code: int,
+        reason: str,
+        headers: Dict[str, str],
+        content: bytes,
+        body: bytes | None = None,
+    ) -> str:
+        """Records a response. A later recording of the same request replaces the earlier one.
+
+        Args:
+            method (str): HTTP method
+            url (str): Absolute url of the request
+            status_code (int): Status code of the response
+            reason (str): Reason of the response
+            headers (Dict[str, str]): Headers of the response. Only STORED_HEADERS are kept.
+            content (bytes): Decoded body of the response
+            body (bytes | None, optional): Request body. Defaults to None.
+
+        Returns:
+            str: Key of the request.
+        """
+        key = self.make_key(method, url, body)
+        digest = hashlib.sha256(content).hexdigest()
+        headers = CaseInsensitiveDict(headers)
+        entry = dict(
+            key=key,
+            method=method.upper(),
+            url=url,
+            status_code=status_code,
+            reason=reason,
+            headers={x: headers[x] for x in STORED_HEADERS if x in headers},
+            body=digest,
+        )
+
+        with self._lock:
+            body_path = os.path.join(self.path, f"{digest}.gz")
+            if not os.path.exists(body_path):
+                with gzip.open(body_path, "wb") as file:
+                    file.write(content)
+
+            with open(self._index_path, "a", encoding="utf-8") as file:
+                file.write(json.dumps(entry) + "\n")
+
+            self._entries[key] = entry
+
+        return key
+
+
+def _check_mode(mode: str) -> None:
+    if mode not in REPLAY_MODES:
+        raise ValueError(f"mode must be one of {REPLAY_MODES}, got {mode!r}")
+
+
+class ReplayTransport(requests.adapters.BaseAdapter):
+    """requests transport adapter replaying recorded responses.
+
+    Modes:
+        replay: Serve recorded responses only and raise a ReplayException for unknown requests.
+        record: Send every request and record the response.
+        auto: Serve recorded responses and record unknown requests.
+    """
+
+    def __init__(
+        self,
+        store: FixtureStore,
+        mode: str = "replay",
+        inner: HTTPAdapter | None = None,
+    ) -> None:
+        """
+        Args:
+            store (FixtureStore): Store of the recorded responses.
+            mode (str, optional): One of replay, record or auto. Defaults to "replay".
+            inner (HTTPAdapter | None, optional): Adapter sending the live requests. Defaults to HTTPAdapter().
+        """
+        super().__init__()
+        _check_mode(mode)
+        self.store: FixtureStore = store
+        self.mode: str = mode
+        self.inner: HTTPAdapter = inner or HTTPAdapter()
+
+    def send(
+        self, request: requests.PreparedRequest, **kwargs
+    ) -> requests.Response:  # pylint: disable=arguments-differ
+        body = request.body.encode() if isinstance(request.body, str) else request.body
+
+        if self.mode != "record":
+            fixture = self.store.get(request.method, request.url, body)
+            if fixture is not None:
+                response = requests.Response()
+                response.status_code = fixture.status_code
+                response.reason = fixture.reason
+                response.headers = CaseInsensitiveDict(fixture.headers)
+                response._content = fixture.content  # pylint: disable=protected-access
+                response.url = request.url
+                response.request = request
+                response.encoding = requests.utils.get_encoding_from_headers(
+                    response.headers
+                )
+                return response
+
+            if self.mode == "replay":
+                raise ReplayException(
+                    f"No recorded response for {request.method} {request.url}"
+                )
+
+        response = self.inner.send(request, **kwargs)
+        self.store.add(
+            request.method,
+            request.url,
+            response.status_code,
+            response.reason,
+            response.headers,
+            response.content,
+            body,
+        )
+        logger.debug("Recorded %s %s", request.method, request.url)
+        return response
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+def install_replay(eventim, store: FixtureStore, mode: str = "replay") -> None:
+    """Mounts a ReplayTransport on every session of an Eventim client.
+
+    Args:
+        eventim (Eventim): Client to patch.
+        store (FixtureStore): Store of the recorded responses.
+        mode (str, optional): One of replay, record or auto. Defaults to "replay".
+    """
+    transport = ReplayTransport(store, mode=mode)
+    sessions = {
+        id(adapter.session): adapter.session
+        for adapter in (
+            eventim.rest_adapter,
+            eventim.private_rest_adapter,
+            eventim.html_adapter,
+        )
+    }
+    for session in sessions.values():
+        session.mount("https://", transport)
+        session.mount("http://", transport)
+
+
+def _require_httpx() -> None:
+    global httpx  # pylint: disable=global-statement,invalid-name
+    if httpx is None:
+        try:
+            import httpx as _httpx  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ImportError(
+                "AsyncReplayTransport requires httpx. Install it with `pip install pyventim[async]`."
+            ) from e
+        httpx = _httpx
+
+
+class AsyncReplayTransport:
+    """httpx transport replaying recorded responses. Modes are the same as in ReplayTransport.
+    It implements the interface of httpx.AsyncBaseTransport without subclassing it, so httpx is only imported
+    once a transport is created.
+
+    Pass it to the client of AsyncEventim: AsyncEventim(client=httpx.AsyncClient(transport=AsyncReplayTransport(store))).
+    """
+
+    def __init__(
+        self,
+        store: FixtureStore,
+        mode: str = "replay",
+        inner: "httpx.AsyncBaseTransport | None" = None,
+    ) -> None:
+        """
+        Args:
+            store (FixtureStore): Store of the recorded responses.
+            mode (str, optional): One of replay, record or auto. Defaults to "replay".
+            inner (httpx.AsyncBaseTransport | None, optional): Transport sending the live requests.
+                Defaults to httpx.AsyncHTTPTransport().
+        """
+        _require_httpx()
+        _check_mode(mode)
+        self.store: FixtureStore = store
+        self.mode: str = mode
+        self.inner: httpx.AsyncBaseTransport = inner or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: "httpx.Request") -> "httpx.Response":
+        body = await request.aread()
+        url = str(request.url)
+
+        if self.mode != "record":
+            fixture = self.store.get(request.method, url, body)
+            if fixture is not None:
+                return httpx.Response(
+                    fixture.status_code,
+                    headers=fixture.headers,
+                    content=fixture.content,
+                    request=request,
+                    extensions={"reason_phrase": fixture.reason.encode()},
+                )
+
+            if self.mode == "replay":
+                raise ReplayException(
+                    f"No recorded response for {request.method} {url}"
+                )
+
+        response = await self.inner.handle_async_request(request)
+        content = await response.aread()
+        await response.aclose()
+        self.store.add(
+            request.method,
+            url,
+            response.status_code,
+            response.reason_phrase,
+            dict(response.headers),
+            content,
+            body,
+        )
+        logger.debug("Recorded %s %s", request.method, url)
+
+        headers = {
+            x: response.headers[x] for x in STORED_HEADERS if x in response.headers
+        }
+        return httpx.Response(
+            response.status_code,
+            headers=headers,
+            content=content,
+            request=request,
+            extensions={"reason_phrase": response.reason_phrase.encode()},
+        )
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+    async def __aenter__(self) -> "AsyncReplayTransport":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+
+class StandInServer:
+    """Local HTTP server serving recorded responses in place of the Eventim hosts.
+
+    Requests without a recorded response are answered with 404. Latency and errors can be injected to
+    load test pipelines offline. Use it as a context manager and pass its hostnames to the client:
+
+        with StandInServer(store, latency=0.05) as server:
+            eventim = Eventim(**server.hostnames)
+    """
+
+    # pylint: disable=too-many-arguments,too-many-instance-attributes
+
+    def __init__(
+        self,
+        store: FixtureStore,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: int | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """
+        Args:
+            store (FixtureStore): Store of the recorded responses.
+            latency (float, optional): Seconds to wait before every response. Defaults to 0.0.
+            error_rate (float, optional): Share of requests answered with error_status. Defaults to 0.0.
+            error_status (int, optional): Status code of injected errors. Defaults to 503.
+            seed (int | None, optional): Seed of the error injection. Defaults to None.
+            host (str, optional): Interface to bind. Defaults to "127.0.0.1".
+            port (int, optional): Port to bind. Defaults to 0 (any free port).
+        """
+        if not 0 <= error_rate <= 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self.store: FixtureStore = store
+        self.latency: float = latency
+        self.error_rate: float = error_rate
+        self.error_status: int = error_status
+        self.requests: int = 0
+        self.errors: int = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._create_handler())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Base url of the server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def hostnames(self) -> Dict[str, str]:
+        """Hostname arguments of Eventim and AsyncEventim pointing to the server."""
+        return dict(
+            exploration_hostname=f"{self.url}/websearch/search/api/exploration",
+            private_api_hostname=self.url,
+            html_hostname=self.url,
+        )
+
+    def start(self) -> "StandInServer":
+        """Starts serving in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops the server and closes the socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+
+        self._server.server_close()
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def _inject_error(self) -> bool:
+        with self._lock:
+            self.requests = self.requests + 1
+            inject = self._random.random() < self.error_rate
+            if inject:
+                self.errors = self.errors + 1
+
+        return inject
+
+    def _create_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """Serves the fixtures of the store."""
+
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately, Nagle would delay every keep-alive response
+            disable_nagle_algorithm = True
+
+            def _reply(
+                self, status_code: int, headers: Dict[str, str], content: bytes
+            ) -> None:
+                self.send_response(status_code)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("content-length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def _serve(self) -> None:
+                length = int(self.headers.get("content-length") or 0)
+                body = self.rfile.read(length) if length else None
+
+                if server.latency > 0:
+                    time.sleep(server.latency)
+
+                if server._inject_error():  # pylint: disable=protected-access
+                    self._reply(
+                        server.error_status,
+                        {"content-type": "application/json"},
+                        json.dumps({"error": "injected"}).encode(),
+                    )
+                    return
+
+                fixture = server.store.get(self.command, self.path, body)
+                if fixture is None:
+                    self._reply(
+                        404,
+                        {"content-type": "application/json"},
+                        json.dumps({"error": "no fixture"}).encode(),
+                    )
+                    return
+
+                self._reply(fixture.status_code, fixture.headers, fixture.content)
+
+            do_GET = _serve
+            do_POST = _serve
+
+            def log_message(self, format, *args) -> None:  # pylint: disable=W0622
+                logger.debug(format, *args)
+
+        return Handler
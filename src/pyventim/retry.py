@@ -0,0 +1,204 @@
+"""Retry policies and rate limiting for the adapters."""
+
+import asyncio
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, Tuple, Type
+
+import requests
+
+
+def _default_retry_exceptions() -> Tuple[Type[Exception], ...]:
+    return (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+
+def _is_httpx_transport_error(exception: Exception) -> bool:
+    # httpx is optional and imported lazily, if it raised the exception it is loaded
+    httpx = sys.modules.get("httpx")
+    return httpx is not None and isinstance(exception, httpx.TransportError)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parses a Retry-After header given in seconds or as a http date.
+
+    Args:
+        value (str | None): Value of the header
+
+    Returns:
+        float | None: Seconds to wait or None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """Decides if and when a failed request is retried.
+
+    The delay grows exponentially with every attempt (backoff_factor * 2 ** attempt) and is capped at backoff_max.
+    With jitter the delay is randomized between half and the full delay to spread out concurrent clients.
+    """
+
+    # pylint: disable=too-many-arguments,line-too-long
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        backoff_max: float = 60.0,
+        jitter: bool = True,
+        retry_statuses: Iterable[int] = (429, 500, 502, 503, 504),
+        status_max_retries: Dict[int, int] | None = None,
+        retry_exceptions: Tuple[Type[Exception], ...] | None = None,
+        respect_retry_after: bool = True,
+    ) -> None:
+        """
+        Args:
+            max_retries (int, optional): Retries after the first attempt. Defaults to 3.
+            backoff_factor (float, optional): Base delay in seconds. Defaults to 0.5.
+            backoff_max (float, optional): Maximum delay in seconds. Defaults to 60.0.
+            jitter (bool, optional): Randomize the delay. Defaults to True.
+            retry_statuses (Iterable[int], optional): Status codes that are retried. Defaults to (429, 500, 502, 503, 504).
+            status_max_retries (Dict[int, int] | None, optional): Overrides max_retries for single status codes.
+                Defaults to None.
+            retry_exceptions (Tuple[Type[Exception], ...] | None, optional): Exceptions that are retried.
+                Defaults to connection errors and timeouts.
+            respect_retry_after (bool, optional): Wait at least as long as the Retry-After header says. Defaults to True.
+        """
+        self.max_retries: int = max_retries
+        self.backoff_factor: float = backoff_factor
+        self.backoff_max: float = backoff_max
+        self.jitter: bool = jitter
+        self.retry_statuses: frozenset = frozenset(retry_statuses)
+        self.status_max_retries: Dict[int, int] = status_max_retries or {}
+        self.retry_exceptions: Tuple[Type[Exception], ...] = (
+            _default_retry_exceptions()
+            if retry_exceptions is None
+            else retry_exceptions
+        )
+        self._retry_httpx_errors: bool = retry_exceptions is None
+        self.respect_retry_after: bool = respect_retry_after
+
+    def should_retry_status(self, status_code: int, attempt: int) -> bool:
+        """Checks if a response with the status code should be retried.
+
+        Args:
+            status_code (int): Status code of the response
+            attempt (int): Number of retries done so far.
+
+        Returns:
+            bool: True if the request should be retried.
+        """
+        if status_code not in self.retry_statuses:
+            return False
+
+        return attempt < self.status_max_retries.get(status_code, self.max_retries)
+
+    def should_retry_exception(self, exception: Exception, attempt: int) -> bool:
+        """Checks if a request that raised the exception should be retried.
+
+        Args:
+            exception (Exception): Raised exception
+            attempt (int): Number of retries done so far.
+
+        Returns:
+            bool: True if the request should be retried.
+        """
+        if not isinstance(exception, self.retry_exceptions) and not (
+            self._retry_httpx_errors and _is_httpx_transport_error(exception)
+        ):
+            return False
+
+        return attempt < self.max_retries
+
+    def get_delay(self, attempt: int, retry_after: str | None = None) -> float:
+        """Returns the seconds to wait before the next attempt.
+
+        Args:
+            attempt (int): Number of retries done so far.
+            retry_after (str | None, optional): Retry-After header of the response. Defaults to None.
+
+        Returns:
+            float: Seconds to wait.
+        """
+        delay = min(self.backoff_max, self.backoff_factor * 2**attempt)
+        if self.jitter:
+            delay = random.uniform(delay / 2, delay)
+
+        if self.respect_retry_after:
+            seconds = parse_retry_after(retry_after)
+            if seconds is not None:
+                delay = max(delay, seconds)
+
+        return delay
+
+
+class RateLimiter:
+    """Thread safe token bucket limiting the request rate.
+    Share one instance between adapters to limit their combined rate.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """
+        Args:
+            rate (float): Requests per second.
+            burst (int, optional): Requests that can be made at once after an idle period. Defaults to 1.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+
+        self.rate: float = rate
+        self.burst: int = max(1, burst)
+        self._interval: float = 1 / rate
+        self._tolerance: float = self._interval * (self.burst - 1)
+        self._next_time: float = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Takes a token and returns the seconds to wait until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            next_time = max(self._next_time, now)
+            self._next_time = next_time + self._interval
+            return max(0.0, next_time - self._tolerance - now)
+
+    def acquire(self) -> None:
+        """Blocks until a request can be made."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Waits until a request can be made without blocking the event loop."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Delays all following requests, e.g. after the server answered with 429.
+
+        Args:
+            seconds (float): Seconds to pause.
+        """
+        with self._lock:
+            self._next_time = max(
+                self._next_time, time.monotonic() + seconds + self._tolerance
+            )
@@ -0,0 +1,969 @@
+"""Columnar seatmap representation backed by numpy arrays, seatmap diffing and the signed seatmap params cache."""
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Any, Tuple
+
+from . import jsonlib
+from .metrics import instrument_parser
+from .utils import parse_seatmap_expiry_from_seatmap_params
+
+# numpy is imported by the columnar seatmap on first use to keep `import pyventim` fast
+np = None  # pylint: disable=invalid-name
+
+
+def _struct_to_dict(value: Any) -> Dict:
+    # Structs only exist if msgspec is installed
+    import msgspec  # pylint: disable=import-outside-toplevel
+
+    return msgspec.structs.asdict(value)
+
+
+def _require_numpy() -> None:
+    global np  # pylint: disable=global-statement,invalid-name
+    if np is None:
+        try:
+            import numpy as _np  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ImportError(
+                "The columnar seatmap requires numpy. Install it with `pip install pyventim[seatmap]`."
+            ) from e
+        np = _np
+
+
+class ColumnarSeatmap:
+    """Seatmap with one entry per seat in parallel numpy arrays.
+
+    Seats reference small lookup tables for blocks, rows and price categories by index:
+    - seat_block_index, seat_row_index and seat_price_category_index are indices into the lookup tables.
+    - seat_code, seat_x and seat_y hold the seat code and coordinates.
+    - row_block_index maps every row to its block. Rows without available seats are kept.
+    """
+
+    # pylint: disable=too-many-instance-attributes,too-many-arguments,line-too-long
+
+    def __init__(
+        self,
+        meta: Dict[str, Any],
+        block_ids: List[str],
+        block_names: List[str],
+        block_descriptions: List[str],
+        row_codes: List[str],
+        row_block_index: "np.ndarray",
+        price_category_ids: List[str],
+        price_category_names: List[str],
+        price_category_colors: List[str],
+        seat_block_index: "np.ndarray",
+        seat_row_index: "np.ndarray",
+        seat_code: "np.ndarray",
+        seat_price_category_index: "np.ndarray",
+        seat_x: "np.ndarray",
+        seat_y: "np.ndarray",
+    ) -> None:
+        _require_numpy()
+        self.meta: Dict[str, Any] = meta
+        self.block_ids: List[str] = block_ids
+        self.block_names: List[str] = block_names
+        self.block_descriptions: List[str] = block_descriptions
+        self.row_codes: List[str] = row_codes
+        self.row_block_index: np.ndarray = row_block_index
+        self.price_category_ids: List[str] = price_category_ids
+        self.price_category_names: List[str] = price_category_names
+        self.price_category_colors: List[str] = price_category_colors
+        self.seat_block_index: np.ndarray = seat_block_index
+        self.seat_row_index: np.ndarray = seat_row_index
+        self.seat_code: np.ndarray = seat_code
+        self.seat_price_category_index: np.ndarray = seat_price_category_index
+        self.seat_x: np.ndarray = seat_x
+        self.seat_y: np.ndarray = seat_y
+
+    @classmethod
+    def from_api(cls, seatmap_data: "Dict | Any") -> "ColumnarSeatmap":
+        """Builds the columnar seatmap from the raw seatmap data of the api.
+
+        Args:
+            seatmap_data (Dict | Any): Raw seatmap data returned by the SeatMapHandler or by decode_seatmap.
+
+        Returns:
+            ColumnarSeatmap: The columnar seatmap.
+        """
+        # pylint: disable=line-too-long
+        _require_numpy()
+        if not isinstance(seatmap_data, dict):
+            seatmap_data = _struct_to_dict(seatmap_data)
+
+        block_ids, block_names, block_descriptions = [], [], []
+        row_codes, row_block_index = [], []
+        seat_block_index, seat_row_index, seat_codes = [], [], []
+        seat_price_category_index, seat_x, seat_y = [], [], []
+
+        for block_index, block in enumerate(seatmap_data["blocks"]):
+            if not isinstance(block, dict):
+                block = _struct_to_dict(block)
+
+            block_ids.append(block["blockId"])
+            block_names.append(block["name"])
+            block_descriptions.append(block["blockDescription"])
+
+            for row in block["rows"]:
+                row_index = len(row_codes)
+                row_codes.append(row[0])
+                row_block_index.append(block_index)
+
+                seats = row[1]
+                seat_block_index.extend([block_index] * len(seats))
+                seat_row_index.extend([row_index] * len(seats))
+                for seat in seats:
+                    seat_codes.append(seat[0])
+                    seat_price_category_index.append(seat[1])
+                    seat_x.append(seat[2])
+                    seat_y.append(seat[3])
+
+        pcs = seatmap_data["pcs"]
+        return cls(
+            meta=dict(
+                seatmap_key=seatmap_data["key"],
+                seatmap_timestamp=seatmap_data["availabilityTimestamp"],
+                seatmap_individual_seats=seatmap_data["individualSeats"],
+                seatmap_dimension_x=seatmap_data["dimension"][0],
+                seatmap_dimension_y=seatmap_data["dimension"][1],
+                seatmap_seat_size=seatmap_data["seatSize"],
+            ),
+            block_ids=block_ids,
+            block_names=block_names,
+            block_descriptions=block_descriptions,
+            row_codes=row_codes,
+            row_block_index=np.array(row_block_index, dtype=np.int32),
+            price_category_ids=[x[0] for x in pcs],
+            price_category_names=[x[1] for x in pcs],
+            price_category_colors=[x[2] for x in pcs],
+            seat_block_index=np.array(seat_block_index, dtype=np.int32),
+            seat_row_index=np.array(seat_row_index, dtype=np.int32),
+            seat_code=np.array(seat_codes, dtype=np.str_),
+            seat_price_category_index=np.array(
+                seat_price_category_index, dtype=np.int16
+            ),
+            seat_x=np.array(seat_x, dtype=np.int32),
+            seat_y=np.array(seat_y, dtype=np.int32),
+        )
+
+    def __len__(self) -> int:
+        return len(self.seat_code)
+
+    @property
+    def nbytes(self) -> int:
+        """Returns the memory used by the seat arrays.
+
+        Returns:
+            int: Bytes of all numpy arrays.
+        """
+        return sum(
+            x.nbytes
+            for x in (
+                self.row_block_index,
+                self.seat_block_index,
+                self.seat_row_index,
+                self.seat_code,
+                self.seat_price_category_index,
+                self.seat_x,
+                self.seat_y,
+            )
+        )
+
+    def price_category_mask(self, price_category: int | str) -> "np.ndarray":
+        """Returns a mask of all seats in a price category.
+
+        Args:
+            price_category (int | str): Index or id of the price category like "p32914323".
+
+        Returns:
+            np.ndarray: Boolean mask over the seats.
+        """
+        if isinstance(price_category, str):
+            price_category = self.price_category_ids.index(price_category)
+
+        return self.seat_price_category_index == price_category
+
+    def box_mask(
+        self, x_min: float, y_min: float, x_max: float, y_max: float
+    ) -> "np.ndarray":
+        """Returns a mask of all seats inside a bounding box. The bounds are inclusive.
+
+        Args:
+            x_min (float): Left bound
+            y_min (float): Upper bound
+            x_max (float): Right bound
+            y_max (float): Lower bound
+
+        Returns:
+            np.ndarray: Boolean mask over the seats.
+        """
+        return (
+            (self.seat_x >= x_min)
+            & (self.seat_x <= x_max)
+            & (self.seat_y >= y_min)
+            & (self.seat_y <= y_max)
+        )
+
+    def block_mask(self, block_id: str) -> "np.ndarray":
+        """Returns a mask of all seats in a block.
+
+        Args:
+            block_id (str): Id of the block like "b1".
+
+        Returns:
+            np.ndarray: Boolean mask over the seats.
+        """
+        return self.seat_block_index == self.block_ids.index(block_id)
+
+    def select(self, mask: "np.ndarray") -> "ColumnarSeatmap":
+        """Returns a seatmap with the seats of the mask. The lookup tables are shared.
+
+        Args:
+            mask (np.ndarray): Boolean mask or index array over the seats.
+
+        Returns:
+            ColumnarSeatmap: Seatmap with the selected seats.
+        """
+        return ColumnarSeatmap(
+            meta=self.meta,
+            block_ids=self.block_ids,
+            block_names=self.block_names,
+            block_descriptions=self.block_descriptions,
+            row_codes=self.row_codes,
+            row_block_index=self.row_block_index,
+            price_category_ids=self.price_category_ids,
+            price_category_names=self.price_category_names,
+            price_category_colors=self.price_category_colors,
+            seat_block_index=self.seat_block_index[mask],
+            seat_row_index=self.seat_row_index[mask],
+            seat_code=self.seat_code[mask],
+            seat_price_category_index=self.seat_price_category_index[mask],
+            seat_x=self.seat_x[mask],
+            seat_y=self.seat_y[mask],
+        )
+
+    def seats_per_price_category(self) -> Dict[str, int]:
+        """Counts the seats per price category.
+
+        Returns:
+            Dict[str, int]: Number of seats by price category id.
+        """
+        counts = np.bincount(
+            self.seat_price_category_index,
+            minlength=len(self.price_category_ids),
+        )
+        return {
+            price_category_id: int(counts[index])
+            for index, price_category_id in enumerate(self.price_category_ids)
+        }
+
+    def get_seat(self, index: int) -> Dict[str, Any]:
+        """Returns a seat in the dict format of parse_seathamp_data_from_api() with its block and row.
+
+        Args:
+            index (int): Index of the seat
+
+        Returns:
+            Dict[str, Any]: The seat.
+        """
+        return dict(
+            block_id=self.block_ids[self.seat_block_index[index]],
+            row_code=self.row_codes[self.seat_row_index[index]],
+            seat_code=str(self.seat_code[index]),
+            seat_price_category_index=int(self.seat_price_category_index[index]),
+            seat_coordinate_x=int(self.seat_x[index]),
+            seat_coordinate_y=int(self.seat_y[index]),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converts the seatmap into the nested format of parse_seathamp_data_from_api().
+
+        Returns:
+            Dict[str, Any]: Seat map data in the format "Block -> Row -> Seat".
+        """
+        row_seats: List[List[Dict[str, Any]]] = [[] for _ in self.row_codes]
+        for row_index, code, price_category_index, x, y in zip(
+            self.seat_row_index.tolist(),
+            self.seat_code.tolist(),
+            self.seat_price_category_index.tolist(),
+            self.seat_x.tolist(),
+            self.seat_y.tolist(),
+        ):
+            row_seats[row_index].append(
+                dict(
+                    seat_code=code,
+                    seat_price_category_index=price_category_index,
+                    seat_coordinate_x=x,
+                    seat_coordinate_y=y,
+                )
+            )
+
+        block_rows: List[List[Dict[str, Any]]] = [[] for _ in self.block_ids]
+        for row_index, block_index in enumerate(self.row_block_index.tolist()):
+            block_rows[block_index].append(
+                dict(row_code=self.row_codes[row_index], row_seats=row_seats[row_index])
+            )
+
+        return dict(
+            **self.meta,
+            blocks=[
+                dict(
+                    block_id=block_id,
+                    block_name=block_name,
+                    block_description=block_description,
+                    block_rows=block_rows[block_index],
+                )
+                for block_index, (block_id, block_name, block_description) in enumerate(
+                    zip(self.block_ids, self.block_names, self.block_descriptions)
+                )
+            ],
+            price_categories=[
+                dict(
+                    price_category_id=price_category_id,
+                    price_category_name=price_category_name,
+                    price_category_color=price_category_color,
+                )
+                for price_category_id, price_category_name, price_category_color in zip(
+                    self.price_category_ids,
+                    self.price_category_names,
+                    self.price_category_colors,
+                )
+            ],
+        )
+
+    def get_seat_identities(self) -> List[Tuple[str, str, str]]:
+        """Returns the identity of every seat as (block_id, row_code, seat_code).
+
+        Returns:
+            List[Tuple[str, str, str]]: Seat identities in seat order.
+        """
+        return list(
+            zip(
+                [self.block_ids[x] for x in self.seat_block_index.tolist()],
+                [self.row_codes[x] for x in self.seat_row_index.tolist()],
+                self.seat_code.tolist(),
+            )
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_seatmap_struct() -> type:
+    import msgspec  # pylint: disable=import-outside-toplevel
+
+    # Seats are [seat_code, price_category_index, x, y] and rows [row_code, seats]
+    seat = Tuple[str, int, int, int]
+    block = msgspec.defstruct(
+        "SeatmapBlock",
+        [
+            ("blockId", str),
+            ("name", str),
+            ("blockDescription", str),
+            ("rows", List[Tuple[str, List[seat]]]),
+        ],
+    )
+    return msgspec.defstruct(
+        "Seatmap",
+        [
+            ("key", str),
+            ("availabilityTimestamp", int),
+            ("individualSeats", int),
+            ("dimension", List[int]),
+            ("seatSize", int),
+            ("blocks", List[block]),
+            ("pcs", List[List[Any]]),
+        ],
+    )
+
+
+def decode_seatmap(data: bytes) -> "Dict | Any":
+    """Decodes a SeatMapHandler response. With msgspec the blocks are decoded straight into structs and every
+    row and seat into a tuple, which is faster and smaller than dicts and lists. Responses that do not match the
+    expected layout and installs without msgspec are decoded into dicts by the json backend.
+
+    Args:
+        data (bytes): Body of the response.
+
+    Returns:
+        Dict | Any: Seatmap struct or dict accepted by ColumnarSeatmap.from_api.
+    """
+    if not jsonlib.is_installed("msgspec"):
+        return jsonlib.loads(data)
+
+    import msgspec  # pylint: disable=import-outside-toplevel
+
+    try:
+        return jsonlib.decode(data, _get_seatmap_struct())
+    except msgspec.ValidationError:
+        return jsonlib.loads(data)
+
+
+@instrument_parser
+def parse_columnar_seatmap_from_api(seatmap_data: "Dict | Any") -> ColumnarSeatmap:
+    """This function parses the eventim seatmap data into a columnar seatmap.
+
+    Args:
+        seatmap_data (Dict | Any): Raw seatmap data returned by the SeatMapHandler or by decode_seatmap.
+
+    Returns:
+        ColumnarSeatmap: Seatmap with parallel numpy arrays per seat.
+    """
+    return ColumnarSeatmap.from_api(seatmap_data)
+
+
+class SeatmapIndex:
+    """Query engine over the seats of a ColumnarSeatmap.
+
+    The seats are indexed twice:
+    - Per row, sorted by x. Neighbours in a row belong to the same run of adjacent seats unless their distance
+      exceeds gap_factor seat sizes. The api only returns available seats, so sold seats and aisles end a run.
+    - In a uniform grid of cell_size cells for box and polygon queries.
+
+    Queries return seat indices into the seatmap, usable with ColumnarSeatmap.select and get_seat.
+    """
+
+    # pylint: disable=too-many-instance-attributes,line-too-long
+
+    def __init__(
+        self,
+        seatmap: ColumnarSeatmap,
+        cell_size: float | None = None,
+        gap_factor: float = 1.5,
+    ) -> None:
+        """
+        Args:
+            seatmap (ColumnarSeatmap): Seatmap to index.
+            cell_size (float | None, optional): Edge length of the grid cells. Defaults to 8 seat sizes.
+            gap_factor (float, optional): Largest distance of adjacent seats in seat sizes. Defaults to 1.5.
+        """
+        _require_numpy()
+        self.seatmap: ColumnarSeatmap = seatmap
+        seat_size = seatmap.meta.get("seatmap_seat_size") or 1
+        self.max_gap: float = gap_factor * seat_size
+        self.cell_size: float = cell_size or 8 * seat_size
+        if self.cell_size <= 0:
+            raise ValueError("cell_size must be positive.")
+
+        # Seats sorted by row and x
+        self.row_order: np.ndarray = np.lexsort(
+            (seatmap.seat_x, seatmap.seat_row_index)
+        )
+        rows = seatmap.seat_row_index[self.row_order]
+        x = seatmap.seat_x[self.row_order]
+        self._run_start: np.ndarray = np.ones(len(rows), dtype=bool)
+        if len(rows):
+            self._run_start[1:] = (rows[1:] != rows[:-1]) | (np.diff(x) > self.max_gap)
+        self._run_end: np.ndarray = self._get_run_end(self._run_start)
+
+        # Seats sorted by grid cell
+        self._columns = (
+            int(seatmap.meta.get("seatmap_dimension_x") or 0) // int(self.cell_size) + 1
+        )
+        if len(seatmap):
+            self._columns = max(
+                self._columns, int(seatmap.seat_x.max() // self.cell_size) + 1
+            )
+        cells = self._get_cells(seatmap.seat_x, seatmap.seat_y)
+        self.cell_order: np.ndarray = np.argsort(cells, kind="stable")
+        self._cells: np.ndarray = cells[self.cell_order]
+
+    @staticmethod
+    def _get_run_end(run_start: "np.ndarray") -> "np.ndarray":
+        # Exclusive end position of the run of every position
+        starts = np.flatnonzero(run_start)
+        ends = np.append(starts[1:], len(run_start))
+        return ends[np.cumsum(run_start) - 1]
+
+    def _get_cells(self, x: "np.ndarray", y: "np.ndarray") -> "np.ndarray":
+        return (y // self.cell_size).astype(np.int64) * self._columns + (
+            x // self.cell_size
+        ).astype(np.int64)
+
+    def _get_price_category(self, price_category: int | str) -> int:
+        if isinstance(price_category, str):
+            return self.seatmap.price_category_ids.index(price_category)
+
+        return price_category
+
+    def find_adjacent_seats(
+        self,
+        count: int,
+        price_category: int | str | None = None,
+        block_id: str | None = None,
+        limit: int | None = None,
+    ) -> "np.ndarray":
+        """Finds every placement of count adjacent available seats in the same row.
+
+        Args:
+            count (int): Number of seats side by side.
+            price_category (int | str | None, optional): Only seats of this price category (index or id). Defaults to None.
+            block_id (str | None, optional): Only seats of this block. Defaults to None.
+            limit (int | None, optional): Maximum number of placements. Defaults to None.
+
+        Returns:
+            np.ndarray: Seat indices of shape (placements, count), every placement ordered by x.
+        """
+        if count < 1:
+            raise ValueError("count must be at least 1.")
+
+        run_start, run_end = self._run_start, self._run_end
+        selected = None
+        if price_category is not None:
+            price_category = self._get_price_category(price_category)
+            selected = (
+                self.seatmap.seat_price_category_index[self.row_order] == price_category
+            )
+
+        if block_id is not None:
+            block_index = self.seatmap.block_ids.index(block_id)
+            in_block = self.seatmap.seat_block_index[self.row_order] == block_index
+            selected = in_block if selected is None else selected & in_block
+
+        if selected is not None:
+            # Unselected seats end a run like sold seats
+            run_start = run_start.copy()
+            run_start[1:] |= selected[1:] != selected[:-1]
+            run_end = self._get_run_end(run_start)
+
+        positions = np.arange(len(run_end))
+        starts = np.flatnonzero(run_end - positions >= count)
+        if selected is not None:
+            starts = starts[selected[starts]]
+
+        if limit is not None:
+            starts = starts[:limit]
+
+        return self.row_order[starts[:, None] + np.arange(count)]
+
+    def find_best_seats(
+        self,
+        price_category: int | str,
+        count: int = 1,
+        focus: Tuple[float, float] | None = None,
+        limit: int | None = 10,
+    ) -> "np.ndarray":
+        """Finds the placements of count adjacent seats in a price category closest to a focus point like the stage.
+
+        Args:
+            price_category (int | str): Index or id of the price category.
+            count (int, optional): Number of seats side by side. Defaults to 1.
+            focus (Tuple[float, float] | None, optional): Point the seats should be close to.
+                Defaults to the center of the seatmap.
+            limit (int | None, optional): Maximum number of placements. Defaults to 10.
+
+        Returns:
+            np.ndarray: Seat indices of shape (placements, count), best placement first.
+        """
+        placements = self.find_adjacent_seats(count, price_category=price_category)
+        if focus is None:
+            focus = (
+                self.seatmap.meta.get("seatmap_dimension_x", 0) / 2,
+                self.seatmap.meta.get("seatmap_dimension_y", 0) / 2,
+            )
+
+        center_x = self.seatmap.seat_x[placements].mean(axis=1)
+        center_y = self.seatmap.seat_y[placements].mean(axis=1)
+        distance = (center_x - focus[0]) ** 2 + (center_y - focus[1]) ** 2
+        ranking = np.argsort(distance, kind="stable")
+        if limit is not None:
+            ranking = ranking[:limit]
+
+        return placements[ranking]
+
+    def find_seats_in_box(
+        self, x_min: float, y_min: float, x_max: float, y_max: float
+    ) -> "np.ndarray":
+        """Finds the seats inside a bounding box. The bounds are inclusive.
+
+        Args:
+            x_min (float): Left bound
+            y_min (float): Upper bound
+            x_max (float): Right bound
+            y_max (float): Lower bound
+
+        Returns:
+            np.ndarray: Sorted seat indices.
+        """
+        if x_min > x_max or y_min > y_max or not len(self._cells):
+            return np.empty(0, dtype=np.int64)
+
+        column_min = max(int(x_min // self.cell_size), 0)
+        column_max = min(int(x_max // self.cell_size), self._columns - 1)
+        row_min = max(int(y_min // self.cell_size), 0)
+        # The last occupied grid row bounds the slices, whatever the bounds are
+        row_max = min(
+            int(y_max // self.cell_size), int(self._cells[-1]) // self._columns
+        )
+        if column_min > column_max or row_min > row_max:
+            return np.empty(0, dtype=np.int64)
+
+        # One slice of consecutive cells per grid row
+        grid_rows = np.arange(row_min, row_max + 1) * self._columns
+        lower = np.searchsorted(self._cells, grid_rows + column_min, side="left")
+        upper = np.searchsorted(self._cells, grid_rows + column_max, side="right")
+        candidates = np.concatenate(
+            [
+                self.cell_order[x:y]
+                for x, y in zip(lower.tolist(), upper.tolist())
+                if x < y
+            ]
+            or [np.empty(0, dtype=np.int64)]
+        )
+
+        x = self.seatmap.seat_x[candidates]
+        y = self.seatmap.seat_y[candidates]
+        inside = (x >= x_min) & (x <= x_max) & (y >= y_min) & (y <= y_max)
+        return np.sort(candidates[inside])
+
+    def find_seats_in_polygon(self, polygon: List[Tuple[float, float]]) -> "np.ndarray":
+        """Finds the seats inside a polygon using the even-odd rule.
+
+        Args:
+            polygon (List[Tuple[float, float]]): Corners of the polygon as (x, y).
+
+        Returns:
+            np.ndarray: Sorted seat indices.
+        """
+        if len(polygon) < 3:
+            raise ValueError("polygon needs at least 3 corners.")
+
+        corners = np.asarray(polygon, dtype=np.float64)
+        candidates = self.find_seats_in_box(*corners.min(axis=0), *corners.max(axis=0))
+        x = self.seatmap.seat_x[candidates].astype(np.float64)
+        y = self.seatmap.seat_y[candidates].astype(np.float64)
+
+        inside = np.zeros(len(candidates), dtype=bool)
+        for (x1, y1), (x2, y2) in zip(corners, np.roll(corners, -1, axis=0)):
+            crosses = (y1 > y) != (y2 > y)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                x_cross = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+            inside ^= crosses & (x < x_cross)
+
+        return candidates[inside]
+
+
+# Separates block, row and seat code in the keys of a snapshot
+_SEAT_KEY_SEPARATOR = "\x1f"
+
+
+def _make_seat_key(block_id: str, row_code: str, seat_code: str) -> str:
+    return f"{block_id}{_SEAT_KEY_SEPARATOR}{row_code}{_SEAT_KEY_SEPARATOR}{seat_code}"
+
+
+def _split_seat_key(seat_key: str) -> Tuple[str, str, str]:
+    block_id, row_code, seat_code = seat_key.split(_SEAT_KEY_SEPARATOR)
+    return block_id, row_code, seat_code
+
+
+class SeatmapSnapshot:
+    """Compact snapshot of the available seats of a seatmap.
+    Maps every seat (block_id, row_code, seat_code) to the id of its price category.
+    """
+
+    __slots__ = ("key", "timestamp", "seats")
+
+    def __init__(self, key: str, timestamp: int, seats: Dict[str, str]) -> None:
+        self.key: str = key
+        self.timestamp: int = timestamp
+        self.seats: Dict[str, str] = seats
+
+    @classmethod
+    def from_seatmap(cls, seatmap: "Dict | ColumnarSeatmap") -> "SeatmapSnapshot":
+        """Builds a snapshot from a raw seatmap, a parsed seatmap or a ColumnarSeatmap.
+
+        Args:
+            seatmap (Dict | ColumnarSeatmap): Seatmap returned by get_event_seatmap().
+
+        Returns:
+            SeatmapSnapshot: The snapshot.
+        """
+        # pylint: disable=line-too-long
+        if isinstance(seatmap, SeatmapSnapshot):
+            return seatmap
+
+        if isinstance(seatmap, ColumnarSeatmap):
+            price_category_ids = seatmap.price_category_ids
+            seats = {
+                _make_seat_key(*identity): price_category_ids[price_category_index]
+                for identity, price_category_index in zip(
+                    seatmap.get_seat_identities(),
+                    seatmap.seat_price_category_index.tolist(),
+                )
+            }
+            return cls(
+                seatmap.meta["seatmap_key"], seatmap.meta["seatmap_timestamp"], seats
+            )
+
+        if "seatmap_key" in seatmap:
+            price_category_ids = [
+                x["price_category_id"] for x in seatmap["price_categories"]
+            ]
+            seats = {
+                _make_seat_key(
+                    block["block_id"], row["row_code"], seat["seat_code"]
+                ): price_category_ids[seat["seat_price_category_index"]]
+                for block in seatmap["blocks"]
+                for row in block["block_rows"]
+                for seat in row["row_seats"]
+            }
+            return cls(seatmap["seatmap_key"], seatmap["seatmap_timestamp"], seats)
+
+        price_category_ids = [x[0] for x in seatmap["pcs"]]
+        seats = {
+            _make_seat_key(block["blockId"], row[0], seat[0]): price_category_ids[
+                seat[1]
+            ]
+            for block in seatmap["blocks"]
+            for row in block["rows"]
+            for seat in row[1]
+        }
+        return cls(seatmap["key"], seatmap["availabilityTimestamp"], seats)
+
+    def __len__(self) -> int:
+        return len(self.seats)
+
+    def __contains__(self, seat: Tuple[str, str, str]) -> bool:
+        return _make_seat_key(*seat) in self.seats
+
+
+class SeatmapDiff:
+    """Difference between two snapshots of the same seatmap.
+    Seats are given as (block_id, row_code, seat_code).
+    """
+
+    def __init__(
+        self,
+        old_timestamp: int,
+        new_timestamp: int,
+        became_unavailable: List[Tuple[str, str, str]],
+        became_available: List[Tuple[str, str, str]],
+        price_category_changes: List[Tuple[Tuple[str, str, str], str, str]],
+    ) -> None:
+        self.old_timestamp: int = old_timestamp
+        self.new_timestamp: int = new_timestamp
+        self.became_unavailable: List[Tuple[str, str, str]] = became_unavailable
+        self.became_available: List[Tuple[str, str, str]] = became_available
+        self.price_category_changes: List[Tuple[Tuple[str, str, str], str, str]] = (
+            price_category_changes
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        """True if nothing changed between the snapshots."""
+        return not (
+            self.became_unavailable
+            or self.became_available
+            or self.price_category_changes
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the diff as a dict.
+
+        Returns:
+            Dict[str, Any]: The diff.
+        """
+        return dict(
+            old_timestamp=self.old_timestamp,
+            new_timestamp=self.new_timestamp,
+            became_unavailable=self.became_unavailable,
+            became_available=self.became_available,
+            price_category_changes=self.price_category_changes,
+        )
+
+
+def diff_seatmaps(
+    old: "Dict | ColumnarSeatmap | SeatmapSnapshot",
+    new: "Dict | ColumnarSeatmap | SeatmapSnapshot",
+) -> SeatmapDiff:
+    """Computes the changes between two seatmaps of the same event using a hashed seat index.
+
+    Args:
+        old (Dict | ColumnarSeatmap | SeatmapSnapshot): Older seatmap (raw, parsed, columnar or snapshot).
+        new (Dict | ColumnarSeatmap | SeatmapSnapshot): Newer seatmap (raw, parsed, columnar or snapshot).
+
+    Returns:
+        SeatmapDiff: Seats that became unavailable or available and price category changes.
+    """
+    # pylint: disable=line-too-long
+    old = SeatmapSnapshot.from_seatmap(old)
+    new = SeatmapSnapshot.from_seatmap(new)
+    old_seats, new_seats = old.seats, new.seats
+
+    return SeatmapDiff(
+        old_timestamp=old.timestamp,
+        new_timestamp=new.timestamp,
+        became_unavailable=sorted(
+            _split_seat_key(x) for x in old_seats.keys() - new_seats.keys()
+        ),
+        became_available=sorted(
+            _split_seat_key(x) for x in new_seats.keys() - old_seats.keys()
+        ),
+        price_category_changes=sorted(
+            (_split_seat_key(x), old_seats[x], new_seats[x])
+            for x in old_seats.keys() & new_seats.keys()
+            if old_seats[x] != new_seats[x]
+        ),
+    )
+
+
+class SeatmapTracker:
+    """Keeps the latest snapshot per event and returns the changes of every update."""
+
+    def __init__(self) -> None:
+        self._snapshots: Dict[str, SeatmapSnapshot] = {}
+        self._lock = threading.Lock()
+
+    def update(
+        self,
+        seatmap: "Dict | ColumnarSeatmap | SeatmapSnapshot",
+        event_key: str | None = None,
+    ) -> SeatmapDiff | None:
+        """Stores the seatmap as latest snapshot of the event.
+
+        Args:
+            seatmap (Dict | ColumnarSeatmap | SeatmapSnapshot): Seatmap returned by get_event_seatmap().
+            event_key (str | None, optional): Key of the event. Defaults to the seatmap key.
+
+        Returns:
+            SeatmapDiff | None: Changes to the previous snapshot or None for the first snapshot of the event.
+        """
+        # pylint: disable=line-too-long
+        snapshot = SeatmapSnapshot.from_seatmap(seatmap)
+        event_key = event_key or snapshot.key
+
+        with self._lock:
+            previous = self._snapshots.get(event_key)
+            self._snapshots[event_key] = snapshot
+
+        if previous is None:
+            return None
+
+        return diff_seatmaps(previous, snapshot)
+
+    def get_snapshot(self, event_key: str) -> SeatmapSnapshot | None:
+        """Returns the latest snapshot of an event.
+
+        Args:
+            event_key (str): Key of the event.
+
+        Returns:
+            SeatmapSnapshot | None: The snapshot or None if the event is not tracked.
+        """
+        return self._snapshots.get(event_key)
+
+    def remove(self, event_key: str) -> None:
+        """Stops tracking an event.
+
+        Args:
+            event_key (str): Key of the event.
+        """
+        with self._lock:
+            self._snapshots.pop(event_key, None)
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+
+class SeatmapParamsCache:
+    """Signed seatmap params per event key. Entries are dropped margin seconds before their signature expires.
+
+    The private API signs seatmap requests with an expiryTime. Params without one are kept for ttl seconds.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        margin: float = 30.0,
+        max_entries: int = 10000,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Args:
+            ttl (float, optional): Lifetime in seconds of params without an expiryTime. Defaults to 300.0.
+            margin (float, optional): Treat params as expired this many seconds before their expiry. Defaults to 30.0.
+            max_entries (int, optional): Least recently used entries are evicted beyond this size. Defaults to 10000.
+            clock (Callable[[], float], optional): Returns the current unix timestamp. Defaults to time.time.
+        """
+        # pylint: disable=line-too-long
+        self.ttl: float = ttl
+        self.margin: float = margin
+        self.max_entries: int = max_entries
+        self.clock: Callable[[], float] = clock
+        self._entries: OrderedDict[str, Tuple[Dict, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, event_key: str) -> Dict | None:
+        """Returns a copy of the params of an event if they are not about to expire.
+
+        Args:
+            event_key (str): Key of the event.
+
+        Returns:
+            Dict | None: The params or None if nothing valid is cached.
+        """
+        with self._lock:
+            entry = self._entries.get(event_key)
+            if entry is None:
+                return None
+
+            if self.clock() >= entry[1] - self.margin:
+                del self._entries[event_key]
+                return None
+
+            self._entries.move_to_end(event_key)
+            return dict(entry[0])
+
+    def set(self, event_key: str, params: Dict) -> float:
+        """Stores the params of an event.
+
+        Args:
+            event_key (str): Key of the event.
+            params (Dict): Params returned by parse_seatmap_url_params_from_seatmap_information.
+
+        Returns:
+            float: Expiry of the params as unix timestamp.
+        """
+        expiry = parse_seatmap_expiry_from_seatmap_params(params)
+        if expiry is None:
+            expiry = self.clock() + self.ttl
+
+        with self._lock:
+            self._entries[event_key] = (dict(params), expiry)
+            self._entries.move_to_end(event_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return expiry
+
+    def get_expiry(self, event_key: str) -> float | None:
+        """Returns when the params of an event expire.
+
+        Args:
+            event_key (str): Key of the event.
+
+        Returns:
+            float | None: Expiry as unix timestamp or None if the event is not cached.
+        """
+        with self._lock:
+            entry = self._entries.get(event_key)
+
+        return entry[1] if entry is not None else None
+
+    def invalidate(self, event_key: str) -> None:
+        """Drops the params of an event, e.g. after the private api rejected them.
+
+        Args:
+            event_key (str): Key of the event.
+        """
+        with self._lock:
+            self._entries.pop(event_key, None)
+
+    def clear(self) -> None:
+        """Drops all params."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
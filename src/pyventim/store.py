@@ -0,0 +1,399 @@
+"""Local SQLite store of explored attractions, locations, product groups and events."""
+
+import itertools
+import json
+import sqlite3
+import threading
+import time
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Literal, Tuple
+
+from . import jsonlib
+from .utils import parse_city_id_from_link, parse_event_id_from_event_url
+
+ATTRACTION = "attraction"
+LOCATION = "location"
+PRODUCT_GROUP = "product_group"
+EVENT = "event"
+CALENDAR_EVENT = "calendar_event"
+
+Kind = Literal["attraction", "location", "product_group", "event", "calendar_event"]
+
+# entity_id, name, city_id, start, categories
+_Fields = Tuple[str | None, str | None, int | None, str | None, List[str]]
+
+
+def _get_city_id(link: str | None) -> int | None:
+    # Only venue links carry the city, e.g. /city/hamburg-7/venue/...
+    if not link or "/city/" not in link:
+        return None
+
+    try:
+        return parse_city_id_from_link(link)
+    except (ValueError, IndexError):
+        return None
+
+
+def _get_id(value: Any) -> str | None:
+    return str(value) if value is not None else None
+
+
+def _get_attraction_fields(item: Dict) -> _Fields:
+    return _get_id(item.get("attractionId")), item.get("name"), None, None, []
+
+
+def _get_location_fields(item: Dict) -> _Fields:
+    return (
+        _get_id(item.get("locationId")),
+        item.get("name"),
+        _get_city_id(item.get("link")),
+        None,
+        [],
+    )
+
+
+def _get_product_group_fields(item: Dict) -> _Fields:
+    return (
+        _get_id(item.get("productGroupId")),
+        item.get("name"),
+        None,
+        item.get("startDate"),
+        [x["name"] for x in item.get("categories") or [] if x.get("name")],
+    )
+
+
+def _get_event_fields(item: Dict) -> _Fields:
+    url = item.get("url")
+    return (
+        str(parse_event_id_from_event_url(url)) if url else None,
+        item.get("name"),
+        _get_city_id((item.get("location") or {}).get("sameAs")),
+        item.get("startDate"),
+        [],
+    )
+
+
+def _get_calendar_event_fields(item: Dict) -> _Fields:
+    return _get_id(item.get("id")), item.get("title"), None, item.get("start"), []
+
+
+_FIELDS: Dict[str, Callable[[Dict], _Fields]] = {
+    ATTRACTION: _get_attraction_fields,
+    LOCATION: _get_location_fields,
+    PRODUCT_GROUP: _get_product_group_fields,
+    EVENT: _get_event_fields,
+    CALENDAR_EVENT: _get_calendar_event_fields,
+}
+
+
+class EntityStore:
+    """SQLite store of explored entities for offline analysis.
+
+    Entities are upserted in batches, one transaction per batch, and keyed by kind and id. Besides the raw item
+    the store keeps indexed columns for the city id (parsed from venue links), the start date and the categories.
+    The database runs in WAL mode so readers do not block the writer.
+    """
+
+    def __init__(self, path: str = ":memory:", batch_size: int = 500) -> None:
+        """
+        Args:
+            path (str, optional): Path of the database. Defaults to ":memory:".
+            batch_size (int, optional): Entities written per transaction. Defaults to 500.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+
+        self.path: str = path
+        self.batch_size: int = batch_size
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(
+            "CREATE TABLE IF NOT EXISTS entities ("
+            "kind TEXT NOT NULL, entity_id TEXT NOT NULL, name TEXT, city_id INTEGER, "
+            "start TEXT, start_date TEXT, product_group_id TEXT, data TEXT NOT NULL, "
+            "updated_at REAL NOT NULL, PRIMARY KEY (kind, entity_id));"
+            "CREATE TABLE IF NOT EXISTS categories ("
+            "kind TEXT NOT NULL, entity_id TEXT NOT NULL, category TEXT NOT NULL, "
+            "PRIMARY KEY (kind, entity_id, category)) WITHOUT ROWID;"
+            "CREATE INDEX IF NOT EXISTS entities_city_id ON entities (kind, city_id);"
+            "CREATE INDEX IF NOT EXISTS entities_start_date ON entities (kind, start_date);"
+            "CREATE INDEX IF NOT EXISTS entities_product_group_id "
+            "ON entities (kind, product_group_id);"
+            "CREATE INDEX IF NOT EXISTS categories_category ON categories (category, kind);"
+        )
+        self._connection.commit()
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self._connection.close()
+
+    def __enter__(self) -> "EntityStore":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _write(self, kind: str, rows: List[Tuple], categories: List[Tuple]) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT INTO entities (kind, entity_id, name, city_id, start, start_date, "
+                "product_group_id, data, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (kind, entity_id) DO UPDATE SET name = excluded.name, "
+                "city_id = excluded.city_id, start = excluded.start, start_date = excluded.start_date, "
+                "product_group_id = COALESCE(excluded.product_group_id, product_group_id), "
+                "data = excluded.data, updated_at = excluded.updated_at",
+                rows,
+            )
+            self._connection.executemany(
+                "DELETE FROM categories WHERE kind = ? AND entity_id = ?",
+                ((kind, x[1]) for x in rows),
+            )
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO categories VALUES (?, ?, ?)", categories
+            )
+
+    def add(
+        self,
+        kind: Kind,
+        items: Iterable[Dict],
+        product_group_id: int | str | None = None,
+    ) -> int:
+        # pylint: disable=line-too-long
+        """Upserts entities of one kind. Items are consumed lazily, so iterators of any size can be passed.
+
+        Args:
+            kind (Kind): Kind of the items.
+            items (Iterable[Dict]): Items as returned by the client. Typed records are stored as their raw item.
+            product_group_id (int | str | None, optional): Product group of events. Defaults to None.
+
+        Raises:
+            ValueError: Raised if kind is unknown.
+
+        Returns:
+            int: Number of stored entities. Items without id are skipped.
+        """
+        get_fields = _FIELDS.get(kind)
+        if get_fields is None:
+            raise ValueError(f"kind must be one of {list(_FIELDS)}, got {kind!r}")
+
+        product_group_id = _get_id(product_group_id)
+        stored = 0
+        items = iter(items)
+        while batch := list(itertools.islice(items, self.batch_size)):
+            now = time.time()
+            rows = []
+            categories = []
+            for item in batch:
+                if not isinstance(item, dict):
+                    item = item.to_dict()
+
+                entity_id, name, city_id, start, item_categories = get_fields(item)
+                if entity_id is None:
+                    continue
+
+                rows.append(
+                    (
+                        kind,
+                        entity_id,
+                        name,
+                        city_id,
+                        start,
+                        start[:10] if start else None,
+                        product_group_id,
+                        json.dumps(item, separators=(",", ":"), ensure_ascii=False),
+                        now,
+                    )
+                )
+                categories.extend((kind, entity_id, x) for x in item_categories)
+
+            self._write(kind, rows, categories)
+            stored = stored + len(rows)
+
+        return stored
+
+    def add_attractions(self, items: Iterable[Dict]) -> int:
+        """Upserts attractions of explore_attractions().
+
+        Args:
+            items (Iterable[Dict]): Attractions
+
+        Returns:
+            int: Number of stored attractions.
+        """
+        return self.add(ATTRACTION, items)
+
+    def add_locations(self, items: Iterable[Dict]) -> int:
+        """Upserts locations of explore_locations().
+
+        Args:
+            items (Iterable[Dict]): Locations
+
+        Returns:
+            int: Number of stored locations.
+        """
+        return self.add(LOCATION, items)
+
+    def add_product_groups(self, items: Iterable[Dict]) -> int:
+        """Upserts product groups of explore_product_groups().
+
+        Args:
+            items (Iterable[Dict]): Product groups
+
+        Returns:
+            int: Number of stored product groups.
+        """
+        return self.add(PRODUCT_GROUP, items)
+
+    def add_product_group_events(
+        self, items: Iterable[Dict], product_group_id: int | str | None = None
+    ) -> int:
+        """Upserts events of get_product_group_events().
+
+        Args:
+            items (Iterable[Dict]): Events in the MusicEvent schema.
+            product_group_id (int | str | None, optional): Product group of the events. Defaults to None.
+
+        Returns:
+            int: Number of stored events.
+        """
+        return self.add(EVENT, items, product_group_id)
+
+    def add_calendar_events(
+        self, items: Iterable[Dict], product_group_id: int | str | None = None
+    ) -> int:
+        """Upserts events of get_product_group_events_from_calendar().
+
+        Args:
+            items (Iterable[Dict]): Events in the calendar schema.
+            product_group_id (int | str | None, optional): Product group of the events. Defaults to None.
+
+        Returns:
+            int: Number of stored events.
+        """
+        return self.add(CALENDAR_EVENT, items, product_group_id)
+
+    def get(self, kind: Kind, entity_id: int | str) -> Dict | None:
+        """Returns a stored entity.
+
+        Args:
+            kind (Kind): Kind of the entity.
+            entity_id (int | str): Id of the entity.
+
+        Returns:
+            Dict | None: The item or None if it is not stored.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data FROM entities WHERE kind = ? AND entity_id = ?",
+                (kind, str(entity_id)),
+            ).fetchone()
+
+        return jsonlib.loads(row[0]) if row is not None else None
+
+    @staticmethod
+    def _build_where(
+        kind: str,
+        city_id: int | None,
+        date_from: date | None,
+        date_to: date | None,
+        category: str | None,
+        product_group_id: int | str | None,
+    ) -> Tuple[str, List]:
+        # pylint: disable=too-many-arguments
+        clauses = ["kind = ?"]
+        values: List[Any] = [kind]
+        if city_id is not None:
+            clauses.append("city_id = ?")
+            values.append(city_id)
+
+        if date_from is not None:
+            clauses.append("start_date >= ?")
+            values.append(date_from.isoformat())
+
+        if date_to is not None:
+            clauses.append("start_date <= ?")
+            values.append(date_to.isoformat())
+
+        if category is not None:
+            clauses.append(
+                "entity_id IN (SELECT entity_id FROM categories WHERE category = ? AND kind = ?)"
+            )
+            values.extend([category, kind])
+
+        if product_group_id is not None:
+            clauses.append("product_group_id = ?")
+            values.append(str(product_group_id))
+
+        return " AND ".join(clauses), values
+
+    def query(
+        self,
+        kind: Kind,
+        city_id: int | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        category: str | None = None,
+        product_group_id: int | str | None = None,
+        limit: int | None = None,
+    ) -> Iterator[Dict]:
+        # pylint: disable=line-too-long,too-many-arguments
+        """Returns the stored entities matching all given filters, ordered by start and id.
+
+        Args:
+            kind (Kind): Kind of the entities.
+            city_id (int | None, optional): City id parsed from the venue link (locations and events). Defaults to None.
+            date_from (date | None, optional): Start date later than or equal. Defaults to None.
+            date_to (date | None, optional): Start date earlier than or equal. Defaults to None.
+            category (str | None, optional): Category name (product groups). Defaults to None.
+            product_group_id (int | str | None, optional): Product group the events were stored with. Defaults to None.
+            limit (int | None, optional): Maximum number of entities. Defaults to None.
+
+        Yields:
+            Iterator[Dict]: The stored items.
+        """
+        where, values = self._build_where(
+            kind, city_id, date_from, date_to, category, product_group_id
+        )
+        sql = f"SELECT data FROM entities WHERE {where} ORDER BY start, entity_id"
+        if limit is not None:
+            sql = sql + " LIMIT ?"
+            values.append(limit)
+
+        with self._lock:
+            cursor = self._connection.execute(sql, values)
+
+        # Rows are fetched in batches so large results are never held at once
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(self.batch_size)
+
+            if not rows:
+                return
+
+            for (data,) in rows:
+                yield jsonlib.loads(data)
+
+    def count(
+        self,
+        kind: Kind,
+        city_id: int | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        category: str | None = None,
+        product_group_id: int | str | None = None,
+    ) -> int:
+        """Counts the stored entities matching all given filters. Takes the same filters as query().
+
+        Returns:
+            int: Number of matching entities.
+        """
+        # pylint: disable=too-many-arguments
+        where, values = self._build_where(
+            kind, city_id, date_from, date_to, category, product_group_id
+        )
+        with self._lock:
+            return self._connection.execute(
+                f"SELECT COUNT(*) FROM entities WHERE {where}", values
+            ).fetchone()[0]
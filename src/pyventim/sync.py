@@ -0,0 +1,324 @@
+"""Incremental synchronisation of product groups and events against a local SQLite state store."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from datetime import date
+from typing import Any, Dict, Iterable, Iterator, List, Literal
+
+from .metrics import get_params_fingerprint
+from .models import ExplorationParameters
+
+NEW = "new"
+CHANGED = "changed"
+VANISHED = "vanished"
+
+
+class SyncChange:
+    """A new, changed or vanished entity. entity is None for vanished entities."""
+
+    __slots__ = ("change", "scope", "entity_id", "entity", "content_hash")
+
+    def __init__(
+        self,
+        change: str,
+        scope: str,
+        entity_id: str,
+        entity: Dict[str, Any] | None,
+        content_hash: str,
+    ) -> None:
+        self.change: str = change
+        self.scope: str = scope
+        self.entity_id: str = entity_id
+        self.entity: Dict[str, Any] | None = entity
+        self.content_hash: str = content_hash
+
+    def __repr__(self) -> str:
+        return f"SyncChange({self.change!r}, {self.scope!r}, {self.entity_id!r})"
+
+
+def hash_entity(entity: Dict[str, Any], ignored_fields: Iterable[str] = ()) -> str:
+    """Returns a stable digest of an entity. Key order does not matter.
+
+    Args:
+        entity (Dict[str, Any]): Entity returned by the API
+        ignored_fields (Iterable[str], optional): Top level fields left out of the digest. Defaults to ().
+
+    Returns:
+        str: Hex digest of the entity.
+    """
+    ignored_fields = set(ignored_fields)
+    if ignored_fields:
+        entity = {x: y for x, y in entity.items() if x not in ignored_fields}
+
+    raw = json.dumps(entity, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class SyncState:
+    """SQLite store of the entity ids and content hashes seen per sync scope."""
+
+    def __init__(self, path: str = ":memory:") -> None:
+        """
+        Args:
+            path (str, optional): Path of the database. Defaults to ":memory:".
+        """
+        self.path: str = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(
+            "CREATE TABLE IF NOT EXISTS entities ("
+            "scope TEXT NOT NULL, entity_id TEXT NOT NULL, content_hash TEXT NOT NULL, "
+            "first_seen REAL NOT NULL, last_seen REAL NOT NULL, last_changed REAL NOT NULL, "
+            "PRIMARY KEY (scope, entity_id)) WITHOUT ROWID;"
+            "CREATE TABLE IF NOT EXISTS runs ("
+            "scope TEXT PRIMARY KEY, started_at REAL NOT NULL, finished_at REAL NOT NULL, "
+            "complete INTEGER NOT NULL, seen INTEGER NOT NULL, new INTEGER NOT NULL, "
+            "changed INTEGER NOT NULL, vanished INTEGER NOT NULL);"
+        )
+        self._connection.commit()
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self._connection.close()
+
+    def get_hashes(self, scope: str) -> Dict[str, str]:
+        """Returns the content hashes of a scope.
+
+        Args:
+            scope (str): Sync scope
+
+        Returns:
+            Dict[str, str]: Content hash per entity id.
+        """
+        with self._lock:
+            return dict(
+                self._connection.execute(
+                    "SELECT entity_id, content_hash FROM entities WHERE scope = ?",
+                    (scope,),
+                )
+            )
+
+    def get_last_run(self, scope: str) -> Dict[str, Any] | None:
+        """Returns the statistics of the last run of a scope.
+
+        Args:
+            scope (str): Sync scope
+
+        Returns:
+            Dict[str, Any] | None: Timestamps and counts of the run or None if the scope never ran.
+        """
+        with self._lock:
+            cursor = self._connection.execute(
+                "SELECT * FROM runs WHERE scope = ?", (scope,)
+            )
+            row = cursor.fetchone()
+
+        if row is None:
+            return None
+
+        return dict(zip([x[0] for x in cursor.description], row))
+
+    def save_run(
+        self,
+        scope: str,
+        seen: Dict[str, str],
+        changed: Iterable[str],
+        vanished: Iterable[str],
+        started_at: float,
+        complete: bool,
+        counts: Dict[str, int],
+    ) -> None:
+        """Stores the result of a run in one transaction.
+
+        Args:
+            scope (str): Sync scope
+            seen (Dict[str, str]): Content hash per entity id seen in the run.
+            changed (Iterable[str]): Ids of new and changed entities.
+            vanished (Iterable[str]): Ids of entities to remove.
+            started_at (float): Start of the run as unix timestamp.
+            complete (bool): True if the run walked the whole scope.
+            counts (Dict[str, int]): Number of new, changed and vanished entities.
+        """
+        # pylint: disable=too-many-arguments
+        now = time.time()
+        changed = set(changed)
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT INTO entities (scope, entity_id, content_hash, first_seen, last_seen, last_changed) "
+                "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (scope, entity_id) DO UPDATE SET "
+                "content_hash = excluded.content_hash, last_seen = excluded.last_seen, "
+                "last_changed = CASE WHEN ? THEN excluded.last_changed ELSE last_changed END",
+                ((scope, x, y, now, now, now, x in changed) for x, y in seen.items()),
+            )
+            self._connection.executemany(
+                "DELETE FROM entities WHERE scope = ? AND entity_id = ?",
+                ((scope, x) for x in vanished),
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    scope,
+                    started_at,
+                    now,
+                    complete,
+                    len(seen),
+                    counts[NEW],
+                    counts[CHANGED],
+                    counts[VANISHED],
+                ),
+            )
+
+
+class SyncEngine:
+    """Emits only new, changed and vanished entities compared to the previous run of the same scope.
+
+    A scope identifies what was synced, e.g. the product groups of one query. The state of a run is saved
+    when its iterator is exhausted or closed. Entities yielded before a consumer stops are saved, the rest is
+    untouched, so an interrupted run is picked up by the next one. Entities are only reported as vanished after a
+    complete run.
+    """
+
+    def __init__(
+        self, eventim, state: SyncState, ignored_fields: Iterable[str] = ()
+    ) -> None:
+        """
+        Args:
+            eventim (Eventim): Client used to fetch the entities.
+            state (SyncState): State store.
+            ignored_fields (Iterable[str], optional): Top level fields that do not count as change. Defaults to ().
+        """
+        self.eventim = eventim
+        self.state: SyncState = state
+        self.ignored_fields: List[str] = list(ignored_fields)
+
+    def _sync(
+        self,
+        scope: str,
+        items: Iterator[Dict],
+        id_field: str,
+        early_stop: int | None = None,
+    ) -> Iterator[SyncChange]:
+        # pylint: disable=too-many-locals
+        started_at = time.time()
+        known = self.state.get_hashes(scope)
+        seen: Dict[str, str] = {}
+        changed: List[str] = []
+        vanished: List[str] = []
+        counts = {NEW: 0, CHANGED: 0, VANISHED: 0}
+        complete = False
+        unchanged = 0
+
+        try:
+            for item in items:
+                entity_id = item.get(id_field)
+                if entity_id is None or str(entity_id) in seen:
+                    continue
+
+                entity_id = str(entity_id)
+                content_hash = hash_entity(item, self.ignored_fields)
+                seen[entity_id] = content_hash
+                previous = known.get(entity_id)
+
+                if previous == content_hash:
+                    unchanged = unchanged + 1
+                    if early_stop is not None and unchanged >= early_stop:
+                        break
+                    continue
+
+                unchanged = 0
+                change = NEW if previous is None else CHANGED
+                changed.append(entity_id)
+                counts[change] = counts[change] + 1
+                yield SyncChange(change, scope, entity_id, item, content_hash)
+            else:
+                complete = True
+
+            if complete:
+                for entity_id in sorted(known.keys() - seen.keys()):
+                    vanished.append(entity_id)
+                    counts[VANISHED] = counts[VANISHED] + 1
+                    yield SyncChange(VANISHED, scope, entity_id, None, known[entity_id])
+        finally:
+            if hasattr(items, "close"):
+                items.close()
+
+            self.state.save_run(
+                scope,
+                seen,
+                changed,
+                vanished,
+                started_at,
+                # A consumer may stop while vanished entities are reported
+                complete and len(vanished) == len(known.keys() - seen.keys()),
+                counts,
+            )
+
+    def sync_product_groups(
+        self,
+        params: ExplorationParameters,
+        early_stop: int | None = None,
+        scope: str | None = None,
+    ) -> Iterator[SyncChange]:
+        """Syncs the product groups of an exploration query.
+
+        Args:
+            params (ExplorationParameters): Query of the product groups. It is not modified.
+            early_stop (int | None, optional): Stop paging after this many consecutive known and
+                unchanged product groups. Runs that stop early do not report vanished product groups.
+                Only use it if new and changed product groups sort first, e.g. with date_from set to
+                today and sort="DateAsc" for a listing that grows at its end. Defaults to None (full sync).
+            scope (str | None, optional): Name of the scope. Defaults to a fingerprint of the query.
+
+        Yields:
+            Iterator[SyncChange]: New and changed product groups, then vanished ones.
+        """
+        scope = scope or "product_groups:" + get_params_fingerprint(
+            params.model_dump(exclude_none=True, exclude={"page"})
+        )
+        items = self.eventim.explore(params, kind="product_groups")
+        yield from self._sync(scope, items, "productGroupId", early_stop)
+
+    def sync_product_group_events(
+        self,
+        product_group_id: int,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        ticket_type: Literal["tickets", "vip_packages", "extras"] | None = None,
+        city_name: str | None = None,
+        scope: str | None = None,
+    ) -> Iterator[SyncChange]:
+        """Syncs the calendar events of a product group.
+
+        Args:
+            product_group_id (int): product_group_id to query
+            date_from (date | None, optional): Event date later than. Defaults to None.
+            date_to (date | None, optional): Event date earlier than. Defaults to None.
+            ticket_type (Literal["tickets", "vip_packages", "extras"] | None, optional): Include only
+                events with tickets avialible in type. Defaults to None.
+            city_name (str | None, optional): Include only events in city. Defaults to None.
+            scope (str | None, optional): Name of the scope. Defaults to the product group and the
+                filters.
+
+        Yields:
+            Iterator[SyncChange]: New and changed events, then vanished ones.
+        """
+        # pylint: disable=too-many-arguments
+        scope = scope or f"events:{product_group_id}:" + get_params_fingerprint(
+            dict(
+                date_from=date_from,
+                date_to=date_to,
+                ticket_type=ticket_type,
+                city_name=city_name,
+            )
+        )
+        items = self.eventim.get_product_group_events_from_calendar(
+            product_group_id=product_group_id,
+            date_from=date_from,
+            date_to=date_to,
+            ticket_type=ticket_type,
+            city_name=city_name,
+        )
+        yield from self._sync(scope, items, "id")
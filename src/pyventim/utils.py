@@ -1,11 +1,216 @@
 """Common utility functions for pyventim"""
 
-import json
+import codecs
 import pathlib
-from typing import Dict, List, Any
+import re
+from typing import TYPE_CHECKING, Dict, List, Any, Tuple
 
-import lxml
-import lxml.html
+from . import jsonlib
+from .metrics import instrument_parser
+
+if TYPE_CHECKING:  # pragma: no cover
+    import lxml.html
+
+# Matches html comments (to skip them) and script tags with their raw text.
+# Script text is raw in html, so the first closing tag ends the element just like in a DOM parser.
+_SCRIPT_SCANNER = re.compile(
+    r"<!--.*?-->"
+    r"|<script\b(?P<attributes>(?:[^>\"']|\"[^\"]*\"|'[^']*')*)>(?P<text>.*?)</script\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+_TYPE_ATTRIBUTE = re.compile(
+    r"""(?:^|\s)type\s*=\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<uq>[^\s"'>]+))""",
+    re.IGNORECASE,
+)
+
+
+def _compile_bytes(pattern: re.Pattern) -> re.Pattern:
+    return re.compile(pattern.pattern.encode("ascii"), pattern.flags & ~re.UNICODE)
+
+
+# Matches the "X von Y" pagination item of component pages
+_PAGINATION_SCANNER = re.compile(
+    r"<li\b(?:[^>\"']|\"[^\"]*\"|'[^']*')*?"
+    r"\bclass\s*=\s*(?:\"[^\"]*pagination-pages-small[^\"]*\"|'[^']*pagination-pages-small[^']*')"
+    r"(?:[^>\"']|\"[^\"]*\"|'[^']*')*>\s*(?P<current>\d+) von (?P<total>\d+)\s*<",
+    re.IGNORECASE,
+)
+_PAGINATION_CLASS = "pagination-pages-small"
+
+_SCRIPT_SCANNER_BYTES = _compile_bytes(_SCRIPT_SCANNER)
+_TYPE_ATTRIBUTE_BYTES = _compile_bytes(_TYPE_ATTRIBUTE)
+_PAGINATION_SCANNER_BYTES = _compile_bytes(_PAGINATION_SCANNER)
+
+
+def scan_script_texts(
+    html: str | bytes, script_type: str, encoding: str = "utf-8"
+) -> List[str]:
+    """Returns the raw text of all script tags with the given type without building a DOM.
+    Bytes are scanned without decoding the document, only the matching script texts are decoded.
+
+    Args:
+        html (str | bytes): HTML to scan
+        script_type (str): Value of the type attribute like "application/ld+json"
+        encoding (str, optional): Encoding of html if it is bytes. Defaults to "utf-8".
+
+    Returns:
+        List[str]: Script texts in document order.
+    """
+    is_bytes = isinstance(html, (bytes, bytearray, memoryview))
+    if is_bytes:
+        scanner, type_attribute = _SCRIPT_SCANNER_BYTES, _TYPE_ATTRIBUTE_BYTES
+        script_type = script_type.encode(encoding)
+    else:
+        scanner, type_attribute = _SCRIPT_SCANNER, _TYPE_ATTRIBUTE
+
+    texts = []
+    for match in scanner.finditer(html):
+        attributes = match.group("attributes")
+        if attributes is None:
+            continue  # Comment
+
+        type_match = type_attribute.search(attributes)
+        if type_match is None:
+            continue
+
+        value = type_match.group("dq")
+        if value is None:
+            value = type_match.group("sq")
+        if value is None:
+            value = type_match.group("uq")
+
+        if value == script_type:
+            text = match.group("text")
+            texts.append(bytes(text).decode(encoding) if is_bytes else text)
+
+    return texts
+
+
+class HtmlDocument:
+    """A html document that is parsed once on first access.
+    All html parsers accept a HtmlDocument instead of a string to share the parsed tree.
+
+    Script payloads are extracted with a lightweight scanner unless fast_path is False.
+    The full lxml tree is only built if it is needed. Bytes are parsed with the declared encoding
+    without decoding the whole document first.
+    """
+
+    def __init__(
+        self, html: str | bytes, fast_path: bool = True, encoding: str = "utf-8"
+    ) -> None:
+        self.html: str | bytes | None = html
+        self.fast_path: bool = fast_path
+        # Canonical codec name, libxml2 does not know every python alias
+        self.encoding: str = codecs.lookup(encoding).name
+        self._tree: "lxml.html.HtmlElement | None" = None
+        self._scripts: Dict[tuple, List[str]] = {}
+
+    def _get_html(self) -> str | bytes:
+        if self.html is None:
+            raise ValueError("The html of the document was released.")
+
+        return self.html
+
+    @property
+    def tree(self) -> "lxml.html.HtmlElement":
+        """The parsed lxml tree of the document. Parsed on first access and cached afterwards.
+
+        Returns:
+            lxml.html.HtmlElement: Root element of the document.
+        """
+        if self._tree is None:
+            # Imported on first use, the fast paths never need lxml
+            import lxml.html  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+            html = self._get_html()
+            if isinstance(html, str):
+                self._tree = lxml.html.fromstring(html)
+            else:
+                parser = lxml.html.HTMLParser(encoding=self.encoding)
+                self._tree = lxml.html.fromstring(bytes(html), parser=parser)
+
+        return self._tree
+
+    def release(self) -> None:
+        """Drops the html payload. Script texts that were already extracted and a built tree stay available."""
+        self.html = None
+
+    def get_script_texts(
+        self, script_type: str, fast_path: bool | None = None
+    ) -> List[str]:
+        """Returns the text of all script tags with the given type.
+
+        Args:
+            script_type (str): Value of the type attribute like "application/ld+json"
+            fast_path (bool | None, optional): Overrides the fast_path setting of the document. Defaults to None.
+
+        Returns:
+            List[str]: Script texts in document order.
+        """
+        # pylint: disable=line-too-long
+        fast_path = self.fast_path if fast_path is None else fast_path
+        if fast_path and self.html is None and self._tree is not None:
+            fast_path = False  # Released, only the tree is left
+
+        key = (script_type, fast_path)
+
+        if key not in self._scripts:
+            if fast_path:
+                html = self._get_html()
+                self._scripts[key] = (
+                    scan_script_texts(html, script_type)
+                    if isinstance(html, str)
+                    else scan_script_texts(html, script_type, self.encoding)
+                )
+            else:
+                self._scripts[key] = [
+                    x.text or ""
+                    for x in self.tree.findall(f".//script[@type='{script_type}']")
+                ]
+
+        return self._scripts[key]
+
+
+def _get_document(html: str | bytes | HtmlDocument) -> HtmlDocument:
+    if isinstance(html, HtmlDocument):
+        return html
+
+    return HtmlDocument(html)
+
+
+def _get_tree(html: str | bytes | HtmlDocument) -> "lxml.html.HtmlElement":
+    return _get_document(html).tree
+
+
+def _load_scripts(
+    html: str | bytes | HtmlDocument,
+    script_type: str,
+    contains: str | None = None,
+    first: bool = False,
+) -> List[Any]:
+    """Decodes the json payloads of matching script tags.
+    Falls back to the lxml tree if a payload found by the scanner is not valid json.
+    """
+    document = _get_document(html)
+
+    def load(fast_path: bool) -> List[Any]:
+        texts = [
+            x
+            for x in document.get_script_texts(script_type, fast_path=fast_path)
+            if contains is None or contains in x
+        ]
+        if first:
+            texts = texts[:1]
+
+        return [jsonlib.loads(x) for x in texts]
+
+    if not document.fast_path:
+        return load(fast_path=False)
+
+    try:
+        return load(fast_path=True)
+    except jsonlib.DECODE_ERRORS:
+        return load(fast_path=False)
 
 
 def parse_city_name_from_link(city_url: str) -> str:
@@ -34,97 +239,159 @@ def parse_city_id_from_link(city_url: str) -> int:
     return int(pathlib.Path(city_url).parts[3].split("-")[1])
 
 
-def parse_list_from_component_html(html: str) -> List[Dict[str, Any]]:
+def parse_event_id_from_event_url(event_url: str) -> int:
+    """This function returns the event id given a link like:
+    "https://www.eventim.de/event/disneys-der-koenig-der-loewen-stage-theater-im-hafen-hamburg-18500464/"
+
+    Args:
+        event_url (str): Link to parse
+
+    Returns:
+        int: The event id from the url.
+    """
+    return int(event_url.rstrip("/").split("/")[-1].split("-")[-1])
+
+
+def parse_event_key_from_event_url(event_url: str) -> str:
+    """This function returns the event key given a link like:
+    "https://www.eventim.de/event/disneys-der-koenig-der-loewen-stage-theater-im-hafen-hamburg-18500464/"
+    Relative links and bare event keys are accepted as well.
+
+    Args:
+        event_url (str): Link or event key to parse
+
+    Returns:
+        str: The event key from the url.
+    """
+    parts = [x for x in event_url.split("/") if x]
+    if "event" in parts[:-1]:
+        return parts[parts.index("event") + 1]
+
+    return parts[-1]
+
+
+@instrument_parser
+def parse_list_from_component_html(
+    html: str | bytes | HtmlDocument,
+) -> List[Dict[str, Any]]:
     """This function returns all json entries on a component html string
 
     Args:
-        html (str): HTML to look for json data
+        html (str | bytes | HtmlDocument): HTML to look for json data
 
     Returns:
         Dict: Returns a list of dictionaries containing the data
     """
-    return [
-        json.loads(x.text)
-        for x in lxml.html.fromstring(html).findall(
-            ".//script[@type='application/ld+json']"
-        )
-    ]
+    return _load_scripts(html, "application/ld+json")
 
 
-def parse_calendar_from_component_html(html: str) -> Dict[str, Any]:
+@instrument_parser
+def parse_calendar_from_component_html(
+    html: str | bytes | HtmlDocument,
+) -> Dict[str, Any]:
     """This function returns the calendar widget data entries of a component html string
 
     Args:
-        html (str): HTML to look for json data
+        html (str | bytes | HtmlDocument): HTML to look for json data
 
     Returns:
         Dict: Returns a dict with the calendar widget data
     """
-    return json.loads(
-        lxml.html.fromstring(html)
-        .xpath(
-            ".//script[@type='application/configuration' and contains(text(),'calendar_content')]"
-        )[0]
-        .text
-    )
+    return _load_scripts(
+        html, "application/configuration", contains="calendar_content", first=True
+    )[0]
 
 
-def parse_has_next_page_from_component_html(html: str) -> bool:
-    """Returns if the page has a proceeding page
+@instrument_parser
+def parse_pagination_from_component_html(
+    html: str | bytes | HtmlDocument,
+) -> Tuple[int, int] | None:
+    """Returns the current and total page of a component html string
 
     Args:
-        html (str): HTML to parse
+        html (str | bytes | HtmlDocument): HTML to parse
 
     Returns:
-        bool: Returns true if followed by another page.
+        Tuple[int, int] | None: Current and total page or None if the html has no pagination.
     """
-    matches = lxml.html.fromstring(html).xpath(
+    document = _get_document(html)
+    if document.fast_path and document.html is not None:
+        source = document.html
+        if isinstance(source, str):
+            match = _PAGINATION_SCANNER.search(source)
+            has_class = _PAGINATION_CLASS in source
+        else:
+            match = _PAGINATION_SCANNER_BYTES.search(source)
+            has_class = _PAGINATION_CLASS.encode("ascii") in source
+
+        if match is not None:
+            return int(match.group("current")), int(match.group("total"))
+        if not has_class:
+            return None
+
+    # The scanner found the class but not the expected markup, let the tree decide
+    matches = document.tree.xpath(
         ".//li[contains(@class,'pagination-pages-small') and contains(text(),' von ')]"
     )
     for match in matches:
-        current, total = match.text.split(" von ")
-        return current < total
+        current, total = match.text_content().split(" von ")
+        return int(current), int(total)
 
-    return False
+    return None
 
 
-def parse_has_seatmap_from_event_html(html: str) -> bool:
+# Not instrumented, the wrapped pagination parser already emits the event
+def parse_has_next_page_from_component_html(html: str | bytes | HtmlDocument) -> bool:
+    """Returns if the page has a proceeding page
+
+    Args:
+        html (str | bytes | HtmlDocument): HTML to parse
+
+    Returns:
+        bool: Returns true if followed by another page.
+    """
+    pagination = parse_pagination_from_component_html(html)
+    if pagination is None:
+        return False
+
+    current, total = pagination
+    return current < total
+
+
+@instrument_parser
+def parse_has_seatmap_from_event_html(html: str | bytes | HtmlDocument) -> bool:
     """This function checks if the html has a seatmap data compoenent
 
     Args:
-        html (str): HTML to check
+        html (str | bytes | HtmlDocument): HTML to check
 
     Returns:
         bool: True if the html has a seatmapOptions string
     """
-    return (
-        len(
-            lxml.html.fromstring(html).xpath(
-                ".//script[@type='application/configuration' and contains(text(),'seatmapOptions')]"
-            )
-        )
-        > 0
+    return any(
+        "seatmapOptions" in x
+        for x in _get_document(html).get_script_texts("application/configuration")
     )
 
 
-def parse_seatmap_configuration_from_event_html(html: str) -> Dict:
+@instrument_parser
+def parse_seatmap_configuration_from_event_html(
+    html: str | bytes | HtmlDocument,
+) -> Dict:
     """This function parses the seatmap configuration from an event page.
 
     Args:
-        html (str): HTML to parse
+        html (str | bytes | HtmlDocument): HTML to parse
 
     Returns:
         Dict: Returns the extracted json data.
     """
-    return json.loads(
-        lxml.html.fromstring(html)
-        .xpath(
-            ".//script[@type='application/configuration' and contains(text(),'seatmapOptions')]"
-        )[0]
-        .text
-    )
+    return _load_scripts(
+        html, "application/configuration", contains="seatmapOptions", first=True
+    )[0]
 
 
+@instrument_parser
 def parse_seathamp_data_from_api(seatmap_data: Dict) -> Dict:
     # pylint: disable=line-too-long
     """This function parses the eventim seatmap data in a more readable format
@@ -207,3 +474,19 @@ def parse_seatmap_url_params_from_seatmap_information(options: dict) -> Dict:
     params["fun"] = "json"
 
     return params
+
+
+def parse_seatmap_expiry_from_seatmap_params(params: dict) -> float | None:
+    """This function returns the expiry of signed seatmap params. The private api gives expiryTime in minutes since the epoch.
+
+    Args:
+        params (dict): Params returned by parse_seatmap_url_params_from_seatmap_information
+
+    Returns:
+        float | None: Expiry as unix timestamp or None if the params do not contain a valid expiryTime.
+    """
+    # pylint: disable=line-too-long
+    try:
+        return int(params["expiryTime"]) * 60.0
+    except (KeyError, TypeError, ValueError):
+        return None
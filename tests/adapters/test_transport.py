@@ -0,0 +1,102 @@
+# pylint: skip-file
+"""Unit tests for the transport configuration of the adapters"""
+
+import httpx
+import pydantic
+import pytest
+
+from pyventim import Eventim, AsyncEventim, adapters  # pylint: disable=E0401
+from pyventim.cache import MemoryCache  # pylint: disable=E0401
+from pyventim.models import TransportConfig  # pylint: disable=E0401
+from tests.conftest import FakeTransport, create_response
+
+
+class RecordingTransport(FakeTransport):
+    def __init__(self):
+        super().__init__()
+        self.timeouts = []
+
+    def respond(self, request, **kwargs):
+        self.timeouts.append(kwargs.get("timeout"))
+        return create_response(request, content={})
+
+
+def test_create_session_pool_sizes():
+    session = adapters.create_session(
+        TransportConfig(pool_connections=4, pool_maxsize=32, pool_block=True)
+    )
+    http_adapter = session.get_adapter("https://www.eventim.de")
+    assert http_adapter._pool_connections == 4
+    assert http_adapter._pool_maxsize == 32
+    assert http_adapter._pool_block is True
+
+
+def test_compression_and_keep_alive_headers():
+    session = adapters.create_session(
+        TransportConfig(compression=False, keep_alive=False)
+    )
+    assert session.headers["accept-encoding"] == "identity"
+    assert session.headers["connection"] == "close"
+
+    session = adapters.create_session(TransportConfig())
+    assert "gzip" in session.headers["accept-encoding"]
+
+
+def test_invalid_config():
+    with pytest.raises(pydantic.ValidationError):
+        TransportConfig(pool_maxsize=0)
+
+
+def test_eventim_shares_session():
+    eventim = Eventim()
+    assert eventim.rest_adapter.session is eventim.html_adapter.session
+    assert eventim.rest_adapter.session is eventim.private_rest_adapter.session
+
+    eventim = Eventim(transport=TransportConfig(share_session=False))
+    assert eventim.rest_adapter.session is not eventim.html_adapter.session
+
+
+def test_eventim_passes_timeouts():
+    transport = RecordingTransport()
+    eventim = Eventim(transport=TransportConfig(connect_timeout=3, read_timeout=7))
+    eventim.rest_adapter.session.mount("https://", transport)
+
+    eventim.rest_adapter.get("v1/attractions")
+    assert transport.timeouts == [(3, 7)]
+    assert "Firefox" in transport.requests[0].headers["user-agent"]
+
+
+def test_async_client_limits():
+    client = adapters.create_async_client(
+        TransportConfig(pool_maxsize=20, connect_timeout=2, read_timeout=5)
+    )
+    assert client.timeout.connect == 2
+    assert client.timeout.read == 5
+    assert isinstance(AsyncEventim(client=client).client, httpx.AsyncClient)
+
+
+def test_raw_html_adapter_keeps_bytes():
+    transport = RecordingTransport()
+    adapter = adapters.HtmlAdapter(raw=True, cache=MemoryCache())
+    adapter.session.mount("https://", transport)
+
+    assert adapter.get("event/x").html_data == b"{}"
+    assert adapter.get("event/x").html_data == b"{}"  # Restored from the cache
+    assert len(transport.requests) == 1
+
+    assert Eventim().html_adapter.raw is False
+    assert Eventim(raw_html=True).html_adapter.raw is True
+    assert AsyncEventim(raw_html=True).html_adapter.raw is True
+    assert adapters.HtmlAdapter().raw is False
+
+
+def test_html_adapter_cache_keeps_type():
+    cache = MemoryCache()
+    raw_adapter = adapters.HtmlAdapter(raw=True, cache=cache)
+    raw_adapter.session.mount("https://", RecordingTransport())
+    text_adapter = adapters.HtmlAdapter(cache=cache)
+
+    # Both adapters read the same entry in their own type
+    assert isinstance(raw_adapter.get("event/x").html_data, bytes)
+    assert isinstance(raw_adapter.get("event/x").html_data, bytes)
+    assert text_adapter.get("event/x").html_data == "{}"
@@ -0,0 +1,104 @@
+# pylint: skip-file
+"""Unit tests for the response caches"""
+
+import time
+
+from pyventim import adapters  # pylint: disable=E0401
+from pyventim.cache import (
+    ResponseCache,
+    MemoryCache,
+    SqliteCache,
+)  # pylint: disable=E0401
+from tests.conftest import FakeTransport, create_response
+
+
+def create_transport():
+    return FakeTransport(
+        lambda request: create_response(request, content={"url": request.url})
+    )
+
+
+def test_make_key_is_canonical():
+    a = ResponseCache.make_key("GET", "https://a/", "v1/x", {"b": 1, "a": [1, 2]})
+    b = ResponseCache.make_key("get", "https://a", "/v1/x", {"a": [1, 2], "b": "1"})
+    c = ResponseCache.make_key("GET", "https://a", "v1/x", {"a": [2, 1], "b": 1})
+    assert a == b
+    assert a != c
+
+
+def test_endpoint_ttls():
+    cache = MemoryCache(ttl=10, endpoint_ttls={"event/": 60, "seatmap/": 0})
+    assert cache.get_ttl("event/abc-123") == 60
+    assert cache.get_ttl("seatmap/api/SeatMapHandler") == 0
+    assert cache.get_ttl("component") == 10
+
+
+def test_memory_cache_lru_and_counters():
+    cache = MemoryCache(max_entries=2)
+    cache.set("a", b"1", ttl=60)
+    cache.set("b", b"2", ttl=60)
+    assert cache.get("a") == b"1"
+    cache.set("c", b"3", ttl=60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+    assert cache.get("c") == b"3"
+
+    stats = cache.stats()
+    assert stats["hits"] == 3
+    assert stats["misses"] == 1
+    assert stats["entries"] == 2
+
+
+def test_memory_cache_max_bytes_and_expiry():
+    cache = MemoryCache(max_entries=None, max_bytes=4)
+    cache.set("a", b"12", ttl=60)
+    cache.set("b", b"345", ttl=60)
+    assert cache.get("a") is None
+    assert cache.stats()["bytes"] == 3
+
+    cache.set("c", b"6", ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get("c") is None
+
+
+def test_sqlite_cache_persists(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    cache = SqliteCache(path)
+    cache.set("a", b"payload", ttl=60)
+    cache.close()
+
+    cache = SqliteCache(path, max_entries=1)
+    assert cache.get("a") == b"payload"
+    cache.set("b", b"other", ttl=60)
+    assert cache.get("a") is None
+    assert cache.get("b") == b"other"
+    assert cache.stats()["entries"] == 1
+    cache.close()
+
+
+def test_adapter_uses_cache():
+    transport = create_transport()
+    cache = MemoryCache()
+    adapter = adapters.RestAdapter(hostname="https://example.com", cache=cache)
+    adapter.session.mount("https://", transport)
+
+    first = adapter.get("v1/attractions", params={"search_term": "abc", "page": 1})
+    second = adapter.get("v1/attractions", params={"page": 1, "search_term": "abc"})
+    adapter.get("v1/attractions", params={"search_term": "abc", "page": 2})
+
+    assert first == second
+    assert len(transport.requests) == 2
+    assert cache.hits == 1
+    assert cache.misses == 2
+
+
+def test_adapter_skips_uncached_endpoints():
+    transport = create_transport()
+    cache = MemoryCache()
+    adapter = adapters.RestAdapter(hostname="https://example.com", cache=cache)
+    adapter.session.mount("https://", transport)
+
+    adapter.get("seatmap/api/SeatMapHandler", params={"evId": 1})
+    adapter.get("seatmap/api/SeatMapHandler", params={"evId": 1})
+    assert len(transport.requests) == 2
@@ -0,0 +1,118 @@
+# pylint: skip-file
+"""Fakes shared by the test modules. Import them with `from tests.conftest import ...`"""
+
+import http
+import json
+import threading
+from typing import Any, Callable, Dict, List
+
+import requests
+
+
+def create_response(
+    request: requests.PreparedRequest,
+    status_code: int = 200,
+    content: bytes | str | Dict | List = b"",
+    headers: Dict[str, str] | None = None,
+    reason: str | None = None,
+) -> requests.Response:
+    """Builds the response of a fake transport. Dicts and lists are sent as json, strings as utf-8."""
+    if isinstance(content, (dict, list)):
+        content = json.dumps(content)
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = reason or http.HTTPStatus(status_code).phrase
+    response.url = request.url
+    response.request = request
+    response.headers.update(headers or {})
+    response._content = content
+    return response
+
+
+class FakeTransport(requests.adapters.BaseAdapter):
+    """Answers the requests of a requests.Session without network access.
+    Subclasses implement respond(), otherwise the handler is called with the request.
+    Records the requests and the peak of concurrent requests.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[requests.PreparedRequest], requests.Response] | None = None,
+    ):
+        super().__init__()
+        self.handler = handler
+        self.requests: List[requests.PreparedRequest] = []
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def respond(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        return self.handler(request)
+
+    def send(self, request, **kwargs):
+        with self.lock:
+            self.requests.append(request)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+        try:
+            return self.respond(request, **kwargs)
+        finally:
+            with self.lock:
+                self.active -= 1
+
+    def close(self):
+        pass
+
+
+def create_seatmap_data(
+    blocks: int = 3,
+    rows: int = 4,
+    seats: int = 5,
+    price_categories: int = 2,
+    empty_rows: int = 1,
+) -> Dict[str, Any]:
+    """Builds a raw seatmap response of the private API.
+    Blocks are laid out ten per line and the first empty_rows rows of every block have no available seats.
+    """
+    return {
+        "key": "web_1_16825147_0_EVE_0",
+        "availabilityTimestamp": 1716215061170,
+        "individualSeats": blocks * (rows - empty_rows) * seats,
+        "dimension": [16384, 16384],
+        "seatSize": 59,
+        "blocks": [
+            {
+                "blockId": f"b{block}",
+                "name": f"Block {block}",
+                "blockDescription": f"Block {block}",
+                "rows": [
+                    [
+                        f"r{row}",
+                        (
+                            [
+                                [
+                                    f"s{seat}",
+                                    (block + seat) % price_categories,
+                                    (block % 10) * 1600 + seat * 60,
+                                    (block // 10) * 2000 + row * 60,
+                                ]
+                                for seat in range(seats)
+                            ]
+                            if row >= empty_rows
+                            else []
+                        ),
+                    ]
+                    for row in range(rows)
+                ],
+            }
+            for block in range(blocks)
+        ],
+        "pcs": [
+            [f"p{x + 1}", f"Kat. {x + 1}", "#f1075e", "#ffffff"]
+            for x in range(price_categories)
+        ],
+    }
@@ -0,0 +1,175 @@
+# pylint: skip-file
+"""Module to test the highlevel eventim.AsyncEventim methods against a mocked transport"""
+
+import asyncio
+from typing import Dict, AsyncIterator
+
+import httpx
+import pytest
+import pydantic
+from pyventim import AsyncEventim  # pylint: disable=E0401
+from pyventim.models import ExplorationParameters  # pylint: disable=E0401
+from pyventim.records import Attraction  # pylint: disable=E0401
+
+
+def exploration_handler(request: httpx.Request) -> httpx.Response:
+    page = int(request.url.params["page"])
+    links = {"self": {"href": ""}}
+    if page < 3:
+        links["next"] = {"href": ""}
+
+    return httpx.Response(
+        200,
+        json={
+            "attractions": [{"attractionId": f"{page}-{i}"} for i in range(2)],
+            "totalPages": 3,
+            "_links": links,
+        },
+    )
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+async def collect(iterator: AsyncIterator[Dict]):
+    return [item async for item in iterator]
+
+
+def test_async_attractions_pagination():
+    async def main():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(exploration_handler))
+        async with AsyncEventim(client=client) as eventim:
+            result = eventim.explore_attractions("Disneys DER KÖNIG DER LÖWEN")
+            assert isinstance(result, AsyncIterator)
+            return await collect(result)
+
+    attractions = run(main())
+    assert [x["attractionId"] for x in attractions] == [
+        "1-0",
+        "1-1",
+        "2-0",
+        "2-1",
+        "3-0",
+        "3-1",
+    ]
+
+
+def test_async_attractions_failure():
+    async def main():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(exploration_handler))
+        async with AsyncEventim(client=client) as eventim:
+            await collect(eventim.explore_attractions("a"))
+
+    with pytest.raises(
+        pydantic.ValidationError,
+        match="search_term must be atleast 3 characters long",
+    ):
+        run(main())
+
+
+def test_async_adapters_share_client():
+    async def main():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(exploration_handler))
+        async with AsyncEventim(client=client) as eventim:
+            assert eventim.rest_adapter.client is client
+            assert eventim.private_rest_adapter.client is client
+            assert eventim.html_adapter.client is client
+
+    run(main())
+
+
+def test_async_closes_only_own_client():
+    async def main():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(exploration_handler))
+        async with AsyncEventim(client=client):
+            pass
+        assert not client.is_closed
+        await client.aclose()
+
+        async with AsyncEventim() as eventim:
+            pass
+        assert eventim.client.is_closed
+
+    run(main())
+
+
+def test_async_get_event_seatmap():
+    raw = {
+        "key": "web_1_16825147_0_EVE_0",
+        "availabilityTimestamp": 1716215061170,
+        "individualSeats": 1,
+        "dimension": [4096, 4096],
+        "seatSize": 59,
+        "blocks": [
+            {
+                "blockId": "b1",
+                "name": "Parkett links",
+                "blockDescription": "Parkett links",
+                "rows": [["r2", [["s260", 0, 3783, 1471]]]],
+            }
+        ],
+        "pcs": [["p32914323", "Kat. 1 Premium", "#f1075e", "#ffffff"]],
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.host == "api.eventim.com"
+        assert request.url.params["signature"] == "abc"
+        return httpx.Response(200, json=raw)
+
+    options = {
+        "cType": "web",
+        "cId": 1,
+        "evId": 16828914,
+        "additionalRequestParams": "&timestamp=1&expiryTime=2&signature=abc",
+    }
+
+    async def main():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncEventim(client=client) as eventim:
+            return await eventim.get_event_seatmap(options)
+
+    seatmap = run(main())
+    assert seatmap["seatmap_key"] == "web_1_16825147_0_EVE_0"
+    assert seatmap["blocks"][0]["block_rows"][0]["row_seats"][0]["seat_code"] == "s260"
+
+
+def test_async_attractions_prefetch():
+    async def main():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(exploration_handler))
+        async with AsyncEventim(client=client) as eventim:
+            return await collect(
+                eventim.explore_attractions("Disneys DER KÖNIG DER LÖWEN", prefetch=2)
+            )
+
+    attractions = run(main())
+    assert [x["attractionId"] for x in attractions] == [
+        "1-0",
+        "1-1",
+        "2-0",
+        "2-1",
+        "3-0",
+        "3-1",
+    ]
+
+
+def test_async_attractions_typed():
+    async def main():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(exploration_handler))
+        async with AsyncEventim(client=client) as eventim:
+            return await collect(eventim.explore_attractions("Disneys", typed=True))
+
+    attractions = run(main())
+    assert all(isinstance(x, Attraction) for x in attractions)
+    assert attractions[0].raw == {"attractionId": "1-0"}
+
+
+def test_async_explore_with_parameters():
+    async def main():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(exploration_handler))
+        params = ExplorationParameters(search_term="Disneys", page=2)
+        async with AsyncEventim(client=client) as eventim:
+            return await collect(eventim.explore(params, kind="attractions"))
+
+    attractions = run(main())
+    assert [x["attractionId"] for x in attractions] == ["2-0", "2-1", "3-0", "3-1"]
@@ -0,0 +1,140 @@
+# pylint: skip-file
+"""Module to test the batch exploration against a mocked transport"""
+
+import asyncio
+import time
+from urllib.parse import urlparse, parse_qs
+
+import httpx
+import pytest
+from pyventim import Eventim, AsyncEventim  # pylint: disable=E0401
+from pyventim.exceptions import RestException  # pylint: disable=E0401
+from pyventim.models import ExplorationParameters  # pylint: disable=E0401
+from tests.conftest import FakeTransport, create_response
+
+# Product group ids per city and page
+CITIES = {
+    1: [["a", "b"], ["c"]],
+    2: [["b", "c"], ["d"]],
+    3: [["a"]],
+}
+
+
+def render_page(query: dict) -> tuple:
+    city = int(query["city_ids"][0])
+    page = int(query["page"][0])
+    if city not in CITIES:
+        return 500, {}
+
+    pages = CITIES[city]
+    links = {"self": {"href": ""}}
+    if page < len(pages):
+        links["next"] = {"href": ""}
+
+    return 200, {
+        "productGroups": [{"productGroupId": x, "city": city} for x in pages[page - 1]],
+        "totalPages": len(pages),
+        "_links": links,
+    }
+
+
+class BatchTransport(FakeTransport):
+    def respond(self, request, **kwargs):
+        time.sleep(0.01)
+        return create_response(
+            request, *render_page(parse_qs(urlparse(request.url).query))
+        )
+
+
+def create_eventim(transport):
+    eventim = Eventim()
+    eventim.rest_adapter.session.mount("https://", transport)
+    return eventim
+
+
+def queries(*cities):
+    return [ExplorationParameters(city_ids=[x]) for x in cities]
+
+
+def test_batch_dedupes_and_tags_queries():
+    transport = BatchTransport()
+    eventim = create_eventim(transport)
+
+    items = list(eventim.explore_batch(queries(1, 2, 3), max_workers=2))
+
+    assert sorted(x.item_id for x in items) == ["a", "b", "c", "d"]
+    tags = {x.item_id: sorted(x.query_indices) for x in items}
+    assert tags == {"a": [0, 2], "b": [0, 1], "c": [0, 1], "d": [1]}
+    assert transport.peak <= 2
+
+
+def test_batch_without_dedupe():
+    eventim = create_eventim(BatchTransport())
+    items = list(eventim.explore_batch(queries(1, 2), dedupe=False))
+    assert sorted(x.item_id for x in items) == ["a", "b", "b", "c", "c", "d"]
+    assert all(len(x.query_indices) == 1 for x in items)
+
+
+def test_batch_does_not_mutate_queries():
+    eventim = create_eventim(BatchTransport())
+    batch = queries(1, 2)
+    list(eventim.explore_batch(batch))
+    assert [x.page for x in batch] == [1, 1]
+
+
+def test_batch_raises_query_errors():
+    eventim = create_eventim(BatchTransport())
+    with pytest.raises(RestException):
+        list(eventim.explore_batch(queries(1, 99)))
+
+
+def test_batch_invalid_arguments():
+    eventim = create_eventim(BatchTransport())
+    with pytest.raises(ValueError):
+        list(eventim.explore_batch(queries(1), kind="events"))
+    with pytest.raises(ValueError):
+        list(eventim.explore_batch(queries(1), max_workers=0))
+
+
+def test_explore_with_parameters():
+    eventim = create_eventim(BatchTransport())
+    params = ExplorationParameters(city_ids=[1])
+
+    items = list(eventim.explore(params, kind="product_groups"))
+    assert [x["productGroupId"] for x in items] == ["a", "b", "c"]
+    assert params.page == 1
+    with pytest.raises(ValueError):
+        list(eventim.explore(params, kind="events"))
+
+
+def test_batch_early_close():
+    eventim = create_eventim(BatchTransport())
+    iterator = eventim.explore_batch(queries(1, 2, 3), max_workers=1)
+    next(iterator)
+    iterator.close()
+
+
+def test_async_batch():
+    peak = 0
+    active = 0
+
+    async def handler(request):
+        nonlocal peak, active
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        status_code, data = render_page(parse_qs(request.url.query.decode()))
+        return httpx.Response(status_code, json=data)
+
+    async def main():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncEventim(client=client) as eventim:
+            return [
+                x async for x in eventim.explore_batch(queries(1, 2, 3), max_workers=2)
+            ]
+
+    items = asyncio.run(main())
+    tags = {x.item_id: sorted(x.query_indices) for x in items}
+    assert tags == {"a": [0, 2], "b": [0, 1], "c": [0, 1], "d": [1]}
+    assert peak <= 2
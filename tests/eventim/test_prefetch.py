@@ -0,0 +1,105 @@
+# pylint: skip-file
+"""Module to test the prefetch pagination of the exploration methods against a mocked transport"""
+
+import time
+from urllib.parse import urlparse, parse_qs
+
+from pyventim import Eventim  # pylint: disable=E0401
+from pyventim.models import ExplorationParameters  # pylint: disable=E0401
+from pyventim.records import ProductGroup  # pylint: disable=E0401
+from tests.conftest import FakeTransport, create_response
+
+TOTAL_PAGES = 6
+
+
+class ExplorationTransport(FakeTransport):
+    """Serves fake product group pages."""
+
+    def __init__(self):
+        super().__init__()
+        self.pages = []
+
+    def respond(self, request, **kwargs):
+        page = int(parse_qs(urlparse(request.url).query)["page"][0])
+        # Later pages answer faster to make sure ordering does not depend on arrival
+        time.sleep(0.01 * (TOTAL_PAGES - page))
+
+        links = {"self": {"href": ""}}
+        if page < TOTAL_PAGES:
+            links["next"] = {"href": ""}
+
+        response = create_response(
+            request,
+            content={
+                "productGroups": [{"productGroupId": f"{page}-{i}"} for i in range(3)],
+                "totalPages": TOTAL_PAGES,
+                "_links": links,
+            },
+        )
+        with self.lock:
+            self.pages.append(page)
+        return response
+
+
+def create_eventim(transport: ExplorationTransport) -> Eventim:
+    eventim = Eventim()
+    eventim.rest_adapter.session.mount("https://", transport)
+    return eventim
+
+
+def expected_ids():
+    return [f"{page}-{i}" for page in range(1, TOTAL_PAGES + 1) for i in range(3)]
+
+
+def test_explore_sequential():
+    transport = ExplorationTransport()
+    eventim = create_eventim(transport)
+
+    result = [x["productGroupId"] for x in eventim.explore_product_groups(city_ids=[7])]
+    assert result == expected_ids()
+    assert transport.peak == 1
+
+
+def test_explore_prefetch_keeps_page_order():
+    transport = ExplorationTransport()
+    eventim = create_eventim(transport)
+
+    result = [
+        x["productGroupId"]
+        for x in eventim.explore_product_groups(city_ids=[7], prefetch=3)
+    ]
+    assert result == expected_ids()
+    assert sorted(transport.pages) == list(range(1, TOTAL_PAGES + 1))
+    assert 1 < transport.peak <= 3
+
+
+def test_explore_prefetch_early_stop():
+    transport = ExplorationTransport()
+    eventim = create_eventim(transport)
+
+    iterator = eventim.explore_product_groups(city_ids=[7], prefetch=2)
+    assert next(iterator)["productGroupId"] == "1-0"
+    iterator.close()
+    # Only the first page and the prefetch window may have been requested
+    assert len(transport.pages) <= 3
+
+
+def test_explore_does_not_modify_params():
+    transport = ExplorationTransport()
+    eventim = create_eventim(transport)
+    params = ExplorationParameters(city_ids=[7], page=2)
+
+    result = list(
+        eventim._explore("v2/productGroups", "productGroups", params, prefetch=2)
+    )
+    assert len(result) == (TOTAL_PAGES - 1) * 3
+    assert params.page == 2
+
+
+def test_explore_typed_records():
+    transport = ExplorationTransport()
+    eventim = create_eventim(transport)
+
+    result = list(eventim.explore_product_groups(city_ids=[7], typed=True))
+    assert all(isinstance(x, ProductGroup) for x in result)
+    assert [x.raw["productGroupId"] for x in result] == expected_ids()
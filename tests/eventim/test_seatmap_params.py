@@ -0,0 +1,204 @@
+# pylint: skip-file
+"""Module to test the cached signed seatmap params against a mocked transport"""
+
+import asyncio
+import json
+import pathlib
+import time
+
+import httpx
+import pytest
+from pyventim import Eventim, AsyncEventim  # pylint: disable=E0401
+from pyventim.cache import MemoryCache  # pylint: disable=E0401
+from pyventim.exceptions import RestException  # pylint: disable=E0401
+from tests.conftest import FakeTransport, create_response
+
+EVENT_HTML = (
+    pathlib.Path(__file__).parent.parent / "fixtures/html/event_page_seatmap.html"
+).read_text(encoding="utf-8")
+EVENT_KEY = "disneys-der-koenig-der-loewen-stage-theater-im-hafen-hamburg-18500464"
+SEATMAP = {
+    "key": "web_1_18500464_0_EVE_0",
+    "availabilityTimestamp": 1000,
+    "individualSeats": 1,
+    "dimension": [4096, 4096],
+    "seatSize": 59,
+    "blocks": [
+        {
+            "blockId": "b1",
+            "name": "Parkett",
+            "blockDescription": "Parkett",
+            "rows": [["r1", [["s1", 0, 10, 10]]]],
+        }
+    ],
+    "pcs": [["p1", "Kat. 1", "#f1075e", "#ffffff"]],
+}
+
+
+class SignedSite:
+    """Signs every event page for ten minutes from now and rejects other signatures."""
+
+    def __init__(self):
+        self.html_requests = 0
+        self.seatmap_requests = 0
+        self.signature = 0
+        self.valid = set()
+        self.revoke_all = False
+        self.seatmap_status = 200
+        self.reject_body = b"{}"
+
+    def render_event(self):
+        self.html_requests += 1
+        self.signature += 1
+        self.valid.add(str(self.signature))
+        expiry = int(time.time() // 60) + 10
+        return EVENT_HTML.replace(
+            "expiryTime=28611974", f"expiryTime={expiry}"
+        ).replace(
+            "signature=yGTajJUzWiNtRSGzif1ajavSfxKMBfIKiSDyQfjXaGg",
+            f"signature={self.signature}",
+        )
+
+    def handle(self, path, query):
+        if "/event/" in path:
+            return 200, self.render_event().encode()
+
+        self.seatmap_requests += 1
+        if self.seatmap_status != 200:
+            return self.seatmap_status, b"{}"
+        if self.revoke_all or query.get("signature") not in self.valid:
+            return 403, self.reject_body
+
+        return 200, json.dumps(SEATMAP).encode()
+
+
+class SignedTransport(FakeTransport):
+    def __init__(self, site):
+        super().__init__()
+        self.site = site
+
+    def respond(self, request, **kwargs):
+        url = httpx.URL(request.url)
+        return create_response(request, *self.site.handle(url.path, dict(url.params)))
+
+
+def create_eventim(site, **kwargs):
+    eventim = Eventim(**kwargs)
+    eventim.rest_adapter.session.mount("https://", SignedTransport(site))
+    return eventim
+
+
+def test_seatmap_by_event_url_reuses_params():
+    site = SignedSite()
+    eventim = create_eventim(site)
+
+    for event in (
+        f"/event/{EVENT_KEY}/",
+        EVENT_KEY,
+        f"https://www.eventim.de/event/{EVENT_KEY}/",
+    ):
+        seatmap = eventim.get_event_seatmap(event)
+        assert seatmap["seatmap_key"] == "web_1_18500464_0_EVE_0"
+
+    assert site.html_requests == 1
+    assert site.seatmap_requests == 3
+
+
+def test_information_fills_params_cache():
+    site = SignedSite()
+    eventim = create_eventim(site)
+    information = eventim.get_event_seatmap_information(f"/event/{EVENT_KEY}/")
+
+    # Options still work and the url reuses the params of the information call
+    assert eventim.get_event_seatmap(information["seatmapOptions"], parse=False)
+    assert eventim.get_event_seatmap(EVENT_KEY, parse=False)
+    assert site.html_requests == 1
+
+
+@pytest.mark.parametrize("body", [b"{}", b"<html><h1>403 Forbidden</h1></html>"])
+def test_rejected_params_are_refreshed_once(body):
+    site = SignedSite()
+    site.reject_body = body
+    eventim = create_eventim(site)
+    eventim.get_seatmap_params(EVENT_KEY)
+
+    site.valid.clear()  # Signature revoked
+    assert eventim.get_event_seatmap(EVENT_KEY)["seatmap_individual_seats"] == 1
+    assert site.html_requests == 2
+
+    site.revoke_all = True
+    with pytest.raises(RestException):
+        eventim.get_event_seatmap(EVENT_KEY)
+
+
+@pytest.mark.parametrize("status_code", [404, 500, 503])
+def test_other_errors_keep_params(status_code):
+    site = SignedSite()
+    eventim = create_eventim(site)
+    eventim.get_seatmap_params(EVENT_KEY)
+
+    site.seatmap_status = status_code
+    with pytest.raises(RestException) as error:
+        eventim.get_event_seatmap(EVENT_KEY)
+
+    assert error.value.status_code == status_code
+    assert site.html_requests == 1
+    assert site.seatmap_requests == 1
+
+
+def test_stale_event_page_in_response_cache_is_refetched():
+    site = SignedSite()
+    eventim = create_eventim(site, cache=MemoryCache())
+    eventim.get_seatmap_params(EVENT_KEY)
+    assert site.html_requests == 1
+
+    # The signature expired but the event page is still in the response cache
+    eventim.seatmap_params_cache.margin = 3600
+    eventim.seatmap_params_cache.clear()
+    eventim.get_seatmap_params(EVENT_KEY)
+    assert site.html_requests == 2
+
+
+def test_async_seatmap_by_event_url():
+    site = SignedSite()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status_code, content = site.handle(request.url.path, dict(request.url.params))
+        return httpx.Response(status_code, content=content)
+
+    # Error pages of the private api are not JSON
+    site.reject_body = b"<html><h1>403 Forbidden</h1></html>"
+
+    async def main():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncEventim(client=client) as eventim:
+            first = await eventim.get_event_seatmap(f"/event/{EVENT_KEY}/")
+            site.valid.clear()
+            second = await eventim.get_event_seatmap(EVENT_KEY, columnar=False)
+            return first, second
+
+    first, second = asyncio.run(main())
+    assert first == second
+    assert site.html_requests == 2
+    assert site.seatmap_requests == 3
+
+
+def test_async_other_errors_keep_params():
+    site = SignedSite()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status_code, content = site.handle(request.url.path, dict(request.url.params))
+        return httpx.Response(status_code, content=content)
+
+    async def main():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncEventim(client=client) as eventim:
+            await eventim.get_seatmap_params(EVENT_KEY)
+            site.seatmap_status = 503
+            await eventim.get_event_seatmap(EVENT_KEY)
+
+    with pytest.raises(RestException) as error:
+        asyncio.run(main())
+
+    assert error.value.status_code == 503
+    assert site.html_requests == 1
@@ -0,0 +1,103 @@
+# pylint: skip-file
+"""Module to test the date range sharding of get_product_group_events against a mocked transport"""
+
+import asyncio
+import json
+from datetime import date, timedelta
+from urllib.parse import urlparse, parse_qs
+
+import httpx
+import pytest
+from pyventim import Eventim, AsyncEventim  # pylint: disable=E0401
+from tests.conftest import FakeTransport, create_response
+
+FIRST_DAY = date(2024, 1, 1)
+EVENT_DAYS = 200
+PAGE_SIZE = 9
+EVENTS = [FIRST_DAY + timedelta(days=x) for x in range(EVENT_DAYS)]
+
+
+def render_component(query: dict) -> str:
+    startdate = date.fromisoformat(query["startdate"][0])
+    enddate = date.fromisoformat(query["enddate"][0])
+    pnum = int(query["pnum"][0])
+
+    matches = [x for x in EVENTS if startdate <= x <= enddate]
+    total_pages = max(1, -(-len(matches) // PAGE_SIZE))
+    # The endpoint stops serving after page 10
+    start = (pnum - 1) * PAGE_SIZE
+    page = matches[start:][:PAGE_SIZE] if pnum <= 10 else []
+
+    scripts = "".join(
+        '<script type="application/ld+json">'
+        + json.dumps(
+            {
+                "@type": "MusicEvent",
+                "startDate": f"{x.isoformat()}T19:30:00+02:00",
+                "url": f"https://www.eventim.de/event/musical-{20000000 + (x - FIRST_DAY).days}/",
+            }
+        )
+        + "</script>"
+        for x in page
+    )
+    pagination = f'<li class="pagination-pages-small">{pnum} von {total_pages}</li>'
+    return f"<html><body>{scripts}<ul>{pagination}</ul></body></html>"
+
+
+def handle_component(request):
+    return create_response(
+        request, content=render_component(parse_qs(urlparse(request.url).query))
+    )
+
+
+def create_eventim() -> Eventim:
+    eventim = Eventim()
+    eventim.html_adapter.session.mount("https://", FakeTransport(handle_component))
+    return eventim
+
+
+def event_days(events):
+    return [x["startDate"][:10] for x in events]
+
+
+def test_unsharded_is_capped():
+    events = list(
+        create_eventim().get_product_group_events(
+            1, date_from=FIRST_DAY, date_to=EVENTS[-1]
+        )
+    )
+    assert len(events) == 90
+
+
+def test_sharded_returns_all_events_in_order():
+    events = list(
+        create_eventim().get_product_group_events(
+            1, date_from=FIRST_DAY, date_to=EVENTS[-1], shard=True, max_workers=3
+        )
+    )
+    assert event_days(events) == [x.isoformat() for x in EVENTS]
+
+
+def test_sharded_requires_dates():
+    with pytest.raises(ValueError, match="date_from and date_to are required"):
+        list(create_eventim().get_product_group_events(1, shard=True))
+
+
+def test_async_sharded_returns_all_events_in_order():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, text=render_component(parse_qs(request.url.query.decode()))
+        )
+
+    async def main():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncEventim(client=client) as eventim:
+            return [
+                x
+                async for x in eventim.get_product_group_events(
+                    1, date_from=FIRST_DAY, date_to=EVENTS[-1], shard=True
+                )
+            ]
+
+    events = asyncio.run(main())
+    assert event_days(events) == [x.isoformat() for x in EVENTS]
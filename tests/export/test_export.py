@@ -0,0 +1,182 @@
+# pylint: skip-file
+"""Unit tests for the streaming export"""
+
+import csv
+import io
+import json
+import logging
+
+import pyarrow.parquet as pq
+import pytest
+
+from pyventim import utils  # pylint: disable=E0401
+from pyventim.export import (  # pylint: disable=E0401
+    export,
+    flatten_record,
+    iter_chunks,
+    iter_flat_records,
+    iter_seat_rows,
+    ParquetWriter,
+)
+from pyventim.models import ExplorationBatchItem  # pylint: disable=E0401
+from pyventim.seatmap import ColumnarSeatmap  # pylint: disable=E0401
+from tests.conftest import create_seatmap_data
+
+
+def product_groups(count):
+    for x in range(count):
+        yield {
+            "productGroupId": str(x),
+            "name": f"Group {x}",
+            "rating": {"count": x, "average": 4.5},
+            "categories": [{"name": "Musical"}],
+            "startDate": None if x == 0 else "2024-06-01",
+        }
+
+
+def test_flatten_record():
+    record = next(product_groups(1))
+    assert flatten_record(record) == {
+        "productGroupId": "0",
+        "name": "Group 0",
+        "rating.count": 0,
+        "rating.average": 4.5,
+        "categories": '[{"name": "Musical"}]',
+        "startDate": None,
+    }
+
+
+def test_schema():
+    schema = {
+        "id": "productGroupId",
+        "votes": "rating.count",
+        "category": "categories.0.name",
+        "missing": "a.b",
+    }
+    (record,) = iter_flat_records(product_groups(1), schema)
+    assert record == {"id": "0", "votes": 0, "category": "Musical", "missing": None}
+
+
+def test_iter_chunks():
+    assert list(iter_chunks(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    with pytest.raises(ValueError):
+        list(iter_chunks(range(5), 0))
+
+
+def test_ndjson_keeps_nesting(tmp_path):
+    path = tmp_path / "groups.ndjson"
+    assert export(product_groups(25), path, chunk_size=10) == 25
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 25
+    assert json.loads(lines[1])["rating"] == {"count": 1, "average": 4.5}
+
+
+def test_csv(tmp_path):
+    path = tmp_path / "groups.csv"
+    export(product_groups(25), path, chunk_size=10)
+
+    with open(path, encoding="utf-8", newline="") as file:
+        rows = list(csv.DictReader(file))
+    assert len(rows) == 25
+    assert rows[3]["rating.count"] == "3"
+    assert rows[3]["categories"] == '[{"name": "Musical"}]'
+
+
+def test_csv_file_object_and_models():
+    items = [
+        ExplorationBatchItem(item_id="1", item={"name": "a"}, query_indices=[0, 2]),
+    ]
+    file = io.StringIO()
+    export(items, file, file_format="csv")
+    assert file.getvalue().splitlines() == [
+        "item_id,item.name,query_indices",
+        '1,a,"[0, 2]"',
+    ]
+
+
+def test_parquet_row_groups(tmp_path):
+    path = tmp_path / "groups.parquet"
+    assert export(product_groups(25), path, chunk_size=10) == 25
+
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_row_groups == 3
+    table = parquet.read()
+    assert table.num_rows == 25
+    # The column is empty in the first row only and typed from the whole chunk
+    assert table.column("startDate").to_pylist()[:2] == [None, "2024-06-01"]
+
+
+def test_parquet_null_first_chunk(tmp_path):
+    path = tmp_path / "groups.parquet"
+    export(product_groups(3), path, chunk_size=1)
+    assert pq.read_table(path).column("startDate").to_pylist() == [
+        None,
+        "2024-06-01",
+        "2024-06-01",
+    ]
+
+
+def test_parquet_null_then_numeric_column(tmp_path):
+    path = tmp_path / "prices.parquet"
+    records = [
+        {"id": 1, "price": None},
+        {"id": 2, "price": 10},
+        {"id": 3, "price": 12},
+    ]
+    assert export(records, path, chunk_size=1) == 3
+
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_row_groups == 3
+    assert parquet.read().column("price").to_pylist() == [None, 10, 12]
+
+
+def test_parquet_empty_column_limit(tmp_path):
+    path = tmp_path / "prices.parquet"
+    writer = ParquetWriter(path, infer_rows=2)
+    writer.write_chunk([{"id": 1, "price": None}])
+    writer.write_chunk([{"id": 2, "price": None}])
+    with pytest.raises(ValueError, match="parquet schema"):
+        writer.write_chunk([{"id": 3, "price": 10}])
+    writer.close()
+
+
+def test_parquet_warns_about_new_columns(tmp_path, caplog):
+    path = tmp_path / "groups.parquet"
+    records = [{"id": 1}, {"id": 2, "name": "a"}, {"id": 3, "name": "b"}]
+    with caplog.at_level(logging.WARNING, logger="pyventim.export"):
+        export(records, path, chunk_size=1)
+
+    assert pq.read_table(path).column_names == ["id"]
+    assert len(caplog.records) == 1
+    assert "Dropping columns" in caplog.records[0].getMessage()
+
+
+def test_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        export(product_groups(1), tmp_path / "groups.xml")
+
+
+def test_seat_rows_dict_and_columnar(tmp_path):
+    data = create_seatmap_data(blocks=2, rows=1, seats=3, empty_rows=0)
+    rows = list(iter_seat_rows(utils.parse_seathamp_data_from_api(data)))
+    assert rows == list(iter_seat_rows(ColumnarSeatmap.from_api(data)))
+    assert len(rows) == 6
+    assert rows[4] == dict(
+        seatmap_key="web_1_16825147_0_EVE_0",
+        seatmap_timestamp=1716215061170,
+        block_id="b1",
+        block_name="Block 1",
+        row_code="r0",
+        seat_index=4,
+        seat_code="s1",
+        price_category_id="p1",
+        seat_coordinate_x=1660,
+        seat_coordinate_y=0,
+    )
+
+    path = tmp_path / "seats.parquet"
+    assert (
+        export(iter_seat_rows(ColumnarSeatmap.from_api(data)), path, chunk_size=4) == 6
+    )
+    assert pq.read_table(path).column("seat_code").to_pylist() == ["s0", "s1", "s2"] * 2
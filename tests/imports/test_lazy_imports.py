@@ -0,0 +1,100 @@
+# pylint: skip-file
+"""Checks that importing pyventim stays cheap"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+import pyventim  # pylint: disable=E0401
+
+HEAVY = [
+    "requests",
+    "lxml",
+    "pydantic",
+    "numpy",
+    "httpx",
+    "pyarrow",
+    "orjson",
+    "msgspec",
+]
+
+
+def get_loaded_modules(statement):
+    code = (
+        f"import json, sys\n{statement}\n"
+        f"print(json.dumps([x for x in {HEAVY!r} if x in sys.modules]))"
+    )
+    # The child sees the same source tree as the tests
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    process = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    return json.loads(process.stdout)
+
+
+def test_import_loads_no_dependencies():
+    assert get_loaded_modules("import pyventim") == []
+
+
+def test_client_loads_no_optional_dependencies():
+    loaded = get_loaded_modules("from pyventim import Eventim; Eventim()")
+    assert "requests" in loaded
+    assert not {"numpy", "httpx", "lxml", "pyarrow"} & set(loaded)
+
+
+def test_json_backends_load_on_first_document():
+    loaded = get_loaded_modules("import pyventim.seatmap, pyventim.store")
+    assert not {"numpy", "httpx", "orjson", "msgspec"} & set(loaded)
+
+    # Only the default backend is imported
+    loaded = get_loaded_modules("from pyventim import jsonlib; jsonlib.loads(b'{}')")
+    backend = pyventim.jsonlib.get_backend()
+    assert {"orjson", "msgspec"} & set(loaded) == {backend} - {"json"}
+
+
+def test_replay_loads_httpx_on_first_async_transport():
+    loaded = get_loaded_modules("import pyventim.replay")
+    assert "httpx" not in loaded
+
+    loaded = get_loaded_modules(
+        "from pyventim.replay import AsyncReplayTransport, FixtureStore\n"
+        "import tempfile; AsyncReplayTransport(FixtureStore(tempfile.mkdtemp()))"
+    )
+    assert "httpx" in loaded
+
+
+def test_export_loads_pyarrow_on_first_parquet_writer():
+    loaded = get_loaded_modules("import pyventim.export")
+    assert "pyarrow" not in loaded
+
+    loaded = get_loaded_modules(
+        "from pyventim.export import ParquetWriter\n"
+        "import io; ParquetWriter(io.BytesIO())"
+    )
+    assert "pyarrow" in loaded
+
+
+@pytest.mark.parametrize("name", pyventim._SUBMODULES)
+def test_submodules_are_attributes(name):
+    module = getattr(pyventim, name)
+    assert module.__name__ == f"pyventim.{name}"
+
+
+def test_attributes_resolve_lazily():
+    assert pyventim.Eventim is pyventim.eventim.Eventim
+    assert (
+        pyventim.utils.parse_city_id_from_link(
+            "https://www.eventim.de/city/hamburg-7/venue/stage-theater-im-hafen-hamburg-3880"
+        )
+        == 7
+    )
+    assert set(pyventim.__all__) <= set(dir(pyventim))
+
+    with pytest.raises(AttributeError):
+        pyventim.missing
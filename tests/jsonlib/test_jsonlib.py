@@ -0,0 +1,101 @@
+# pylint: skip-file
+"""Unit tests for the pluggable json backend"""
+
+import json
+
+import pytest
+from pyventim import jsonlib  # pylint: disable=E0401
+from pyventim.adapters import RestAdapter  # pylint: disable=E0401
+from pyventim.cache import MemoryCache  # pylint: disable=E0401
+from pyventim.exceptions import RestException  # pylint: disable=E0401
+from pyventim.seatmap import ColumnarSeatmap, decode_seatmap  # pylint: disable=E0401
+from tests.conftest import FakeTransport, create_response
+
+INSTALLED = [x for x in jsonlib.BACKENDS if jsonlib.is_installed(x)]
+SEATMAP = {
+    "key": "web_1_18500464_0_EVE_0",
+    "availabilityTimestamp": 1000,
+    "individualSeats": 3,
+    "dimension": [4096, 4096],
+    "seatSize": 59,
+    "blocks": [
+        {
+            "blockId": "b1",
+            "name": "Parkett",
+            "blockDescription": "Parkett links",
+            "rows": [
+                ["r1", [["s1", 0, 10, 10], ["s2", 1, 70, 10]]],
+                ["r2", [["s1", 1, 10, 70]]],
+            ],
+        }
+    ],
+    "pcs": [["p1", "Kat. 1", "#f1075e", "#fff"], ["p2", "Kat. 2", "#000", "#fff"]],
+}
+
+
+@pytest.fixture
+def backend():
+    yield
+    jsonlib.set_backend()
+
+
+@pytest.mark.parametrize("name", INSTALLED)
+def test_backends_decode_alike(name, backend):
+    jsonlib.set_backend(name)
+    assert jsonlib.get_backend() == name
+
+    data = json.dumps(SEATMAP, ensure_ascii=False)
+    assert jsonlib.loads(data) == SEATMAP
+    assert jsonlib.loads(data.encode("utf-8")) == SEATMAP
+
+    with pytest.raises(jsonlib.DECODE_ERRORS):
+        jsonlib.loads(b"{broken")
+
+
+def test_unknown_backend(backend):
+    with pytest.raises(ValueError):
+        jsonlib.set_backend("yaml")
+    assert jsonlib.get_backend() in jsonlib.BACKENDS
+
+
+def create_adapter(content, cache=None):
+    transport = FakeTransport(lambda request: create_response(request, content=content))
+    adapter = RestAdapter(hostname="https://api.eventim.com", cache=cache)
+    adapter.session.mount("https://", transport)
+    return adapter, transport
+
+
+@pytest.mark.parametrize("name", INSTALLED)
+def test_adapter_uses_backend(name, backend):
+    jsonlib.set_backend(name)
+    adapter, _ = create_adapter(json.dumps(SEATMAP).encode())
+    assert adapter.get("seatmap").json_data == SEATMAP
+
+    adapter, _ = create_adapter(b"<html>")
+    with pytest.raises(RestException):
+        adapter.get("seatmap")
+
+
+def test_adapter_custom_decoder_is_not_cached():
+    adapter, transport = create_adapter(b'{"a": 1}', cache=MemoryCache())
+    result = adapter.get("v2/x", decoder=lambda x: ("decoded", x))
+    assert result.json_data == ("decoded", b'{"a": 1}')
+
+    adapter.get("v2/x", decoder=lambda x: x)
+    assert len(transport.requests) == 2
+    assert adapter.cache.stats()["entries"] == 0
+
+
+def test_decode_seatmap_matches_dicts():
+    data = json.dumps(SEATMAP).encode()
+    seatmap = decode_seatmap(data)
+    if jsonlib.is_installed("msgspec"):
+        assert not isinstance(seatmap, dict)
+
+    expected = ColumnarSeatmap.from_api(SEATMAP).to_dict()
+    assert ColumnarSeatmap.from_api(seatmap).to_dict() == expected
+
+
+def test_decode_seatmap_falls_back_on_unexpected_layout():
+    unexpected = dict(SEATMAP, seatSize="59px")
+    assert decode_seatmap(json.dumps(unexpected).encode()) == unexpected
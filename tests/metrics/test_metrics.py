@@ -0,0 +1,220 @@
+# pylint: skip-file
+"""Unit tests for the instrumentation events, the aggregator and the OpenMetrics exporter"""
+
+import asyncio
+import pathlib
+
+import httpx
+import pytest
+
+from pyventim import Eventim, metrics, utils  # pylint: disable=E0401
+from pyventim.adapters import (  # pylint: disable=E0401
+    AsyncRestAdapter,
+    HtmlAdapter,
+    RestAdapter,
+)
+from pyventim.cache import MemoryCache  # pylint: disable=E0401
+from pyventim.exceptions import RestException  # pylint: disable=E0401
+from pyventim.retry import RetryPolicy  # pylint: disable=E0401
+from tests.conftest import FakeTransport, create_response
+
+FIXTURES = pathlib.Path(__file__).parent.parent / "fixtures" / "html"
+
+
+class StaticTransport(FakeTransport):
+    """Answers with the statuses in order and repeats the last one."""
+
+    def __init__(self, statuses, content=b'{"items": [1, 2]}'):
+        super().__init__()
+        self.statuses = list(statuses)
+        self.content = content
+
+    def respond(self, request, **kwargs):
+        status_code = (
+            self.statuses.pop(0) if len(self.statuses) > 1 else self.statuses[0]
+        )
+        return create_response(request, status_code, self.content)
+
+
+@pytest.fixture
+def events():
+    collected = []
+    metrics.add_listener(collected.append)
+    yield collected
+    metrics.remove_listener(collected.append)
+
+
+def create_adapter(adapter_class, transport, **kwargs):
+    adapter = adapter_class(hostname="https://example.com", **kwargs)
+    adapter.session.mount("https://", transport)
+    return adapter
+
+
+def test_request_event(events):
+    adapter = create_adapter(
+        RestAdapter,
+        StaticTransport([503, 200]),
+        retry_policy=RetryPolicy(backoff_factor=0, jitter=False),
+    )
+    adapter.get("v2/attractions", params={"page": 1, "search_term": "x"})
+
+    (event,) = [x for x in events if isinstance(x, metrics.RequestEvent)]
+    assert event.adapter == "RestAdapter"
+    assert event.endpoint == "v2/attractions"
+    assert event.status_code == 200
+    assert event.retries == 1
+    assert event.size == len(b'{"items": [1, 2]}')
+    assert event.ttfb is not None and event.decode is not None
+    assert event.total >= event.decode
+    assert event.params_fingerprint == metrics.get_params_fingerprint(
+        {"search_term": "x", "page": 1}
+    )
+
+
+def test_cached_and_failed_requests(events):
+    adapter = create_adapter(
+        RestAdapter, StaticTransport([200], content=b"not json"), cache=MemoryCache()
+    )
+    with pytest.raises(RestException):
+        adapter.get("v2/attractions")
+    assert events[-1].error == "JSONDecodeError"
+
+    adapter.session.get_adapter("https://").content = b"{}"
+    adapter.get("v2/attractions")
+    adapter.get("v2/attractions")
+    assert [x.cached for x in events[-2:]] == [False, True]
+
+
+def test_html_adapter_event(events):
+    adapter = create_adapter(HtmlAdapter, StaticTransport([200], content=b"<html/>"))
+    adapter.get("event/musical-18500464")
+    assert events[-1].adapter == "HtmlAdapter"
+    assert events[-1].endpoint == "event/musical-18500464"
+
+
+def test_no_listeners_no_events():
+    collected = []
+    adapter = create_adapter(RestAdapter, StaticTransport([200]))
+    adapter.get("v2/attractions")
+    assert collected == []
+    assert metrics.has_listeners() is False
+
+
+def test_failing_listener_does_not_break_requests(events):
+    def broken(event):
+        raise RuntimeError("broken")
+
+    metrics.add_listener(broken)
+    try:
+        adapter = create_adapter(RestAdapter, StaticTransport([200]))
+        assert adapter.get("v2/attractions").json_data == {"items": [1, 2]}
+    finally:
+        metrics.remove_listener(broken)
+
+
+def test_parse_events(events):
+    html = (FIXTURES / "component_page.html").read_text(encoding="utf-8")
+    result = utils.parse_list_from_component_html(html)
+
+    event = [x for x in events if isinstance(x, metrics.ParseEvent)][-1]
+    assert event.parser == "parse_list_from_component_html"
+    assert event.size == len(html)
+    assert event.items == len(result)
+
+    with pytest.raises(KeyError):
+        utils.parse_seathamp_data_from_api({})
+    assert events[-1].error == "KeyError"
+
+
+def test_nested_parsers_emit_one_event(events):
+    html = (FIXTURES / "component_page.html").read_text(encoding="utf-8")
+    utils.parse_has_next_page_from_component_html(html)
+
+    parsers = [x.parser for x in events if isinstance(x, metrics.ParseEvent)]
+    assert parsers == ["parse_pagination_from_component_html"]
+
+
+def test_columnar_seatmap_parse_event(events):
+    seatmap = (
+        b'{"key": "web_1_1_0_EVE_0", "availabilityTimestamp": 1, "individualSeats": 1, '
+        b'"dimension": [4096, 4096], "seatSize": 59, "pcs": [["p1", "Kat. 1", "#000", "#fff"]], '
+        b'"blocks": [{"blockId": "b1", "name": "A", "blockDescription": "A", '
+        b'"rows": [["r1", [["s1", 0, 10, 10]]]]}]}'
+    )
+    eventim = Eventim()
+    eventim.private_rest_adapter.session.mount(
+        "https://", StaticTransport([200], seatmap)
+    )
+    options = {"cType": "web", "cId": 1, "evId": 1, "additionalRequestParams": "&a=1"}
+    eventim.get_event_seatmap(options, columnar=True)
+
+    event = [x for x in events if isinstance(x, metrics.ParseEvent)][-1]
+    assert event.parser == "parse_columnar_seatmap_from_api"
+
+
+def test_async_request_event(events):
+    def handler(request):
+        return httpx.Response(200, json={"attractions": []})
+
+    async def main():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        adapter = AsyncRestAdapter(hostname="https://example.com", client=client)
+        await adapter.get("v2/attractions")
+        await client.aclose()
+
+    asyncio.run(main())
+    assert events[-1].adapter == "AsyncRestAdapter"
+    assert events[-1].status_code == 200
+    assert events[-1].retries == 0
+
+
+def test_endpoint_group():
+    assert metrics.get_endpoint_group("v2/attractions") == "v2/attractions"
+    assert metrics.get_endpoint_group("event/musical-18500464") == "event/{id}"
+    assert metrics.get_endpoint_group("/component") == "component"
+
+
+def test_aggregator_and_openmetrics():
+    aggregator = metrics.MetricsAggregator()
+    for index in range(1, 101):
+        aggregator(
+            metrics.RequestEvent(
+                "RestAdapter",
+                "GET",
+                "https://example.com",
+                f"event/x-{index}",
+                "0",
+                status_code=200,
+                size=10,
+                retries=1 if index == 1 else 0,
+                ttfb=index / 1000,
+                total=index / 100,
+            )
+        )
+    aggregator(metrics.ParseEvent("parse_list_from_component_html", 0.5))
+    aggregator(
+        metrics.RequestEvent("RestAdapter", "GET", "", "event/x-1", "0", cached=True)
+    )
+
+    summary = aggregator.summary()
+    request = summary["timings"]["request"]["event/{id}"]
+    assert request["count"] == 100
+    assert request["quantiles"] == {0.5: 0.5, 0.9: 0.9, 0.99: 0.99}
+    assert summary["counters"]["requests"][("event/{id}", "200")] == 100
+    assert summary["counters"]["requests"][("event/{id}", "cached")] == 1
+    assert summary["counters"]["response_bytes"]["event/{id}"] == 1000
+    assert summary["counters"]["retries"]["event/{id}"] == 1
+
+    text = aggregator.to_openmetrics()
+    assert "# TYPE pyventim_request_seconds summary" in text
+    assert 'pyventim_request_seconds{endpoint="event/{id}",quantile="0.5"} 0.5' in text
+    assert 'pyventim_request_seconds_count{endpoint="event/{id}"} 100' in text
+    assert (
+        'pyventim_parse_seconds_sum{parser="parse_list_from_component_html"} 0.5'
+        in text
+    )
+    assert 'pyventim_requests_total{endpoint="event/{id}",status="cached"} 1' in text
+    assert text.endswith("# EOF\n")
+
+    aggregator.reset()
+    assert aggregator.to_openmetrics() == "# EOF\n"
@@ -0,0 +1,49 @@
+# pylint: skip-file
+"""Unit tests for the compiled query parameters"""
+
+from datetime import date, time
+from urllib.parse import urlencode
+
+import pytest
+from pyventim.models import (  # pylint: disable=E0401
+    ComponentParameters,
+    ExplorationParameters,
+)
+
+EXPLORATION_PARAMS = ExplorationParameters(
+    search_term="Stage Theater im Hafen Hamburg",
+    categories=["Musical & Show|Musical", "Konzerte"],
+    city_ids=[7],
+    date_from=date(2024, 1, 1),
+    time_from=time(18, 0),
+    time_to=time(23, 30),
+    in_stock=True,
+)
+COMPONENT_PARAMS = ComponentParameters(
+    esid=473431, startdate=date(2024, 1, 1), ptype="tickets", cityname="Hamburg"
+)
+
+
+@pytest.mark.parametrize(
+    "params,page_key",
+    [(EXPLORATION_PARAMS, "page"), (COMPONENT_PARAMS, "pnum")],
+)
+@pytest.mark.parametrize("page", [1, 2, 17])
+def test_compiled_query_matches_model_dump(params, page_key, page):
+    expected = params.model_copy(update={page_key: page}).model_dump(
+        exclude_none=True
+    )
+    query = params.compile_query().page(page)
+
+    assert list(query) == list(expected)
+    assert urlencode(query, doseq=True) == urlencode(expected, doseq=True)
+
+
+def test_compiled_query_is_independent_of_the_model():
+    params = EXPLORATION_PARAMS.model_copy()
+    query = params.compile_query()
+    params.page = 5
+
+    assert query.page(2)["page"] == 2
+    assert query.page(2)["time_to"] == "23:30"
+    assert query.page(1) is not query.page(1)
@@ -0,0 +1,216 @@
+# pylint: skip-file
+"""Module to test the seatmap poller against a mocked transport"""
+
+import copy
+import pathlib
+import threading
+from datetime import datetime, timezone
+
+from pyventim import Eventim  # pylint: disable=E0401
+from pyventim.polling import SeatmapPoller  # pylint: disable=E0401
+from pyventim.seatmap import SeatmapParamsCache  # pylint: disable=E0401
+from tests.conftest import FakeTransport, create_response
+
+EVENT_HTML = (
+    pathlib.Path(__file__).parent.parent / "fixtures/html/event_page_seatmap.html"
+).read_bytes()
+EVENT_URL = (
+    "/event/disneys-der-koenig-der-loewen-stage-theater-im-hafen-hamburg-18500464/"
+)
+# expiryTime of the fixture in minutes since the epoch
+EXPIRY = 28611974 * 60
+
+SEATMAP = {
+    "key": "web_1_18500464_0_EVE_0",
+    "availabilityTimestamp": 1000,
+    "individualSeats": 2,
+    "dimension": [4096, 4096],
+    "seatSize": 59,
+    "blocks": [
+        {
+            "blockId": "b1",
+            "name": "Parkett",
+            "blockDescription": "Parkett",
+            "rows": [["r1", [["s1", 0, 10, 10], ["s2", 0, 70, 10]]]],
+        }
+    ],
+    "pcs": [["p1", "Kat. 1", "#f1075e", "#ffffff"]],
+}
+
+
+def sell_seat(seatmap):
+    seatmap = copy.deepcopy(seatmap)
+    seatmap["availabilityTimestamp"] += 1
+    seatmap["blocks"][0]["rows"][0][1].pop()
+    return seatmap
+
+
+class SeatmapTransport(FakeTransport):
+    def __init__(self):
+        super().__init__()
+        self.seatmap = SEATMAP
+        self.html_requests = 0
+        self.seatmap_requests = 0
+        self.reject = 0
+        self.expiry_time = 28611974
+
+    def respond(self, request, **kwargs):
+        if "/event/" in request.url:
+            self.html_requests += 1
+            return create_response(
+                request,
+                content=EVENT_HTML.replace(
+                    b"expiryTime=28611974", f"expiryTime={self.expiry_time}".encode()
+                ),
+            )
+
+        if self.reject:
+            self.reject -= 1
+            return create_response(request, 403, b"{}")
+
+        self.seatmap_requests += 1
+        return create_response(request, content=self.seatmap)
+
+
+class Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def create_poller(clock=None, **kwargs):
+    clock = clock or Clock(EXPIRY - 600)
+    transport = SeatmapTransport()
+    eventim = Eventim(seatmap_params_cache=SeatmapParamsCache(clock=clock))
+    eventim.rest_adapter.session.mount("https://", transport)
+    poller = SeatmapPoller(eventim, clock=clock, min_interval=10, **kwargs)
+    return poller, transport
+
+
+def test_signed_params_are_reused_until_expiry():
+    clock = Clock(EXPIRY - 600)
+    poller, transport = create_poller(clock)
+    poller.add_event(EVENT_URL)
+
+    for _ in range(3):
+        assert len(poller.poll_due()) == 1
+        clock.now = poller.get_next_poll(EVENT_URL)
+
+    assert transport.html_requests == 1
+    assert transport.seatmap_requests == 3
+
+    # Within the margin before expiry the event page is fetched again
+    clock.now = EXPIRY - 10
+    transport.expiry_time += 10
+    poller.poll_due()
+    assert transport.html_requests == 2
+    assert transport.seatmap_requests == 4
+
+
+def test_interval_adapts_to_changes():
+    clock = Clock(EXPIRY - 600)
+    results = []
+    poller, transport = create_poller(clock, callback=results.append)
+    poller.add_event(EVENT_URL, interval=40)
+
+    poller.poll_due()  # First seatmap
+    assert results[-1].diff is None
+    assert poller.get_next_poll(EVENT_URL) == clock.now + 40
+
+    clock.now += 40
+    poller.poll_due()  # Unchanged
+    assert not results[-1].changed
+    assert poller.get_next_poll(EVENT_URL) == clock.now + 80
+
+    clock.now += 80
+    transport.seatmap = sell_seat(SEATMAP)
+    poller.poll_due()  # Changed
+    assert results[-1].changed
+    assert results[-1].diff.became_unavailable == [("b1", "r1", "s2")]
+    assert poller.get_next_poll(EVENT_URL) == clock.now + 40
+
+
+def test_events_close_to_their_date_are_polled_more_often():
+    clock = Clock(EXPIRY - 600)
+    poller, _ = create_poller(clock, date_factor=0.01)
+    event_date = datetime.fromtimestamp(clock.now + 2000, tz=timezone.utc)
+    poller.add_event(EVENT_URL, interval=3600, event_date=event_date)
+
+    poller.poll_due()
+    assert poller.get_next_poll(EVENT_URL) == clock.now + 20
+
+    # Polling stops after the event
+    clock.now += 2001
+    poller.poll_due()
+    assert poller.get_next_poll(EVENT_URL) is None
+    assert len(poller) == 0
+
+
+def test_rejected_params_are_refetched():
+    clock = Clock(EXPIRY - 600)
+    errors = []
+    poller, transport = create_poller(
+        clock, error_callback=lambda x, y: errors.append(x)
+    )
+    poller.add_event(EVENT_URL)
+    poller.poll_due()
+
+    # Refreshed once within the poll
+    transport.reject = 1
+    clock.now = poller.get_next_poll(EVENT_URL)
+    assert len(poller.poll_due()) == 1
+    assert transport.html_requests == 2
+
+    # Rejected again after the refresh
+    transport.reject = 2
+    clock.now = poller.get_next_poll(EVENT_URL)
+    assert poller.poll_due() == []
+    assert errors == [EVENT_URL]
+    assert poller.get_next_poll(EVENT_URL) is not None
+
+
+def test_only_due_events_are_polled():
+    clock = Clock(EXPIRY - 600)
+    poller, _ = create_poller(clock)
+    poller.add_event(EVENT_URL)
+    assert len(poller.poll_due()) == 1
+    assert poller.poll_due() == []
+
+    poller.remove_event(EVENT_URL)
+    clock.now += 3600
+    assert poller.poll_due() == []
+    assert poller.tracker.get_snapshot(EVENT_URL) is None
+
+
+def test_event_removed_during_poll_keeps_no_snapshot():
+    results = []
+    poller, _ = create_poller(callback=results.append)
+    poller.add_event(EVENT_URL)
+    get_event_seatmap = poller.eventim.get_event_seatmap
+
+    def get_and_remove(*args, **kwargs):
+        seatmap = get_event_seatmap(*args, **kwargs)
+        poller.remove_event(EVENT_URL)
+        return seatmap
+
+    poller.eventim.get_event_seatmap = get_and_remove
+    assert poller.poll_due() == []
+    assert results == []
+    assert len(poller.tracker) == 0
+    assert len(poller) == 0
+
+
+def test_background_polling():
+    clock = Clock(EXPIRY - 600)
+    polled = threading.Event()
+    poller, transport = create_poller(
+        clock, callback=lambda x: polled.set(), max_workers=2
+    )
+
+    with poller:
+        poller.add_event(EVENT_URL)
+        assert polled.wait(5)
+
+    assert transport.seatmap_requests == 1
@@ -0,0 +1,87 @@
+# pylint: skip-file
+"""Unit tests for the typed exploration records"""
+
+from datetime import datetime, timedelta, timezone
+
+from pyventim.records import (  # pylint: disable=E0401
+    Attraction,
+    Location,
+    Product,
+    ProductGroup,
+)
+
+PRODUCT_GROUP = {
+    "productGroupId": "473431",
+    "name": "Disneys DER KÖNIG DER LÖWEN",
+    "description": "Das Musical",
+    "startDate": "2024-03-19T18:30:00+01:00",
+    "endDate": "2025-12-21T18:30:00+01:00",
+    "productCount": 678,
+    "link": "https://www.eventim.de/artist/disneys-der-koenig-der-loewen/",
+    "url": {
+        "path": "/artist/disneys-der-koenig-der-loewen/",
+        "domain": "https://www.eventim.de",
+    },
+    "currency": "EUR",
+    "rating": {"count": 5265, "average": 4.66},
+    "categories": [
+        {"name": "Musical & Show"},
+        {"name": "Musical", "parentCategory": {"name": "Musical & Show"}},
+    ],
+    "tags": ["TICKETDIRECT"],
+    "status": "Available",
+    "products": [
+        {
+            "productId": "18637122",
+            "name": "Disneys DER KÖNIG DER LÖWEN",
+            "type": "LiveEntertainment",
+            "status": "Available",
+            "typeAttributes": {
+                "liveEntertainment": {
+                    "startDate": "2024-12-31T17:00:00+01:00",
+                    "location": {"name": "Stage Theater im Hafen Hamburg"},
+                }
+            },
+            "hasRecommendation": False,
+        }
+    ],
+}
+
+
+def test_product_group_fields():
+    product_group = ProductGroup(PRODUCT_GROUP)
+    cet = timezone(timedelta(hours=1))
+
+    assert product_group.product_group_id == 473431
+    assert product_group.name == "Disneys DER KÖNIG DER LÖWEN"
+    assert product_group.start_date == datetime(2024, 3, 19, 18, 30, tzinfo=cet)
+    assert product_group.product_count == 678
+    assert product_group.rating_count == 5265
+    assert product_group.categories == ["Musical & Show", "Musical"]
+    assert product_group.image_url is None
+    assert product_group.to_dict() is PRODUCT_GROUP
+
+    product = product_group.products[0]
+    assert product_group.products[0] is product
+    assert isinstance(product, Product)
+    assert product.product_id == 18637122
+    assert product.start_date == datetime(2024, 12, 31, 17, 0, tzinfo=cet)
+    assert product.location["name"] == "Stage Theater im Hafen Hamburg"
+    assert product.has_recommendation is False
+    assert product.tags is None
+
+
+def test_records_use_slots():
+    attraction = Attraction({"attractionId": "662", "name": "The Rolling Stones"})
+    assert not hasattr(attraction, "__dict__")
+    assert attraction.attraction_id == 662
+    assert repr(attraction) == "Attraction('662', 'The Rolling Stones')"
+
+
+def test_records_compare_by_item():
+    location = Location({"locationId": "vg_3880", "city": "Hamburg"})
+    assert location == Location({"locationId": "vg_3880", "city": "Hamburg"})
+    assert location != Attraction({"locationId": "vg_3880", "city": "Hamburg"})
+    assert len({location, Location(dict(location.raw))}) == 1
+    assert location.location_id == "vg_3880"
+    assert location.city == "Hamburg"
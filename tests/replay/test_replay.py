@@ -0,0 +1,200 @@
+# pylint: skip-file
+"""Unit tests for the record/replay transports and the stand-in server"""
+
+import asyncio
+import pathlib
+from urllib.parse import urlparse, parse_qs
+
+import httpx
+import pytest
+
+from pyventim import Eventim, AsyncEventim  # pylint: disable=E0401
+from pyventim.exceptions import ReplayException, RestException  # pylint: disable=E0401
+from pyventim.replay import (  # pylint: disable=E0401
+    AsyncReplayTransport,
+    FixtureStore,
+    ReplayTransport,
+    StandInServer,
+    install_replay,
+)
+from tests.conftest import FakeTransport, create_response
+
+FIXTURES = pathlib.Path(__file__).parent.parent / "fixtures" / "html"
+EVENT_URL = (
+    "/event/disneys-der-koenig-der-loewen-stage-theater-im-hafen-hamburg-18500464/"
+)
+TOTAL_PAGES = 3
+
+
+def handle_live(request):
+    """Stands in for the live Eventim hosts while recording."""
+    if "/event/" in urlparse(request.url).path:
+        return create_response(
+            request,
+            content=(FIXTURES / "event_page_seatmap.html").read_bytes(),
+            headers={"content-type": "text/html; charset=utf-8"},
+        )
+
+    page = int(parse_qs(urlparse(request.url).query)["page"][0])
+    links = {"self": {"href": ""}}
+    if page < TOTAL_PAGES:
+        links["next"] = {"href": ""}
+
+    return create_response(
+        request,
+        content={
+            "productGroups": [{"productGroupId": f"{page}-{i}"} for i in range(2)],
+            "totalPages": TOTAL_PAGES,
+            "_links": links,
+        },
+        headers={"content-type": "application/json", "set-cookie": "session=secret"},
+    )
+
+
+def expected_ids():
+    return [f"{page}-{i}" for page in range(1, TOTAL_PAGES + 1) for i in range(2)]
+
+
+def record(path) -> FakeTransport:
+    live = FakeTransport(handle_live)
+    eventim = Eventim()
+    install_replay(eventim, FixtureStore(str(path)), mode="record")
+    eventim.rest_adapter.session.get_adapter("https://").inner = live
+
+    assert [
+        x["productGroupId"] for x in eventim.explore_product_groups(city_ids=[7])
+    ] == expected_ids()
+    assert eventim.get_event_seatmap_information(EVENT_URL) is not None
+    return live
+
+
+def test_record_and_replay(tmp_path):
+    live = record(tmp_path)
+    assert len(live.requests) == TOTAL_PAGES + 1
+
+    store = FixtureStore(str(tmp_path))
+    assert len(store) == TOTAL_PAGES + 1
+
+    eventim = Eventim()
+    install_replay(eventim, store)
+    assert [
+        x["productGroupId"] for x in eventim.explore_product_groups(city_ids=[7])
+    ] == expected_ids()
+    assert (
+        eventim.get_event_seatmap_information(EVENT_URL)["seatmapOptions"]["evId"]
+        == 18500464
+    )
+    assert len(live.requests) == TOTAL_PAGES + 1
+
+
+def test_stored_headers_and_dedupe(tmp_path):
+    store = FixtureStore(str(tmp_path))
+    url = "https://api.eventim.com/seatmap/api/SeatMapHandler?evId=1"
+    headers = {"Content-Type": "application/json", "Set-Cookie": "session=secret"}
+    store.add("GET", url, 200, "OK", headers, b"{}")
+    store.add("GET", url + "&cId=1", 200, "OK", headers, b"{}")
+
+    assert store.get("GET", url).headers == {"content-type": "application/json"}
+    assert len(list(tmp_path.glob("*.gz"))) == 1
+
+
+def test_replay_ignores_signed_params_and_host(tmp_path):
+    store = FixtureStore(str(tmp_path))
+    store.add(
+        "GET",
+        "https://api.eventim.com/seatmap/api/SeatMapHandler?evId=1&timestamp=1&signature=abc",
+        200,
+        "OK",
+        {},
+        b'{"key": "1"}',
+    )
+
+    fixture = store.get(
+        "GET", "http://127.0.0.1:8080/seatmap/api/SeatMapHandler?signature=xyz&evId=1"
+    )
+    assert fixture.content == b'{"key": "1"}'
+    assert store.get("GET", "/seatmap/api/SeatMapHandler?evId=2") is None
+
+
+def test_replay_unknown_request_raises(tmp_path):
+    eventim = Eventim()
+    install_replay(eventim, FixtureStore(str(tmp_path)))
+
+    with pytest.raises(ReplayException):
+        list(eventim.explore_product_groups(city_ids=[7]))
+
+
+def test_invalid_mode(tmp_path):
+    with pytest.raises(ValueError):
+        ReplayTransport(FixtureStore(str(tmp_path)), mode="live")
+
+
+def test_stand_in_server(tmp_path):
+    record(tmp_path)
+
+    with StandInServer(FixtureStore(str(tmp_path))) as server:
+        eventim = Eventim(**server.hostnames)
+        assert [
+            x["productGroupId"] for x in eventim.explore_product_groups(city_ids=[7])
+        ] == expected_ids()
+        assert (
+            eventim.get_event_seatmap_information(EVENT_URL)["seatmapOptions"]["evId"]
+            == 18500464
+        )
+
+        with pytest.raises(RestException):
+            list(eventim.explore_attractions(search_term="unknown"))
+
+    assert server.requests == TOTAL_PAGES + 2
+
+
+def test_stand_in_server_error_injection(tmp_path):
+    record(tmp_path)
+
+    with StandInServer(
+        FixtureStore(str(tmp_path)), error_rate=1.0, error_status=503, latency=0.01
+    ) as server:
+        eventim = Eventim(**server.hostnames)
+        with pytest.raises(RestException):
+            list(eventim.explore_product_groups(city_ids=[7]))
+
+    assert server.errors == 1
+
+
+def test_async_replay_transport(tmp_path):
+    record(tmp_path)
+    store = FixtureStore(str(tmp_path))
+
+    async def main():
+        client = httpx.AsyncClient(transport=AsyncReplayTransport(store))
+        async with AsyncEventim(client=client) as eventim:
+            result = [
+                x["productGroupId"]
+                async for x in eventim.explore_product_groups(city_ids=[7])
+            ]
+            information = await eventim.get_event_seatmap_information(EVENT_URL)
+        return result, information
+
+    result, information = asyncio.run(main())
+    assert result == expected_ids()
+    assert information["seatmapOptions"]["evId"] == 18500464
+
+
+def test_async_record(tmp_path):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"attractions": [], "_links": {}})
+
+    store = FixtureStore(str(tmp_path))
+    transport = AsyncReplayTransport(
+        store, mode="auto", inner=httpx.MockTransport(handler)
+    )
+
+    async def main():
+        async with httpx.AsyncClient(transport=transport) as client:
+            first = await client.get("https://api.eventim.com/test?a=1")
+            second = await client.get("https://api.eventim.com/test?a=1")
+        return first, second
+
+    first, second = asyncio.run(main())
+    assert first.json() == second.json() == {"attractions": [], "_links": {}}
+    assert len(store) == 1
@@ -0,0 +1,140 @@
+# pylint: skip-file
+"""Unit tests for the retry policy, the rate limiter and their use in the adapters"""
+
+import time
+
+import pytest
+import requests
+
+from pyventim import adapters, exceptions  # pylint: disable=E0401
+from pyventim.retry import (
+    RetryPolicy,
+    RateLimiter,
+    parse_retry_after,
+)  # pylint: disable=E0401
+from tests.conftest import FakeTransport, create_response
+
+
+class ScriptedTransport(FakeTransport):
+    """Answers with the scripted status codes or exceptions in order."""
+
+    def __init__(self, script, headers=None):
+        super().__init__()
+        self.script = list(script)
+        self.headers = headers or {}
+
+    def respond(self, request, **kwargs):
+        step = self.script.pop(0)
+        if isinstance(step, Exception):
+            raise step
+
+        return create_response(request, step, {"status": step}, self.headers)
+
+
+def create_adapter(transport, **kwargs):
+    adapter = adapters.RestAdapter(hostname="https://example.com", **kwargs)
+    adapter.session.mount("https://", transport)
+    return adapter
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("invalid") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_policy_delay_and_limits():
+    policy = RetryPolicy(
+        max_retries=2,
+        backoff_factor=1,
+        backoff_max=3,
+        jitter=False,
+        status_max_retries={429: 5},
+    )
+    assert [policy.get_delay(x) for x in range(4)] == [1, 2, 3, 3]
+    assert policy.get_delay(0, retry_after="10") == 10
+
+    assert policy.should_retry_status(503, 1) is True
+    assert policy.should_retry_status(503, 2) is False
+    assert policy.should_retry_status(429, 4) is True
+    assert policy.should_retry_status(404, 0) is False
+
+    assert policy.should_retry_exception(requests.exceptions.ConnectionError(), 0)
+    assert not policy.should_retry_exception(ValueError(), 0)
+
+
+def test_policy_jitter_bounds():
+    policy = RetryPolicy(backoff_factor=1, jitter=True)
+    for _ in range(50):
+        assert 2 <= policy.get_delay(2) <= 4
+
+
+def test_rate_limiter():
+    limiter = RateLimiter(rate=50, burst=2)
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+
+    # The first two requests pass immediately, the remaining four are spaced by 20ms
+    assert time.monotonic() - start >= 0.07
+
+
+def test_rate_limiter_invalid_rate():
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+
+
+def test_adapter_retries_status():
+    transport = ScriptedTransport([503, 503, 200])
+    adapter = create_adapter(
+        transport, retry_policy=RetryPolicy(backoff_factor=0.001, jitter=False)
+    )
+    result = adapter.get("endpoint")
+    assert result.json_data == {"status": 200}
+    assert len(transport.requests) == 3
+
+
+def test_adapter_gives_up():
+    transport = ScriptedTransport([503, 503])
+    adapter = create_adapter(
+        transport, retry_policy=RetryPolicy(max_retries=1, backoff_factor=0.001)
+    )
+    with pytest.raises(exceptions.RestException, match="503"):
+        adapter.get("endpoint")
+    assert len(transport.requests) == 2
+
+
+def test_adapter_retries_connection_errors():
+    transport = ScriptedTransport([requests.exceptions.ConnectionError(), 200])
+    adapter = create_adapter(transport, retry_policy=RetryPolicy(backoff_factor=0.001))
+    assert adapter.get("endpoint").status_code == 200
+
+
+def test_adapter_without_policy_fails_fast():
+    transport = ScriptedTransport([requests.exceptions.ConnectionError(), 200])
+    adapter = create_adapter(transport)
+    with pytest.raises(exceptions.RestException, match="Request failed"):
+        adapter.get("endpoint")
+    assert len(transport.requests) == 1
+
+
+def test_retry_after_pauses_shared_limiter():
+    transport = ScriptedTransport([429, 200], headers={"Retry-After": "0.05"})
+    limiter = RateLimiter(rate=1000)
+    adapter = create_adapter(
+        transport,
+        retry_policy=RetryPolicy(backoff_factor=0.001, jitter=False),
+        rate_limiter=limiter,
+    )
+    start = time.monotonic()
+    assert adapter.get("endpoint").status_code == 200
+    assert time.monotonic() - start >= 0.05
+
+
+def test_pause_delays_other_adapters():
+    limiter = RateLimiter(rate=1000)
+    limiter.pause(0.05)
+    start = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - start >= 0.04
@@ -0,0 +1,65 @@
+# pylint: skip-file
+"""Unit tests for the columnar seatmap"""
+
+import numpy as np
+
+import pyventim.utils
+from pyventim.seatmap import ColumnarSeatmap, parse_columnar_seatmap_from_api
+from tests.conftest import create_seatmap_data
+
+
+def test_roundtrip_matches_dict_parser():
+    data = create_seatmap_data()
+    seatmap = parse_columnar_seatmap_from_api(data)
+
+    assert isinstance(seatmap, ColumnarSeatmap)
+    assert len(seatmap) == 3 * 3 * 5
+    assert seatmap.to_dict() == pyventim.utils.parse_seathamp_data_from_api(data)
+
+
+def test_filters():
+    seatmap = ColumnarSeatmap.from_api(create_seatmap_data())
+
+    category = seatmap.select(seatmap.price_category_mask("p2"))
+    assert np.all(category.seat_price_category_index == 1)
+    assert len(category) == seatmap.seats_per_price_category()["p2"]
+
+    box = seatmap.select(seatmap.box_mask(0, 0, 200, 120))
+    assert sorted(box.get_seat_identities()) == [
+        ("b0", row, seat) for row in ("r1", "r2") for seat in ("s0", "s1", "s2", "s3")
+    ]
+
+    block = seatmap.select(seatmap.block_mask("b2"))
+    assert set(block.seat_block_index.tolist()) == {2}
+
+
+def test_get_seat():
+    seatmap = ColumnarSeatmap.from_api(create_seatmap_data())
+    assert seatmap.get_seat(0) == dict(
+        block_id="b0",
+        row_code="r1",
+        seat_code="s0",
+        seat_price_category_index=0,
+        seat_coordinate_x=0,
+        seat_coordinate_y=60,
+    )
+
+
+def test_empty_selection_keeps_rows():
+    seatmap = ColumnarSeatmap.from_api(create_seatmap_data())
+    empty = seatmap.select(np.zeros(len(seatmap), dtype=bool))
+    result = empty.to_dict()
+    assert len(result["blocks"]) == 3
+    assert all(
+        len(row["row_seats"]) == 0
+        for block in result["blocks"]
+        for row in block["block_rows"]
+    )
+
+
+def test_memory_is_compact():
+    seatmap = ColumnarSeatmap.from_api(
+        create_seatmap_data(blocks=20, rows=30, seats=30)
+    )
+    # Seven compact arrays instead of a dict per seat
+    assert seatmap.nbytes < len(seatmap) * 64
@@ -0,0 +1,86 @@
+# pylint: skip-file
+"""Unit tests for the seatmap diffing and tracking"""
+
+import copy
+
+import pyventim.utils
+from pyventim.seatmap import (
+    ColumnarSeatmap,
+    SeatmapSnapshot,
+    SeatmapTracker,
+    diff_seatmaps,
+)
+
+OLD = {
+    "key": "web_1_16825147_0_EVE_0",
+    "availabilityTimestamp": 1000,
+    "individualSeats": 3,
+    "dimension": [4096, 4096],
+    "seatSize": 59,
+    "blocks": [
+        {
+            "blockId": "b1",
+            "name": "Parkett links",
+            "blockDescription": "Parkett links",
+            "rows": [
+                ["r1", [["s1", 0, 10, 10], ["s2", 0, 70, 10]]],
+                ["r2", [["s1", 1, 10, 70]]],
+            ],
+        }
+    ],
+    "pcs": [["p1", "Kat. 1", "#f1075e", "#ffffff"], ["p2", "Kat. 2", "#000", "#fff"]],
+}
+
+
+def create_new():
+    new = copy.deepcopy(OLD)
+    new["availabilityTimestamp"] = 2000
+    rows = new["blocks"][0]["rows"]
+    rows[0][1] = [["s2", 1, 70, 10]]  # s1 sold, s2 moved to Kat. 2
+    rows[1][1].append(["s2", 1, 70, 70])  # released
+    return new
+
+
+def test_diff_raw_seatmaps():
+    diff = diff_seatmaps(OLD, create_new())
+    assert diff.became_unavailable == [("b1", "r1", "s1")]
+    assert diff.became_available == [("b1", "r2", "s2")]
+    assert diff.price_category_changes == [(("b1", "r1", "s2"), "p1", "p2")]
+    assert diff.old_timestamp == 1000
+    assert diff.new_timestamp == 2000
+    assert not diff.is_empty
+
+
+def test_diff_accepts_all_formats():
+    expected = diff_seatmaps(OLD, create_new()).to_dict()
+
+    parsed = diff_seatmaps(
+        pyventim.utils.parse_seathamp_data_from_api(OLD),
+        pyventim.utils.parse_seathamp_data_from_api(create_new()),
+    )
+    columnar = diff_seatmaps(
+        ColumnarSeatmap.from_api(OLD), ColumnarSeatmap.from_api(create_new())
+    )
+    assert parsed.to_dict() == expected
+    assert columnar.to_dict() == expected
+
+
+def test_snapshot():
+    snapshot = SeatmapSnapshot.from_seatmap(OLD)
+    assert len(snapshot) == 3
+    assert ("b1", "r2", "s1") in snapshot
+    assert ("b1", "r2", "s2") not in snapshot
+    assert diff_seatmaps(snapshot, OLD).is_empty
+
+
+def test_tracker():
+    tracker = SeatmapTracker()
+    assert tracker.update(OLD) is None
+
+    diff = tracker.update(create_new())
+    assert diff.became_unavailable == [("b1", "r1", "s1")]
+    assert len(tracker) == 1
+    assert tracker.get_snapshot("web_1_16825147_0_EVE_0").timestamp == 2000
+
+    tracker.remove("web_1_16825147_0_EVE_0")
+    assert len(tracker) == 0
@@ -0,0 +1,147 @@
+# pylint: skip-file
+"""Unit tests for the seatmap index"""
+
+import numpy as np
+import pytest
+
+from pyventim.seatmap import ColumnarSeatmap, SeatmapIndex
+
+# Row r1: s1-s3 adjacent, s4 sold, s5-s6 adjacent with s6 in another price category
+# Row r2: s1, s3 with s2 sold
+SEATMAP = {
+    "key": "web_1_18500464_0_EVE_0",
+    "availabilityTimestamp": 1000,
+    "individualSeats": 8,
+    "dimension": [1000, 1000],
+    "seatSize": 59,
+    "blocks": [
+        {
+            "blockId": "b1",
+            "name": "Parkett",
+            "blockDescription": "Parkett",
+            "rows": [
+                [
+                    "r1",
+                    [
+                        ["s2", 0, 70, 10],
+                        ["s1", 0, 10, 10],
+                        ["s3", 0, 130, 10],
+                        ["s5", 0, 250, 10],
+                        ["s6", 1, 310, 10],
+                    ],
+                ],
+                ["r2", [["s1", 1, 10, 70], ["s3", 1, 130, 70]]],
+            ],
+        },
+        {
+            "blockId": "b2",
+            "name": "Rang",
+            "blockDescription": "Rang",
+            "rows": [["r1", [["s1", 1, 600, 600], ["s2", 1, 660, 600]]]],
+        },
+    ],
+    "pcs": [["p1", "Kat. 1", "#f1075e", "#fff"], ["p2", "Kat. 2", "#000", "#fff"]],
+}
+
+
+@pytest.fixture
+def seatmap():
+    return ColumnarSeatmap.from_api(SEATMAP)
+
+
+def get_codes(seatmap, placements):
+    return [
+        [
+            (seatmap.row_codes[seatmap.seat_row_index[x]], str(seatmap.seat_code[x]))
+            for x in placement
+        ]
+        for placement in placements
+    ]
+
+
+def test_adjacent_seats(seatmap):
+    index = SeatmapIndex(seatmap)
+
+    assert get_codes(seatmap, index.find_adjacent_seats(3)) == [
+        [("r1", "s1"), ("r1", "s2"), ("r1", "s3")]
+    ]
+    assert get_codes(seatmap, index.find_adjacent_seats(2, block_id="b1")) == [
+        [("r1", "s1"), ("r1", "s2")],
+        [("r1", "s2"), ("r1", "s3")],
+        [("r1", "s5"), ("r1", "s6")],
+    ]
+    assert index.find_adjacent_seats(4).shape == (0, 4)
+    assert len(index.find_adjacent_seats(1)) == len(seatmap)
+
+    with pytest.raises(ValueError):
+        index.find_adjacent_seats(0)
+
+
+def test_adjacent_seats_in_price_category(seatmap):
+    index = SeatmapIndex(seatmap)
+
+    # s6 is in another price category and does not extend the run of s5
+    placements = index.find_adjacent_seats(2, price_category="p2")
+    assert get_codes(seatmap, placements) == [[("r1", "s1"), ("r1", "s2")]]
+    assert seatmap.block_ids[seatmap.seat_block_index[placements[0][0]]] == "b2"
+    assert len(index.find_adjacent_seats(2, price_category=0)) == 2
+
+
+def test_best_seats(seatmap):
+    index = SeatmapIndex(seatmap)
+
+    best = index.find_best_seats("p1", count=2, focus=(130, 10))
+    assert get_codes(seatmap, best) == [
+        [("r1", "s2"), ("r1", "s3")],
+        [("r1", "s1"), ("r1", "s2")],
+    ]
+    assert get_codes(seatmap, index.find_best_seats("p2", focus=(0, 0), limit=1)) == [
+        [("r2", "s1")]
+    ]
+
+
+@pytest.mark.parametrize("cell_size", [None, 50, 1000])
+def test_box_matches_mask(seatmap, cell_size):
+    index = SeatmapIndex(seatmap, cell_size=cell_size)
+    for box in [
+        (0, 0, 1000, 1000),
+        (10, 10, 130, 70),
+        (200, 0, 700, 600),
+        (900, 900, 950, 950),
+    ]:
+        expected = np.flatnonzero(seatmap.box_mask(*box))
+        assert np.array_equal(index.find_seats_in_box(*box), expected)
+
+    assert len(index.find_seats_in_box(500, 0, 100, 100)) == 0
+
+
+def test_box_outside_the_seatmap(seatmap):
+    index = SeatmapIndex(seatmap, cell_size=1)
+
+    # Bounds far outside the seatmap do not size the work
+    everything = index.find_seats_in_box(-1e12, -1e12, 1e12, 1e12)
+    assert np.array_equal(everything, np.arange(len(seatmap)))
+    assert len(index.find_seats_in_box(0, 1e9, 1000, 1e12)) == 0
+    assert len(index.find_seats_in_box(-1e12, -1e12, -1, -1)) == 0
+
+
+def test_polygon(seatmap):
+    index = SeatmapIndex(seatmap)
+
+    triangle = index.find_seats_in_polygon([(0, 0), (200, 0), (0, 200)])
+    assert sorted(get_codes(seatmap, [triangle])[0]) == [
+        ("r1", "s1"),
+        ("r1", "s2"),
+        ("r1", "s3"),
+        ("r2", "s1"),
+    ]
+
+    with pytest.raises(ValueError):
+        index.find_seats_in_polygon([(0, 0), (1, 1)])
+
+
+def test_empty_seatmap():
+    seatmap = ColumnarSeatmap.from_api(dict(SEATMAP, blocks=[]))
+    index = SeatmapIndex(seatmap)
+    assert index.find_adjacent_seats(2).shape == (0, 2)
+    assert len(index.find_seats_in_box(0, 0, 1000, 1000)) == 0
@@ -0,0 +1,57 @@
+# pylint: skip-file
+"""Unit tests for the signed seatmap params cache"""
+
+from pyventim.seatmap import SeatmapParamsCache
+
+PARAMS = {"evId": "1", "timestamp": "100", "expiryTime": "110", "signature": "abc"}
+
+
+class Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_params_expire_before_signature():
+    clock = Clock(100 * 60)
+    cache = SeatmapParamsCache(margin=30, clock=clock)
+    assert cache.set("event-1", PARAMS) == 110 * 60
+    assert cache.get("event-1") == PARAMS
+
+    clock.now = 110 * 60 - 30
+    assert cache.get("event-1") is None
+    assert len(cache) == 0
+
+
+def test_params_without_expiry_use_ttl():
+    clock = Clock(0)
+    cache = SeatmapParamsCache(ttl=60, margin=0, clock=clock)
+    cache.set("event-1", {"evId": "1"})
+    assert cache.get_expiry("event-1") == 60
+
+    clock.now = 59
+    assert cache.get("event-1") == {"evId": "1"}
+    clock.now = 60
+    assert cache.get("event-1") is None
+
+
+def test_returns_copies():
+    cache = SeatmapParamsCache(clock=Clock(100 * 60))
+    cache.set("event-1", PARAMS)
+    cache.get("event-1")["signature"] = "changed"
+    assert cache.get("event-1")["signature"] == "abc"
+
+
+def test_invalidate_and_eviction():
+    cache = SeatmapParamsCache(max_entries=2, clock=Clock(100 * 60))
+    for key in ("a", "b", "c"):
+        cache.set(key, PARAMS)
+    assert cache.get("a") is None
+    assert len(cache) == 2
+
+    cache.invalidate("b")
+    assert cache.get("b") is None
+    cache.clear()
+    assert len(cache) == 0
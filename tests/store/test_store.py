@@ -0,0 +1,154 @@
+# pylint: skip-file
+"""Unit tests for the local entity store"""
+
+import sqlite3
+from datetime import date
+
+import pytest
+from pyventim.records import ProductGroup  # pylint: disable=E0401
+from pyventim.store import EntityStore  # pylint: disable=E0401
+
+LOCATIONS = [
+    {
+        "locationId": "vg_3880",
+        "name": "Stage Theater im Hafen Hamburg",
+        "city": "Hamburg",
+        "link": "https://www.eventim.de/city/hamburg-7/venue/stage-theater-im-hafen-hamburg-3880/",
+    },
+    {
+        "locationId": "vg_1",
+        "name": "Uber Arena",
+        "city": "Berlin",
+        "link": "https://www.eventim.de/city/berlin-1/venue/uber-arena-1/",
+    },
+    {"locationId": "vg_2", "name": "Without link"},
+]
+PRODUCT_GROUPS = [
+    {
+        "productGroupId": "473431",
+        "name": "Disneys DER KÖNIG DER LÖWEN",
+        "startDate": "2024-03-19T18:30:00+01:00",
+        "categories": [
+            {"name": "Musical & Show"},
+            {"name": "Musical", "parentCategory": {"name": "Musical & Show"}},
+        ],
+    },
+    {
+        "productGroupId": "1",
+        "name": "Rock am Ring",
+        "startDate": "2024-06-07T12:00:00+02:00",
+        "categories": [{"name": "Festivals"}],
+    },
+]
+
+
+def create_event(event_id, start, city="hamburg-7"):
+    return {
+        "@type": "MusicEvent",
+        "name": "Disneys DER KÖNIG DER LÖWEN",
+        "startDate": start,
+        "location": {
+            "name": "Stage Theater im Hafen Hamburg",
+            "sameAs": f"https://www.eventim.de/city/{city}/venue/stage-theater-im-hafen-hamburg-3880/",
+        },
+        "url": f"https://www.eventim.de/event/disneys-der-koenig-der-loewen-stage-theater-im-hafen-hamburg-{event_id}/",
+    }
+
+
+@pytest.fixture
+def store():
+    with EntityStore() as store:
+        yield store
+
+
+def test_locations_by_city(store):
+    assert store.add_locations(LOCATIONS) == 3
+    assert [x["locationId"] for x in store.query("location", city_id=7)] == ["vg_3880"]
+    assert store.count("location") == 3
+    assert store.get("location", "vg_1")["city"] == "Berlin"
+    assert store.get("location", "missing") is None
+
+
+def test_product_groups_by_category_and_date(store):
+    store.add_product_groups(PRODUCT_GROUPS)
+
+    musicals = list(store.query("product_group", category="Musical"))
+    assert [x["productGroupId"] for x in musicals] == ["473431"]
+    assert store.count("product_group", category="Musical & Show") == 1
+    assert store.count("product_group", date_from=date(2024, 6, 1)) == 1
+    assert store.count("product_group", date_to=date(2024, 3, 19)) == 1
+
+
+def test_upsert_replaces_entities(store):
+    store.add_product_groups(PRODUCT_GROUPS)
+    changed = dict(PRODUCT_GROUPS[0], name="Changed", categories=[{"name": "Other"}])
+    store.add_product_groups([ProductGroup(changed)])
+
+    assert store.count("product_group") == 2
+    assert store.get("product_group", 473431)["name"] == "Changed"
+    assert store.count("product_group", category="Musical") == 0
+    assert store.count("product_group", category="Other") == 1
+
+
+def test_events_are_written_in_batches():
+    with EntityStore(batch_size=7) as store:
+        events = (
+            create_event(i, f"2024-05-{i % 28 + 1:02d}T18:30:00.000+02:00")
+            for i in range(100)
+        )
+        assert store.add_product_group_events(events, product_group_id=473431) == 100
+        # Events without id are skipped
+        assert store.add_product_group_events([{"name": "no url"}]) == 0
+
+        store.add_product_group_events([create_event(1000, "2024-07-01", "berlin-1")])
+
+        assert store.count("event", product_group_id=473431) == 100
+        assert store.count("event", city_id=1) == 1
+        may = list(
+            store.query(
+                "event", date_from=date(2024, 5, 1), date_to=date(2024, 5, 2), limit=3
+            )
+        )
+        assert [x["startDate"][:10] for x in may] == ["2024-05-01"] * 3
+        assert len(list(store.query("event", city_id=7))) == 100
+
+
+def test_calendar_events(store):
+    events = [
+        {"id": "16825147", "title": "a", "start": "2024-05-21T18:30:00"},
+        {"id": "16825148", "title": "b", "start": "2024-05-22T18:30:00"},
+    ]
+    store.add_calendar_events(events, product_group_id="473431")
+    result = list(store.query("calendar_event", date_from=date(2024, 5, 22)))
+    assert [x["id"] for x in result] == ["16825148"]
+
+
+def test_store_is_persistent_and_uses_wal(tmp_path):
+    path = str(tmp_path / "entities.db")
+    with EntityStore(path) as store:
+        store.add_locations(LOCATIONS)
+
+    with EntityStore(path) as store:
+        assert store.count("location", city_id=1) == 1
+
+    connection = sqlite3.connect(path)
+    assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    plan = connection.execute(
+        "EXPLAIN QUERY PLAN SELECT data FROM entities WHERE kind = ? AND city_id = ?",
+        ("location", 7),
+    ).fetchall()
+    assert "entities_city_id" in str(plan)
+    connection.close()
+
+
+def test_unknown_kind(store):
+    with pytest.raises(ValueError):
+        store.add("venue", [])
+
+
+def test_category_filter_uses_index(store):
+    plan = store._connection.execute(
+        "EXPLAIN QUERY PLAN SELECT entity_id FROM categories WHERE category = ? AND kind = ?",
+        ("Musical", "product_group"),
+    ).fetchall()
+    assert "categories_category" in str(plan)
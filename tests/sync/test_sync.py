@@ -0,0 +1,153 @@
+# pylint: skip-file
+"""Unit tests for the incremental sync engine against a mocked transport"""
+
+import json
+from urllib.parse import urlparse, parse_qs
+
+from pyventim import Eventim  # pylint: disable=E0401
+from pyventim.models import ExplorationParameters  # pylint: disable=E0401
+from pyventim.sync import SyncEngine, SyncState, hash_entity  # pylint: disable=E0401
+from tests.conftest import FakeTransport, create_response
+
+PAGE_SIZE = 2
+
+
+class CatalogTransport(FakeTransport):
+    """Serves product groups in pages and a calendar component from mutable lists."""
+
+    def __init__(self):
+        super().__init__()
+        self.product_groups = [
+            {"productGroupId": str(x), "name": f"Group {x}"} for x in range(6)
+        ]
+        self.events = [
+            {"id": str(x), "title": "Musical", "price": "ab 50"} for x in range(3)
+        ]
+        self.pages = []
+
+    def respond(self, request, **kwargs):
+        url = urlparse(request.url)
+        query = parse_qs(url.query)
+
+        if url.path.endswith("component"):
+            calendar = json.dumps({"calendar_content": {"result": self.events}})
+            return create_response(
+                request,
+                content=f'<html><script type="application/configuration">{calendar}</script></html>',
+            )
+
+        page = int(query["page"][0])
+        self.pages.append(page)
+        total_pages = -(-len(self.product_groups) // PAGE_SIZE)
+        links = {"self": {"href": ""}}
+        if page < total_pages:
+            links["next"] = {"href": ""}
+
+        start = (page - 1) * PAGE_SIZE
+        return create_response(
+            request,
+            content={
+                "productGroups": self.product_groups[start:][:PAGE_SIZE],
+                "totalPages": total_pages,
+                "_links": links,
+            },
+        )
+
+
+def create_engine(path=":memory:"):
+    transport = CatalogTransport()
+    eventim = Eventim()
+    eventim.rest_adapter.session.mount("https://", transport)
+    return SyncEngine(eventim, SyncState(path)), transport
+
+
+def changes(iterator):
+    return sorted((x.change, x.entity_id) for x in iterator)
+
+
+def test_sync_product_groups():
+    engine, transport = create_engine()
+    params = ExplorationParameters(city_ids=[7])
+
+    assert changes(engine.sync_product_groups(params)) == [
+        ("new", str(x)) for x in range(6)
+    ]
+    assert changes(engine.sync_product_groups(params)) == []
+
+    transport.product_groups[1]["name"] = "Renamed"
+    del transport.product_groups[4]
+    transport.product_groups.append({"productGroupId": "9", "name": "Group 9"})
+
+    result = list(engine.sync_product_groups(params))
+    assert changes(result) == [("changed", "1"), ("new", "9"), ("vanished", "4")]
+    assert [x.entity for x in result if x.change == "vanished"] == [None]
+    assert params.page == 1
+
+    (scope,) = {x.scope for x in result}
+    run = engine.state.get_last_run(scope)
+    assert run["complete"] == 1
+    assert (run["new"], run["changed"], run["vanished"], run["seen"]) == (1, 1, 1, 6)
+
+
+def test_early_stop():
+    engine, transport = create_engine()
+    params = ExplorationParameters(city_ids=[7])
+    list(engine.sync_product_groups(params))
+
+    transport.pages.clear()
+    transport.product_groups[0]["name"] = "Renamed"
+    del transport.product_groups[5]
+
+    result = changes(engine.sync_product_groups(params, early_stop=2))
+    # Stops on the second page, so the vanished product group is not reported
+    assert result == [("changed", "0")]
+    assert transport.pages == [1, 2]
+
+    result = changes(engine.sync_product_groups(params))
+    assert result == [("vanished", "5")]
+
+
+def test_interrupted_run_is_resumed():
+    engine, _ = create_engine()
+    params = ExplorationParameters(city_ids=[7])
+
+    iterator = engine.sync_product_groups(params)
+    first = [next(iterator), next(iterator)]
+    iterator.close()
+
+    remaining = changes(engine.sync_product_groups(params))
+    assert sorted(x.entity_id for x in first) + [x[1] for x in remaining] == [
+        str(x) for x in range(6)
+    ]
+
+
+def test_scopes_are_separate():
+    engine, _ = create_engine()
+    list(engine.sync_product_groups(ExplorationParameters(city_ids=[7])))
+    assert (
+        len(changes(engine.sync_product_groups(ExplorationParameters(city_ids=[9]))))
+        == 6
+    )
+
+
+def test_sync_events_and_ignored_fields(tmp_path):
+    path = str(tmp_path / "state.db")
+    engine, transport = create_engine(path)
+    engine.ignored_fields = ["price"]
+
+    assert changes(engine.sync_product_group_events(473431)) == [
+        ("new", "0"),
+        ("new", "1"),
+        ("new", "2"),
+    ]
+    engine.state.close()
+
+    engine.state = SyncState(path)
+    transport.events[0]["price"] = "ab 60"
+    transport.events[1]["title"] = "Changed"
+    assert changes(engine.sync_product_group_events(473431)) == [("changed", "1")]
+
+
+def test_hash_entity():
+    assert hash_entity({"a": 1, "b": 2}) == hash_entity({"b": 2, "a": 1})
+    assert hash_entity({"a": 1, "b": 2}, ["b"]) == hash_entity({"a": 1})
@@ -0,0 +1,164 @@
+# pylint: skip-file
+"""Parity tests between the script tag scanner and the lxml tree on saved html fixtures"""
+
+import pathlib
+
+import pytest
+
+import pyventim.utils
+
+FIXTURES = pathlib.Path(__file__).parent.parent / "fixtures" / "html"
+HTML_FIXTURES = sorted(FIXTURES.glob("*.html"))
+SCRIPT_TYPES = ["application/ld+json", "application/configuration", "text/javascript"]
+
+
+def read(path: pathlib.Path) -> str:
+    return path.read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("path", HTML_FIXTURES, ids=lambda x: x.name)
+@pytest.mark.parametrize("script_type", SCRIPT_TYPES)
+def test_scanner_matches_dom(path, script_type):
+    document = pyventim.utils.HtmlDocument(read(path))
+    assert document.get_script_texts(
+        script_type, fast_path=True
+    ) == document.get_script_texts(script_type, fast_path=False)
+
+
+@pytest.mark.parametrize("path", HTML_FIXTURES, ids=lambda x: x.name)
+def test_parsers_match_dom(path):
+    html = read(path)
+    fast = pyventim.utils.HtmlDocument(html)
+    dom = pyventim.utils.HtmlDocument(html, fast_path=False)
+
+    assert pyventim.utils.parse_list_from_component_html(
+        fast
+    ) == pyventim.utils.parse_list_from_component_html(dom)
+    assert pyventim.utils.parse_has_seatmap_from_event_html(
+        fast
+    ) == pyventim.utils.parse_has_seatmap_from_event_html(dom)
+    assert pyventim.utils.parse_pagination_from_component_html(
+        fast
+    ) == pyventim.utils.parse_pagination_from_component_html(dom)
+
+    if "calendar_content" in html:
+        assert pyventim.utils.parse_calendar_from_component_html(
+            fast
+        ) == pyventim.utils.parse_calendar_from_component_html(dom)
+
+    if pyventim.utils.parse_has_seatmap_from_event_html(dom):
+        assert pyventim.utils.parse_seatmap_configuration_from_event_html(
+            fast
+        ) == pyventim.utils.parse_seatmap_configuration_from_event_html(dom)
+
+
+def test_scanner_does_not_build_tree():
+    document = pyventim.utils.HtmlDocument(read(FIXTURES / "component_page.html"))
+
+    events = pyventim.utils.parse_list_from_component_html(document)
+    calendar = pyventim.utils.parse_calendar_from_component_html(document)
+    pagination = pyventim.utils.parse_pagination_from_component_html(document)
+
+    assert len(events) == 4
+    assert pagination == (1, 9)
+    assert len(calendar["calendar_content"]["result"]) == 2
+    assert document._tree is None
+
+
+def test_seatmap_fixtures():
+    with_seatmap = read(FIXTURES / "event_page_seatmap.html")
+    without_seatmap = read(FIXTURES / "event_page_without_seatmap.html")
+
+    assert pyventim.utils.parse_has_seatmap_from_event_html(with_seatmap) is True
+    assert pyventim.utils.parse_has_seatmap_from_event_html(without_seatmap) is False
+
+    configuration = pyventim.utils.parse_seatmap_configuration_from_event_html(
+        with_seatmap
+    )
+    assert configuration["seatmapOptions"]["evId"] == 18500464
+
+
+def test_quoted_attribute_with_closing_bracket():
+    html = """<html><body>
+    <script data-x="a>b" type="application/ld+json">{"name": "a"}</script>
+    </body></html>"""
+    assert pyventim.utils.parse_list_from_component_html(html) == [{"name": "a"}]
+
+
+def test_invalid_scanner_payload_falls_back_to_dom(monkeypatch):
+    html = read(FIXTURES / "component_page.html")
+    expected = pyventim.utils.parse_list_from_component_html(
+        pyventim.utils.HtmlDocument(html, fast_path=False)
+    )
+
+    monkeypatch.setattr(
+        pyventim.utils, "scan_script_texts", lambda html, script_type: ["{broken"]
+    )
+    assert pyventim.utils.parse_list_from_component_html(html) == expected
+
+
+@pytest.mark.parametrize(
+    "item, expected",
+    [
+        ('<li id="p" class="pagination pagination-pages-small">2 von 3</li>', (2, 3)),
+        ("<li class='pagination-pages-small' data-x='a>b'>\n 2 von 3\n</li>", (2, 3)),
+        ('<li class="pagination-pages-small"><!-- x -->2 von 3</li>', (2, 3)),
+        ('<li class="pagination-pages-small"></li>', None),
+        ('<li class="pagination">2 von 3</li>', None),
+    ],
+)
+def test_pagination_scanner_matches_dom(item, expected):
+    html = f"<html><body><ul>{item}</ul></body></html>"
+    dom = pyventim.utils.HtmlDocument(html, fast_path=False)
+
+    assert pyventim.utils.parse_pagination_from_component_html(html) == expected
+    assert pyventim.utils.parse_pagination_from_component_html(dom) == expected
+
+
+@pytest.mark.parametrize("path", HTML_FIXTURES, ids=lambda x: x.name)
+@pytest.mark.parametrize("fast_path", [True, False])
+def test_bytes_match_text(path, fast_path):
+    text = pyventim.utils.HtmlDocument(read(path), fast_path=fast_path)
+    raw = pyventim.utils.HtmlDocument(path.read_bytes(), fast_path=fast_path)
+
+    for script_type in SCRIPT_TYPES:
+        assert raw.get_script_texts(script_type) == text.get_script_texts(script_type)
+    assert pyventim.utils.parse_list_from_component_html(
+        raw
+    ) == pyventim.utils.parse_list_from_component_html(text)
+    assert pyventim.utils.parse_has_next_page_from_component_html(
+        raw
+    ) == pyventim.utils.parse_has_next_page_from_component_html(text)
+
+
+def test_bytes_with_declared_encoding():
+    html = (
+        "<html><head><title>Köln</title></head><body>"
+        '<script type="application/ld+json">{"name": "Köln"}</script>'
+        "</body></html>"
+    )
+    document = pyventim.utils.HtmlDocument(html.encode("latin-1"), encoding="latin-1")
+
+    assert pyventim.utils.parse_list_from_component_html(document) == [{"name": "Köln"}]
+    assert document.tree.findtext(".//title") == "Köln"
+
+
+def test_release_keeps_parsed_results():
+    document = pyventim.utils.HtmlDocument(
+        (FIXTURES / "component_page.html").read_bytes()
+    )
+    events = pyventim.utils.parse_list_from_component_html(document)
+    document.release()
+
+    assert document.html is None
+    assert pyventim.utils.parse_list_from_component_html(document) == events
+    with pytest.raises(ValueError):
+        pyventim.utils.parse_calendar_from_component_html(document)
+
+    # A built tree serves every script type after the release
+    document = pyventim.utils.HtmlDocument(
+        (FIXTURES / "component_page.html").read_bytes()
+    )
+    document.tree
+    document.release()
+    assert pyventim.utils.parse_calendar_from_component_html(document)
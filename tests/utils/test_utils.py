@@ -1,6 +1,8 @@
 # pylint: skip-file
 from typing import List, Dict
 
+import lxml.html
+
 # Module to test
 import pyventim.utils
 import pyventim.adapters
@@ -16,6 +18,17 @@ def test_parse_city_id_from_link():
     assert pyventim.utils.parse_city_id_from_link(city_url=url) == 7
 
 
+def test_parse_event_key_from_event_url():
+    key = "disneys-der-koenig-der-loewen-stage-theater-im-hafen-hamburg-18500464"
+    for url in [
+        f"https://www.eventim.de/event/{key}/",
+        f"/event/{key}/",
+        f"/event/{key}",
+        key,
+    ]:
+        assert pyventim.utils.parse_event_key_from_event_url(url) == key
+
+
 def test_parse_list_from_component_html():
     adapter = pyventim.adapters.HtmlAdapter()
     result = adapter.get(
@@ -112,6 +125,10 @@ def test_parse_seatmap_url_params_from_seatmap_information():
     for key in required_keys:
         assert key in list(params.keys())
 
+    expiry = pyventim.utils.parse_seatmap_expiry_from_seatmap_params(params)
+    assert expiry == 28611974 * 60
+    assert pyventim.utils.parse_seatmap_expiry_from_seatmap_params({}) is None
+
 
 def test_parse_has_seatmap_from_event_html():
     html_adapter = pyventim.adapters.HtmlAdapter()
@@ -254,3 +271,36 @@ def test_parse_seathamp_data_from_api():
     assert price_category["price_category_id"] == "p32914323"
     assert price_category["price_category_name"] == "Kat. 1 Premium"
     assert price_category["price_category_color"] == "#f1075e"
+
+
+COMPONENT_HTML = """<html><body>
+<script type="application/ld+json">{"@type": "MusicEvent", "name": "a"}</script>
+<script type="application/ld+json">{"@type": "MusicEvent", "name": "b"}</script>
+<ul><li class="pagination-pages-small">1 von 2</li></ul>
+</body></html>"""
+
+
+def test_html_document_parses_once(monkeypatch):
+    calls = []
+    fromstring = lxml.html.fromstring
+
+    def counting_fromstring(html):
+        calls.append(html)
+        return fromstring(html)
+
+    monkeypatch.setattr(lxml.html, "fromstring", counting_fromstring)
+
+    document = pyventim.utils.HtmlDocument(COMPONENT_HTML, fast_path=False)
+    events = pyventim.utils.parse_list_from_component_html(document)
+    has_next = pyventim.utils.parse_has_next_page_from_component_html(document)
+
+    assert [x["name"] for x in events] == ["a", "b"]
+    assert has_next is True
+    assert len(calls) == 1
+
+
+def test_html_document_matches_string_input():
+    document = pyventim.utils.HtmlDocument(COMPONENT_HTML)
+    assert pyventim.utils.parse_list_from_component_html(
+        document
+    ) == pyventim.utils.parse_list_from_component_html(COMPONENT_HTML)